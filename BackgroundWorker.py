@@ -0,0 +1,205 @@
+from threading import Thread, Event, Lock, current_thread
+from queue import Queue, Empty
+
+
+class Cancelled(Exception):
+    """
+    Raised inside a job at its next progress report after it was cancelled
+    """
+
+
+class Job:
+    """
+    Computation queued on a Background_Worker
+
+    Input:
+    -----------------------------
+    name: str
+        name shown with the progress
+    function: function
+        called as function(job) on the worker thread, reports its progress with job.progress and returns the result
+    done: function
+        called as done(result) on the Tk thread after the job finished
+    error: function
+        called as error(exception) on the Tk thread if the job raised (default: the error of the worker)
+    """
+    def __init__(self, name, function, done=None, error=None):
+        self.name = name
+        self.function = function
+        self.done = done
+        self.error = error
+        self.completed = 0
+        self.total = 0
+        self.stage = None
+        self.cancel_event = Event()
+
+    def progress(self, completed, total, stage=None):
+        """
+        Report the number of completed and total points, raises Cancelled if the job was cancelled
+
+        Input:
+        -----------------------------
+        completed: int
+            number of completed points
+        total: int
+            total number of points
+        stage: str
+            name of a preparatory step the points belong to (e.g. building an interpolation table), None for the
+            points of the job
+        """
+        self.completed = completed
+        self.total = total
+        self.stage = stage
+        if self.cancel_event.is_set():
+            raise Cancelled()
+
+    def cancel(self):
+        """
+        Stop the job at its next progress report (or before it starts)
+        """
+        self.cancel_event.set()
+
+    def cancelled(self):
+        """
+        True if the job was cancelled
+        """
+        return self.cancel_event.is_set()
+
+
+class Background_Worker:
+    """
+    Thread running queued jobs one after the other next to the Tk main loop
+
+    Jobs are computed on the worker thread and must not touch widgets: their inputs are read on the Tk thread when
+    they are submitted and their results are passed back to the Tk thread, which polls the results with after and
+    calls the done callbacks.  Functions can be queued for the Tk thread (e.g. message boxes reported during a job)
+    with call.
+
+    Input:
+    -----------------------------
+    root: widget
+        Tk widget used to schedule the polling
+    on_update: function
+        called as on_update(job, pending) on the Tk thread at every poll with the running job (None if idle) and
+        the number of queued jobs
+    error: function
+        called as error(job, exception) on the Tk thread for jobs without their own error callback
+    poll: int
+        polling interval in milliseconds
+    """
+    def __init__(self, root, on_update=None, error=None, poll=100):
+        self.root = root
+        self.on_update = on_update
+        self.error = error
+        self.poll_interval = poll
+        self.jobs = Queue()
+        self.results = Queue()
+        self.lock = Lock()
+        self.queued = []
+        self.running = None
+
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+        self.root.after(self.poll_interval, self.poll)
+
+    def submit(self, name, function, done=None, error=None):
+        """
+        Queue a job (see Job)
+
+        Output:
+        -----------------------------
+        job: Job
+            queued job
+        """
+        job = Job(name, function, done, error)
+        with self.lock:
+            self.queued.append(job)
+        self.jobs.put(job)
+
+        return job
+
+    def call(self, function, *args, **kwargs):
+        """
+        Queue a function call for the Tk thread, safe to use from the worker thread
+        """
+        self.results.put((None, 'call', (function, args, kwargs)))
+
+    def cancel(self):
+        """
+        Cancel the running job and all queued jobs
+        """
+        with self.lock:
+            jobs = self.queued + ([self.running] if self.running is not None else [])
+        for job in jobs:
+            job.cancel()
+
+    def progress(self, completed, total, stage=None):
+        """
+        Report the progress of the running job from the worker thread (e.g. from callbacks of a computation shared
+        by several jobs), see Job.progress, calls from other threads are ignored
+        """
+        if current_thread() is not self.thread:
+            return
+
+        with self.lock:
+            job = self.running
+        if job is not None:
+            job.progress(completed, total, stage)
+
+    def pending(self):
+        """
+        Number of queued jobs that did not start yet
+        """
+        with self.lock:
+            return len(self.queued)
+
+    def run(self):
+        """
+        Loop of the worker thread
+        """
+        while True:
+            job = self.jobs.get()
+            with self.lock:
+                self.queued.remove(job)
+                self.running = job
+
+            if job.cancelled():
+                self.results.put((job, 'cancelled', None))
+            else:
+                try:
+                    self.results.put((job, 'done', job.function(job)))
+                except Cancelled:
+                    self.results.put((job, 'cancelled', None))
+                except Exception as exception:
+                    self.results.put((job, 'error', exception))
+
+            with self.lock:
+                self.running = None
+
+    def poll(self):
+        """
+        Pass the results of the finished jobs to their callbacks on the Tk thread and report the progress
+        """
+        while True:
+            try:
+                job, status, result = self.results.get_nowait()
+            except Empty:
+                break
+
+            if status == 'call':
+                function, args, kwargs = result
+                function(*args, **kwargs)
+            elif status == 'done' and job.done is not None:
+                job.done(result)
+            elif status == 'error':
+                if job.error is not None:
+                    job.error(result)
+                elif self.error is not None:
+                    self.error(job, result)
+
+        if self.on_update is not None:
+            with self.lock:
+                running = self.running; pending = len(self.queued)
+            self.on_update(running, pending)
+
+        self.root.after(self.poll_interval, self.poll)
@@ -0,0 +1,155 @@
+from tkinter import Button, Checkbutton, Label, Frame, Toplevel
+from tkinter import messagebox
+from tkinter import IntVar
+
+from numpy import arange
+
+import matplotlib.pyplot as plt
+
+from SPBCore import sound_velocities, elastic_moduli, callaway_thermal
+from Widgets import EntryItem
+
+
+class Callaway_Window:
+    """
+    Window to compute the lattice thermal conductivity using the Callaway model
+
+    Input:
+    -----------------------------
+    app: MainApplication
+        main application (fonts, colours, entry checks and settings of the thermal plots)
+    """
+    def __init__(self, app):
+        """
+        Compute lattice thermal conductivity using the Callaway model
+        """
+        self.app = app
+        self.callaway_window = Toplevel()
+        self.callaway_window.configure(bg=self.app._from_rgb((241, 165, 193)))
+        self.callaway_window.geometry("1200x540")
+        self.callaway_window.iconbitmap('icon_spb.ico')
+
+        #Create Frames
+        input_para = Frame(self.callaway_window, height=238, width=795, bg=self.app._from_rgb((191, 112, 141)))
+        input_para.grid(row=0, column=0, columnspan=4, rowspan=6, pady=(10, 5))
+        label_input = Label(self.callaway_window, text='Input parameters')
+        label_input.grid(row=0, column=0, pady=(10, 5))
+        label_input['font'] = self.app.font_window
+
+        output_para = Frame(self.callaway_window, height=498, width=345, bg=self.app._from_rgb((175, 188, 205)))
+        output_para.grid(row=0, column=5, columnspan=2, rowspan=13, pady=(10, 5), padx=(20, 5))
+        label_output = Label(self.callaway_window, text='Output parameters')
+        label_output.grid(row=0, column=5, pady=(10, 5))
+        label_output['font'] = self.app.font_window
+        
+
+        # Create Entry widgets
+
+        self.unitcell_callaway = EntryItem(self.callaway_window, name='Unit cell volume / A3 (req.)', row=1)
+        self.unitcell_callaway.create_EntryItem(ipadx_label=56)
+        self.temperature_callaway = EntryItem(self.callaway_window, name='Temperature / K (req.)', row=1, column=3)
+        self.temperature_callaway.create_EntryItem(ipadx_label=28)
+        self.numberatoms_callaway = EntryItem(self.callaway_window, name='Number of atoms per unit cell (req.)', row=2)
+        self.numberatoms_callaway.create_EntryItem(ipadx_label=32)
+        self.density_callaway = EntryItem(self.callaway_window, name='Mass density / g cm-3 (req.)', row=2, column=3)
+        self.density_callaway.create_EntryItem(ipadx_label=11)
+        self.longitudinal_callaway = EntryItem(self.callaway_window, name='Longitudinal speed of sound / m s-1', row=3)
+        self.longitudinal_callaway.create_EntryItem(ipadx_label=32)
+        self.bulkmodulus_callaway = EntryItem(self.callaway_window, name='Bulk modulus / Pa', row=3, column=3)
+        self.bulkmodulus_callaway.create_EntryItem(ipadx_label=36)
+        self.transverse_callaway = EntryItem(self.callaway_window, name='Transverse speed of sound / m s-1', row=4)
+        self.transverse_callaway.create_EntryItem(ipadx_label=38)
+        self.shearmodulus_callaway = EntryItem(self.callaway_window, name='Shear modulus / Pa', row=4, column=3)
+        self.shearmodulus_callaway.create_EntryItem(ipadx_label=34)
+        self.gruneisen_callaway = EntryItem(self.callaway_window, name='Gruneisen Parameter (req.)', row=5)
+        self.gruneisen_callaway.create_EntryItem(ipadx_label=58)
+        self.grain_callaway = EntryItem(self.callaway_window, name='Grain size / nm', row=5, column=3)
+        self.grain_callaway.create_EntryItem(ipadx_label=48)
+
+        # Create buttons
+        calculate_btn = Button(self.callaway_window, text='Calculate Gruneisen', command=self.gruneisen_calculate)
+        calculate_btn.grid(row=1, column=5, columnspan=2, padx=10, pady=10, ipadx=30)
+        calculate_btn['font'] = self.app.font_window
+
+        plot_btn = Button(self.callaway_window, text='Plot', command=self.callaway_plot, bg=self.app._from_rgb((122, 138, 161)))
+        plot_btn.grid(row=6, column=5, columnspan=2, padx=10, pady=10, ipadx=60)
+        plot_btn['font'] = self.app.font_window
+
+        save_btn = Button(self.callaway_window, text='Save', command=self.callaway_save, bg=self.app._from_rgb((122, 138, 161)))
+        save_btn.grid(row=7, column=6, padx=10, pady=10, ipadx=40)
+        save_btn['font'] = self.app.font_window
+
+        btn_close = Button(self.callaway_window, text='Close Window', command=self.callaway_window.destroy)
+        btn_close.grid(row=11, column=5, padx=10, pady=10, ipadx=18)
+        btn_close['font'] = self.app.font_window
+
+        # Create checkbuttons
+        self.var_point_defect = IntVar()
+        check_point_defect = Checkbutton(self.callaway_window, text='Point Defects', variable=self.var_point_defect)
+        check_point_defect.grid(row=3, column=5, columnspan=2, pady=10)
+
+        self.var_grain_boundary = IntVar()
+        check_grain_boundary = Checkbutton(self.callaway_window, text='Grain Bounday', variable=self.var_grain_boundary)
+        check_grain_boundary.grid(row=4, column=5, columnspan=2, pady=10)
+
+        self.var_optical = IntVar()
+        check_optical = Checkbutton(self.callaway_window, text='Optical Phonon', variable=self.var_optical)
+        check_optical.grid(row=5, column=5, columnspan=2, pady=10)
+
+        # Create menus
+        self.save_menu_callaway = EntryItem(self.callaway_window, 'Save', row=7, column=5, pady=10, ipadx=30, options=self.app.save_options)
+        self.save_menu_callaway.create_MenuOption()
+        self.save_menu_callaway.font(self.app.font_window)
+
+
+    def gruneisen_calculate(self):
+        """
+        Create window to use various approaches to compute the Gruneisen parameter
+        """
+        pass
+
+
+    def callaway_plot(self):
+        """
+        Create a plot of the thermal conductivity in watts per meter and Kelvin as function of  temperature in Kelvin
+        """
+        UC = self.app.check_number(self.unitcell_callaway.var.get(), 'Unit cell', 10, 150000, True) * 1e-30
+        NA = self.app.check_number(self.numberatoms_callaway.var.get(), 'Number atoms', 0, 250, True)
+        dens = self.app.check_number(self.density_callaway.var.get(), 'Mass density', 2, 250, True) * 1000
+        temp = self.app.check_number(self.temperature_callaway.var.get(), 'Temperature', 0.1, 2000, True)
+        longV = self.app.check_number(self.longitudinal_callaway.var.get(), 'Longitudinal speed of sound', 10, 100000, False)
+        transV = self.app.check_number(self.transverse_callaway.var.get(), 'Transverse speed of sound', 10, 100000, False)
+        bulk = self.app.check_number(self.bulkmodulus_callaway.var.get(), 'Bulk modulus', 1, 1e16, False)
+        shear = self.app.check_number(self.shearmodulus_callaway.var.get(), 'Shear modulus', 1, 1e16, False)
+        gruneisen = self.app.check_number(self.gruneisen_callaway.var.get(), 'Gruneisen parameter', -11, 11, True)
+        grain = self.app.check_number(self.grain_callaway.var.get(), 'Grain size', 0, 1e6, False)
+
+        if bulk != [] and shear != []:
+            longV, transV = sound_velocities(dens, bulk, shear)
+            self.longitudinal_callaway.set_name(str(longV))
+            self.transverse_callaway.set_name(str(transV))
+            
+        elif transV != [] and longV != []:
+            bulk, shear = elastic_moduli(dens, longV, transV)
+            self.bulkmodulus_callaway.set_name(str(bulk))
+            self.shearmodulus_callaway.set_name(str(shear))
+
+        else:
+            messagebox.showerror(
+                message='Please include the bulk and shear modulus or longitudinal and transverse speed of sound'
+            )
+            return []
+
+        temperature_range = arange(1, 200, 1)
+        k_L = callaway_thermal(temperature_range, UC, NA, longV, transV)
+
+        plt.plot(temperature_range, k_L, c='r')
+        print(k_L)
+        plt.show()
+
+
+    def callaway_save(self):
+        """
+        Save the thermal conductivity as function of temperature
+        """
+        pass
@@ -0,0 +1,1451 @@
+from collections import namedtuple, OrderedDict
+
+from numpy import inf, asarray, array, ndim, isfinite, arange, linspace, empty, ones_like, sqrt, exp, expm1, log, log1p, tanh, pi, clip, maximum, where
+from numpy import broadcast_arrays, broadcast_to, concatenate, einsum, full, nan, unique, zeros, errstate
+from numpy.random import default_rng
+from numpy.polynomial.legendre import leggauss
+from scipy.special import gamma, erfcx, dawsn, expit, zeta
+from scipy.interpolate import PchipInterpolator, RectBivariateSpline
+
+
+# Number of terms of the accelerated alternating series
+N_TERMS = 25
+
+# Relative truncation error of the non-degenerate (Boltzmann) and degenerate (Sommerfeld) limits of the Fermi
+# integrals, the limits are used wherever their error is below the tolerance, and number of terms of the
+# Sommerfeld expansion
+ASYMPTOTIC_TOLERANCE = 1E-15
+N_SOMMERFELD = 10
+
+# Breakpoints of the Gauss-Legendre panels around the Fermi window in units of kT and nodes per panel
+WINDOW_OFFSETS = array([-48, -34, -24, -16, -10, -6, -3, 0, 3, 6, 10, 16, 24, 34, 48.])
+N_NODES = 16
+
+# Upper limit of integrals over the Bose window x^n exp(x) / (exp(x) - 1)^2, the integrand is below 1E-18 of the
+# integral for n <= 4 beyond
+BOSE_CUTOFF = 60.
+
+# Range and spacing of the eta tables of Moment_Table, the maximum relative error of the interpolated integrals
+# is below 3E-10 for all mechanisms depending on eta only
+TABLE_ETA_MIN = -20.
+TABLE_ETA_MAX = 60.
+TABLE_STEP = 0.005
+
+# Range and spacing of the eta grid of Moment_Inverse, covering Seebeck coefficients of 1 to 1500 micro volt per
+# Kelvin and reduced carrier concentrations down to 1E-21, the interpolated eta reproduces the ratio within 1E-7
+# before the Newton steps
+INVERSE_ETA_MIN = -50.
+INVERSE_ETA_MAX = 1000.
+INVERSE_STEP = 0.05
+
+# Grid of the ionized impurity table of Screening_Table in eta and the logarithm of the screening prefactor, the
+# prefactor grid is denser below ln(prefactor) = 15 where the screening changes from weak to strong, the maximum
+# relative error of the interpolated integrals is below 3E-8 (Screening_Table.max_error, 1E-8 with half the eta step
+# for four times the build time)
+IMP_TABLE_ETA_STEP = 0.1
+IMP_TABLE_PREFACTOR_MIN = 1E-4
+IMP_TABLE_PREFACTOR_MAX = 1E44
+IMP_TABLE_STEPS = [(15., 0.05), (inf, 0.25)]
+
+# Powers p and q of the reduced energy and the screening function, x^p / g^q, in the ionized impurity integrands
+BROOKS_HERRING_POWERS = {'tau': (3, 1), 'tau_E': (4, 1), 'tau_E2': (5, 1), 'tau2': (4.5, 2)}
+
+
+def cvz_weights(n_terms=N_TERMS):
+    """
+    Weights of the Cohen-Rodriguez Villegas-Zagier acceleration of alternating series
+
+    H. Cohen, F. Rodriguez Villegas, and D. Zagier, "Convergence acceleration of alternating series,"
+    Experimental Mathematics 9, 3-12, 2000.
+
+    Sum_k (-1)^k a_k is approximated by Sum_k w_k a_k with a relative error below 5.8^(-n_terms)
+    for any totally monotone sequence a_k.
+
+    Input:
+    -----------------------------
+    n_terms: int
+        number of terms of the series
+
+    Output:
+    -----------------------------
+    weights: ndarray (n_terms), dtype: float
+        weights of the accelerated sum
+    """
+    d = (3 + sqrt(8))**n_terms
+    d = (d + 1 / d) / 2
+    b = -1.
+    c = -d
+    weights = empty(n_terms)
+    for i in range(n_terms):
+        c = b - c
+        weights[i] = c
+        b = (i + n_terms) * (i - n_terms) * b / ((i + 0.5) * (i + 1))
+
+    return weights / d
+
+
+WEIGHTS = cvz_weights()
+
+# Fermi integrals entering the transport coefficients: tau_S = tau_E - eta * tau (Seebeck), tau (conductivity),
+# tau_E and tau_E2 (Lorenz number) and tau2 (Hall factor)
+Fermi_Moments = namedtuple('Fermi_Moments', ['tau_S', 'tau', 'tau_E2', 'tau_E', 'tau2'])
+
+
+def check_order(order):
+    """
+    Check if the order of the Fermi integral is supported (integer or half-integer above -1)
+
+    Input:
+    -----------------------------
+    order: float
+        order of the Fermi integral
+    """
+    if order <= -1 or (2 * order) % 1 != 0:
+        raise ValueError('Order {} of the Fermi integral is not an integer or half-integer above -1!'.format(order))
+
+
+def transport_orders(lam):
+    """
+    Orders of the Fermi integrals needed for the Seebeck coefficient, Lorenz number, mobility and carrier
+    concentration of a single parabolic band with energy exponent lam of the relaxation time
+
+    Input:
+    -----------------------------
+    lam: float
+        scattering exponent: acoustic deformation potential (0), polar optical phonon (1), ionized impurity (2)
+
+    Output:
+    -----------------------------
+    orders: lst
+        orders lam, lam + 1, lam + 2 and 2 * lam - 0.5
+    """
+    return [lam, lam + 1, lam + 2, 2 * lam - 0.5]
+
+
+def boltzmann_eta(order, tolerance=ASYMPTOTIC_TOLERANCE):
+    """
+    Reduced chemical potential below which the non-degenerate limit F_j = Gamma(j + 1) exp(eta) is accurate within
+    the relative tolerance, the first omitted term of the series is exp(eta) / 2^(j + 1)
+
+    Input:
+    -----------------------------
+    order: float
+        order of the Fermi integral
+    tolerance: float
+        relative truncation error (0 disables the limit)
+
+    Output:
+    -----------------------------
+    eta: float
+        limit of the non-degenerate regime
+    """
+    if tolerance <= 0:
+        return -inf
+
+    return log(tolerance * 2**(order + 1))
+
+
+def sommerfeld_coefficients(order, n_terms=N_SOMMERFELD):
+    """
+    Coefficients of the Sommerfeld expansion F_j = eta^(j + 1) / (j + 1) + Sum_n c_n eta^(j + 1 - 2n) with
+    c_n = 2 (1 - 2^(1 - 2n)) zeta(2n) j (j - 1) ... (j - 2n + 2)
+
+    Input:
+    -----------------------------
+    order: float
+        order of the Fermi integral
+    n_terms: int
+        number of terms of the expansion
+
+    Output:
+    -----------------------------
+    coefficients: ndarray (n_terms), dtype: float
+        coefficients c_1 to c_(n_terms)
+    """
+    coefficients = empty(n_terms)
+    falling = order
+    for n in range(1, n_terms + 1):
+        coefficients[n - 1] = 2 * (1 - 2.**(1 - 2 * n)) * zeta(2 * n) * falling
+        falling *= (order - 2 * n + 1) * (order - 2 * n)
+
+    return coefficients
+
+
+SOMMERFELD_LIMITS = {}
+
+
+def sommerfeld_eta(order, tolerance=ASYMPTOTIC_TOLERANCE):
+    """
+    Reduced chemical potential above which the Sommerfeld expansion with N_SOMMERFELD terms is accurate within the
+    relative tolerance, estimated from the first omitted term and the exponentially small remainder
+    Gamma(j + 1) exp(-eta) (found by bisection once for every order and tolerance)
+
+    Input:
+    -----------------------------
+    order: float
+        order of the Fermi integral
+    tolerance: float
+        relative truncation error (0 disables the expansion)
+
+    Output:
+    -----------------------------
+    eta: float
+        limit of the degenerate regime
+    """
+    if tolerance <= 0:
+        return inf
+
+    if (order, tolerance) not in SOMMERFELD_LIMITS:
+        next_term = abs(sommerfeld_coefficients(order, N_SOMMERFELD + 1)[-1])
+        error = lambda eta: (order + 1) * (next_term * eta**(-2 * N_SOMMERFELD - 2) + gamma(order + 1) * exp(-eta) / eta**(order + 1))
+
+        lower = 1.; upper = 1E4
+        while upper - lower > 1E-3:
+            middle = (lower + upper) / 2
+            if error(middle) < tolerance:
+                upper = middle
+            else:
+                lower = middle
+        SOMMERFELD_LIMITS[(order, tolerance)] = upper
+
+    return SOMMERFELD_LIMITS[(order, tolerance)]
+
+
+def fermi_integrals(eta, orders, tolerance=ASYMPTOTIC_TOLERANCE):
+    """
+    Fermi integrals F_j(eta) = integral of x^j / (1 + exp(x - eta)) from 0 to inf for many orders and reduced
+    chemical potentials in one call (same normalization as MainApplication.Fermi_integral)
+
+    eta < boltzmann_eta: non-degenerate limit F_j = Gamma(j + 1) exp(eta)
+    eta > sommerfeld_eta: Sommerfeld expansion F_j = eta^(j + 1) / (j + 1) + Sum_n c_n eta^(j + 1 - 2n) (sommerfeld_coefficients)
+    otherwise, eta <= 0: alternating series F_j = Gamma(j + 1) Sum_k (-1)^(k + 1) exp(k eta) / k^(j + 1)
+    eta > 0: the integral is split at x = eta and the Fermi function is expanded on both sides, which gives
+        F_j = eta^(j + 1) / (j + 1) + Sum_k (-1)^(k + 1) [exp(k eta) Gamma(j + 1, k eta) - exp(-k eta) int_0^(k eta) u^j exp(u) du] / k^(j + 1)
+        The scaled incomplete gamma functions start from erfcx and dawsn (half-integer orders) or 1 and 1 - exp(-k eta)
+        (integer orders) and are raised by upward recursion.
+
+    Both series are summed with the Cohen-Rodriguez Villegas-Zagier acceleration (N_TERMS terms).  The truncation
+    error is below 5.8^(-N_TERMS) (< 1E-19) and the results agree with scipy.integrate.quad within a relative
+    error of 1E-14 for -700 < eta < 1000.  Below eta = -700 the accuracy is limited by the underflow of exp(eta).
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    orders: lst
+        integer or half-integer orders above -1
+    tolerance: float
+        relative truncation error of the limits (0 evaluates the series everywhere)
+
+    Output:
+    -----------------------------
+    integrals: dic
+        Fermi integrals for every order with the same shape as eta
+    """
+    eta = asarray(eta, dtype=float)
+    orders = sorted(set(orders))
+    for order in orders:
+        check_order(order)
+
+    # NaN for eta = NaN (no branch below)
+    integrals = {order: full(eta.shape, nan) for order in orders}
+
+    boltzmann = eta < min(boltzmann_eta(order, tolerance) for order in orders)
+    if boltzmann.any():
+        for order in orders:
+            integrals[order][boltzmann] = gamma(order + 1) * exp(eta[boltzmann])
+
+    sommerfeld = eta > max(sommerfeld_eta(order, tolerance) for order in orders)
+    if sommerfeld.any():
+        eta_deg = eta[sommerfeld][..., None]
+        powers = eta_deg**(-2. * arange(1, N_SOMMERFELD + 1))
+        for order in orders:
+            integrals[order][sommerfeld] = eta_deg[:, 0]**(order + 1) * (1 / (order + 1) + powers @ sommerfeld_coefficients(order))
+
+    positive = (eta > 0) & ~sommerfeld
+    negative = (eta <= 0) & ~boltzmann
+    k_terms = arange(1, N_TERMS + 1)
+
+    eta_neg = eta[negative][..., None]
+    if eta_neg.size != 0:
+        series = exp(k_terms * eta_neg)
+        for order in orders:
+            integrals[order][negative] = gamma(order + 1) * (series / k_terms**(order + 1)) @ WEIGHTS
+
+    eta_pos = eta[positive][..., None]
+    if eta_pos.size != 0:
+        y = k_terms * eta_pos
+        for start in [-0.5, 0]:
+            orders_start = [order for order in orders if (order - start) % 1 == 0]
+            if len(orders_start) == 0:
+                continue
+
+            if start == -0.5:
+                gamma_upper = sqrt(pi) * erfcx(sqrt(y))
+                gamma_lower = 2 * dawsn(sqrt(y))
+            else:
+                gamma_upper = ones_like(y)
+                gamma_lower = -expm1(-y)
+
+            order = start
+            while True:
+                if order in orders_start:
+                    integrals[order][positive] = eta_pos[:, 0]**(order + 1) / (order + 1) + ((gamma_upper - gamma_lower) / k_terms**(order + 1)) @ WEIGHTS
+                if order >= orders_start[-1]:
+                    break
+                gamma_upper = (order + 1) * gamma_upper + y**(order + 1)
+                gamma_lower = y**(order + 1) - (order + 1) * gamma_lower
+                order += 1
+
+    if eta.ndim == 0:
+        return {order: integrals[order][()] for order in orders}
+
+    return integrals
+
+
+def power_law_moments(eta, lam):
+    """
+    Transport Fermi integrals of a single parabolic band with relaxation time proportional to E^(lam - 1/2),
+    written with the same normalization as the integrals of Fermi_POP and Fermi_IMP
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    lam: float
+        scattering exponent: acoustic deformation potential (0), polar optical phonon (1), ionized impurity (2)
+
+    Output:
+    -----------------------------
+    moments: Fermi_Moments
+        Fermi integrals with the same shape as eta
+    """
+    F = fermi_integrals(eta, transport_orders(lam))
+    tau = (1 + lam) * F[lam]
+    tau_E = (2 + lam) * F[lam + 1]
+
+    return Fermi_Moments(tau_E - eta * tau, tau, (3 + lam) * F[lam + 2], tau_E, (0.5 + 2 * lam) * F[2 * lam - 0.5])
+
+
+def fermi_integral_derivatives(eta, orders):
+    """
+    Derivatives dF_j/deta = j F_(j - 1)(eta) of the Fermi integrals, for j = 0 the derivative is 1 / (1 + exp(-eta))
+    and for j = -1/2 it is the integral of x^(-1/2) exp(x - eta) / (1 + exp(x - eta))^2 (window_moments)
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    orders: lst
+        integer or half-integer orders above -1
+
+    Output:
+    -----------------------------
+    derivatives: dic
+        derivatives for every order with the same shape as eta
+    """
+    eta = asarray(eta, dtype=float)
+    orders = sorted(set(orders))
+    for order in orders:
+        check_order(order)
+
+    F = fermi_integrals(eta, [order - 1 for order in orders if order > 0])
+    derivatives = {}
+    for order in orders:
+        if order > 0:
+            derivatives[order] = order * F[order - 1]
+        elif order == 0:
+            derivatives[order] = expit(eta)
+        else:
+            derivatives[order] = window_moments(eta, lambda x: {'F': x**-0.5})['F']
+
+    return derivatives
+
+
+def power_law_derivatives(eta, lam):
+    """
+    Derivatives of the transport Fermi integrals of power_law_moments with respect to eta
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    lam: float
+        scattering exponent: acoustic deformation potential (0), polar optical phonon (1), ionized impurity (2)
+
+    Output:
+    -----------------------------
+    derivatives: Fermi_Moments
+        derivatives with the same shape as eta
+    """
+    tau = (1 + lam) * fermi_integral(eta, lam)
+    dF = fermi_integral_derivatives(eta, transport_orders(lam))
+    dtau = (1 + lam) * dF[lam]
+    dtau_E = (2 + lam) * dF[lam + 1]
+
+    return Fermi_Moments(dtau_E - tau - eta * dtau, dtau, (3 + lam) * dF[lam + 2], dtau_E, (0.5 + 2 * lam) * dF[2 * lam - 0.5])
+
+
+def fermi_integral(eta, order):
+    """
+    Fermi integral F_j(eta) = integral of x^j / (1 + exp(x - eta)) from 0 to inf of a single order
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    order: float
+        integer or half-integer order above -1
+
+    Output:
+    -----------------------------
+    integral: float or ndarray (N), dtype: float
+        Fermi integral with the same shape as eta
+    """
+    return fermi_integrals(eta, [order])[order]
+
+
+def fermi_window(u):
+    """
+    Fermi window -df/du = exp(u) / (1 + exp(u))^2 written without overflow for large |u|
+
+    Input:
+    -----------------------------
+    u: float or ndarray (N), dtype: float
+        reduced energy relative to the chemical potential, x - eta
+
+    Output:
+    -----------------------------
+    window: float or ndarray (N), dtype: float
+        Fermi window
+    """
+    decay = exp(-abs(u))
+    return decay / (1 + decay)**2
+
+
+def fermi_function(u):
+    """
+    Fermi function 1 / (1 + exp(u)) written without overflow for large u
+    """
+    return expit(-u)
+
+
+def window_limits(eta):
+    """
+    Limits of adaptive quadratures (scipy.integrate.quad) over the Fermi window or the Fermi function, the window
+    is cut at 48 kT (WINDOW_OFFSETS) around max(eta, 0) like window_grid
+
+    Input:
+    -----------------------------
+    eta: float
+        reduced chemical potential
+
+    Output:
+    -----------------------------
+    lower: float
+        lower limit
+    upper: float
+        upper limit
+    points: lst
+        break point at the chemical potential if it lies between the limits
+    """
+    lower = max(eta + WINDOW_OFFSETS[0], 0.)
+    upper = max(eta, 0.) + WINDOW_OFFSETS[-1]
+    points = [eta] if lower < eta < upper else None
+    return lower, upper, points
+
+
+def bose_window(x):
+    """
+    Bose window exp(x) / (exp(x) - 1)^2 = 1 / (4 sinh(x / 2)^2) written without overflow for large x
+    """
+    return exp(-x) / expm1(-x)**2
+
+
+def window_grid(eta):
+    """
+    Shared quadrature grid for integrals of the form integral of G(x) exp(x - eta) / (1 + exp(x - eta))^2 from 0 to inf
+
+    The Fermi window decays as exp(-|x - eta|), so the integral is cut at 48 kT around max(eta, 0) and split into
+    panels (WINDOW_OFFSETS) that are narrow near the chemical potential.  Each panel uses an N_NODES point
+    Gauss-Legendre rule in s = sqrt(x), which removes the square-root behaviour of the scattering dependent
+    factors at the band edge.  The relative error is below 1E-13 for the POP and IMP integrands compared to
+    scipy.integrate.quad.
+
+    Input:
+    -----------------------------
+    eta: ndarray (N), dtype: float
+        reduced chemical potentials
+
+    Output:
+    -----------------------------
+    x: ndarray (N, M), dtype: float
+        reduced energies of the M nodes for every eta
+    weights: ndarray (N, M), dtype: float
+        quadrature weights including the Fermi window
+    """
+    nodes, node_weights = leggauss(N_NODES)
+    s_bounds = sqrt(clip(maximum(eta, 0)[:, None] + WINDOW_OFFSETS, 0, None))
+    half = (s_bounds[:, 1:] - s_bounds[:, :-1]) / 2
+    mid = where(half > 0, (s_bounds[:, 1:] + s_bounds[:, :-1]) / 2, 1.)
+
+    s = (mid[..., None] + half[..., None] * nodes).reshape(len(eta), -1)
+    x = s**2
+    weights = (half[..., None] * node_weights).reshape(len(eta), -1) * 2 * s * fermi_window(x - eta[:, None])
+
+    return x, weights
+
+
+def window_moments(eta, integrands, derivative=False):
+    """
+    Evaluate every Fermi integral integral of G(x) exp(x - eta) / (1 + exp(x - eta))^2 from 0 to inf for an array of
+    reduced chemical potentials in one pass on the shared grid of window_grid
+
+    The derivatives with respect to eta follow from the same grid, since the derivative of the Fermi window is the
+    window times tanh((x - eta) / 2).
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    integrands: function
+        returns a dictionary of the energy-dependent factors G(x) for an array of reduced energies x
+    derivative: bool
+        return the derivatives of the integrals with respect to eta
+
+    Output:
+    -----------------------------
+    moments: dic
+        Fermi integrals (or derivatives) for every integrand with the same shape as eta
+    """
+    eta = asarray(eta, dtype=float)
+    x, weights = window_grid(eta.reshape(-1))
+    if derivative:
+        weights = weights * tanh((x - eta.reshape(-1, 1)) / 2)
+
+    moments = {}
+    for name, values in integrands(x).items():
+        moments[name] = (values * weights).sum(axis=-1).reshape(eta.shape)
+        if eta.ndim == 0:
+            moments[name] = moments[name][()]
+
+    return moments
+
+
+def window_bundle(eta, integrands):
+    """
+    Evaluate the transport Fermi integrals tau, tau_E, tau_E2 and tau2 on the shared grid of window_grid, the
+    Fermi window is computed once for all of them
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    integrands: function
+        returns a dictionary with the keys tau, tau_E, tau_E2 and tau2 for an array of reduced energies x
+
+    Output:
+    -----------------------------
+    moments: Fermi_Moments
+        Fermi integrals with the same shape as eta
+    """
+    moments = window_moments(eta, integrands)
+
+    return Fermi_Moments(moments['tau_E'] - eta * moments['tau'], moments['tau'], moments['tau_E2'], moments['tau_E'], moments['tau2'])
+
+
+def window_bundle_derivatives(eta, integrands):
+    """
+    Derivatives of the transport Fermi integrals of window_bundle with respect to eta
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    integrands: function
+        returns a dictionary with the keys tau, tau_E, tau_E2 and tau2 for an array of reduced energies x
+
+    Output:
+    -----------------------------
+    derivatives: Fermi_Moments
+        derivatives with the same shape as eta
+    """
+    tau = window_moments(eta, integrands)['tau']
+    derivatives = window_moments(eta, integrands, derivative=True)
+
+    return Fermi_Moments(derivatives['tau_E'] - tau - eta * derivatives['tau'], derivatives['tau'], derivatives['tau_E2'], derivatives['tau_E'], derivatives['tau2'])
+
+
+def brooks_herring(y):
+    """
+    Screening function ln(1 + y) - y / (1 + y) of the Brooks-Herring approach, the series expansion is used for
+    small y to avoid cancellation
+
+    Input:
+    -----------------------------
+    y: ndarray (N), dtype: float
+        screening prefactor times reduced energy
+
+    Output:
+    -----------------------------
+    g: ndarray (N), dtype: float
+        screening function
+    """
+    y = asarray(y, dtype=float)
+    g = asarray(log1p(y) - y / (1 + y))
+    small = y < 1E-3
+    if small.any():
+        y = y[small]
+        g[small] = y**2 / 2 - 2 * y**3 / 3 + 3 * y**4 / 4 - 4 * y**5 / 5
+
+    return g
+
+
+def brooks_herring_integrands(x, prefactor):
+    """
+    Energy dependent factors of the Fermi integrals for ionized impurity scattering, the screening function is
+    evaluated once per node
+
+    Input:
+    -----------------------------
+    x: ndarray (N, M), dtype: float
+        reduced energies
+    prefactor: float or ndarray (N, 1), dtype: float
+        screening prefactor b of the Brooks-Herring approach, y = b * x
+
+    Output:
+    -----------------------------
+    integrands: dic
+        integrands for tau, tau_E, tau_E2 and tau2
+    """
+    g = brooks_herring(prefactor * x)
+    return {name: x**p / g**q for name, (p, q) in BROOKS_HERRING_POWERS.items()}
+
+
+def brooks_herring_moments(eta, prefactor):
+    """
+    Transport Fermi integrals for ionized impurity scattering on the shared grid of window_grid
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    prefactor: float or ndarray (N), dtype: float
+        screening prefactor of the Brooks-Herring approach
+
+    Output:
+    -----------------------------
+    moments: Fermi_Moments
+        Fermi integrals with the same shape as eta
+    """
+    eta, prefactor = broadcast_arrays(asarray(eta, dtype=float), asarray(prefactor, dtype=float))
+    if eta.ndim == 0:
+        return window_bundle(eta, lambda x: brooks_herring_integrands(x, prefactor))
+
+    return window_bundle(eta, lambda x: brooks_herring_integrands(x, prefactor.reshape(-1, 1)))
+
+
+def brooks_herring_derivatives(eta, prefactor):
+    """
+    Derivatives of the transport Fermi integrals for ionized impurity scattering with respect to eta
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    prefactor: float or ndarray (N), dtype: float
+        screening prefactor of the Brooks-Herring approach
+
+    Output:
+    -----------------------------
+    derivatives: Fermi_Moments
+        derivatives with the same shape as eta
+    """
+    eta, prefactor = broadcast_arrays(asarray(eta, dtype=float), asarray(prefactor, dtype=float))
+    if eta.ndim == 0:
+        return window_bundle_derivatives(eta, lambda x: brooks_herring_integrands(x, prefactor))
+
+    return window_bundle_derivatives(eta, lambda x: brooks_herring_integrands(x, prefactor.reshape(-1, 1)))
+
+
+def brooks_herring_prefactor_integrands(x, prefactor):
+    """
+    Derivatives of the ionized impurity integrands x^p / g^q with respect to the logarithm of the screening
+    prefactor, -q x^p y g'(y) / g^(q + 1) with y g'(y) = y^2 / (1 + y)^2
+
+    Input:
+    -----------------------------
+    x: ndarray (N, M), dtype: float
+        reduced energies
+    prefactor: float or ndarray (N, 1), dtype: float
+        screening prefactor b of the Brooks-Herring approach, y = b * x
+
+    Output:
+    -----------------------------
+    integrands: dic
+        derivatives of the integrands for tau, tau_E, tau_E2 and tau2
+    """
+    y = prefactor * x
+    g = brooks_herring(y)
+    dg = (y / (1 + y))**2
+    return {name: -q * x**p * dg / g**(q + 1) for name, (p, q) in BROOKS_HERRING_POWERS.items()}
+
+
+def brooks_herring_prefactor_derivatives(eta, prefactor):
+    """
+    Derivatives of the transport Fermi integrals for ionized impurity scattering with respect to the logarithm of
+    the screening prefactor (tau_S = tau_E - eta * tau is linear in the integrals)
+
+    Input:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        reduced chemical potential
+    prefactor: float or ndarray (N), dtype: float
+        screening prefactor of the Brooks-Herring approach
+
+    Output:
+    -----------------------------
+    derivatives: Fermi_Moments
+        derivatives with the same shape as eta
+    """
+    eta, prefactor = broadcast_arrays(asarray(eta, dtype=float), asarray(prefactor, dtype=float))
+    if eta.ndim == 0:
+        return window_bundle(eta, lambda x: brooks_herring_prefactor_integrands(x, prefactor))
+
+    return window_bundle(eta, lambda x: brooks_herring_prefactor_integrands(x, prefactor.reshape(-1, 1)))
+
+
+class Fermi_Cache:
+    """
+    Bounded least recently used cache of the Fermi integrals of the scattering mechanisms
+
+    The entries are keyed on the mechanism and on eta quantized to the tolerance, so solvers revisiting nearly
+    identical eta values reuse the stored Fermi_Moments.  The mechanism key has to contain every parameter of the
+    integrands (e.g. the screening prefactor for ionized impurities).  Since every Fermi_Moments bundle holds all
+    orders of a mechanism, the order is not part of the key.  Array valued eta bypasses the cache.
+
+    Input:
+    -----------------------------
+    maxsize: int
+        maximum number of stored entries
+    tolerance: float
+        quantization of eta, has to be well below the step of the finite differences of fsolve (~1E-8)
+    """
+    def __init__(self, maxsize=100000, tolerance=1E-12):
+        self.maxsize = maxsize
+        self.tolerance = tolerance
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, mechanism, eta, compute):
+        """
+        Get the Fermi integrals of a mechanism from the cache or compute and store them
+
+        Input:
+        -----------------------------
+        mechanism: hashable
+            key of the scattering mechanism
+        eta: float
+            reduced chemical potential
+        compute: function
+            computes the Fermi integrals for eta
+
+        Output:
+        -----------------------------
+        moments: Fermi_Moments
+            Fermi integrals
+        """
+        if ndim(eta) != 0 or not isfinite(eta):
+            return compute(eta)
+
+        key = (mechanism, round(float(eta) / self.tolerance))
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        moments = compute(eta)
+        self.entries[key] = moments
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+        return moments
+
+    def stats(self):
+        """
+        Hit and miss statistics of the cache
+
+        Output:
+        -----------------------------
+        stats: dic
+            hits, misses, hit rate, number of entries and maximum size
+        """
+        calls = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / calls if calls else 0.,
+                'size': len(self.entries), 'maxsize': self.maxsize}
+
+    def clear(self):
+        """
+        Remove all entries and reset the statistics
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class Moment_Table:
+    """
+    Interpolation table of the transport Fermi integrals of a mechanism depending only on eta
+
+    The table is built lazily on the first lookup: the integrals are computed once on an equidistant eta grid
+    and their logarithms are interpolated by monotone piecewise cubic Hermite polynomials (PCHIP).  Below
+    ln(tolerance / 2) the integrals follow the non-degenerate limit C exp(eta) within the tolerance (the first
+    omitted term of the Fermi window is 2 exp(2 eta)), the constants C are computed once.  Other values of eta
+    outside of the table are computed directly.
+
+    Input:
+    -----------------------------
+    compute: function
+        computes the Fermi_Moments for an array of eta
+    eta_min: float
+        lower end of the table
+    eta_max: float
+        upper end of the table
+    step: float
+        spacing of the grid
+    tolerance: float
+        relative truncation error of the non-degenerate limit (0 disables the limit)
+    """
+    def __init__(self, compute, eta_min=TABLE_ETA_MIN, eta_max=TABLE_ETA_MAX, step=TABLE_STEP, tolerance=ASYMPTOTIC_TOLERANCE):
+        self.compute = compute
+        self.eta_min = eta_min
+        self.eta_max = eta_max
+        self.step = step
+        self.eta_boltzmann = min(log(tolerance / 2), eta_min) if tolerance > 0 else -inf
+        self.splines = None
+        self.boltzmann = None
+
+    def build(self):
+        """
+        Compute the integrals on the grid and set up the interpolation
+        """
+        grid = linspace(self.eta_min, self.eta_max, int(round((self.eta_max - self.eta_min) / self.step)) + 1)
+        moments = self.compute(grid)
+        self.splines = Fermi_Moments(*[PchipInterpolator(grid, log(values)) for values in moments])
+
+        if self.eta_boltzmann > -inf:
+            eta = self.eta_boltzmann - 10
+            self.boltzmann = Fermi_Moments(*[values / exp(eta) for values in self.compute(eta)])
+
+    def boltzmann_moments(self, eta):
+        """
+        Non-degenerate limit of the integrals, tau_S = tau_E - eta * tau
+        """
+        C = self.boltzmann
+        return Fermi_Moments((C.tau_E - eta * C.tau) * exp(eta), C.tau * exp(eta), C.tau_E2 * exp(eta), C.tau_E * exp(eta), C.tau2 * exp(eta))
+
+    def max_error(self):
+        """
+        Maximum relative error of the interpolated integrals, measured at 21%, 50% and 79% of every grid interval
+        (the error of the estimated slopes vanishes in the middle and peaks close to 21% and 79%)
+
+        Output:
+        -----------------------------
+        error: float
+            maximum relative error of all integrals
+        """
+        if self.splines is None:
+            self.build()
+        eta = (arange(self.eta_min, self.eta_max, self.step)[:, None] + self.step * array([0.21, 0.5, 0.79])).reshape(-1)
+        return max(abs(exp(spline(eta)) / values - 1).max() for spline, values in zip(self.splines, self.compute(eta)))
+
+    def __call__(self, eta):
+        """
+        Look up the integrals
+
+        Input:
+        -----------------------------
+        eta: float or ndarray (N), dtype: float
+            reduced chemical potential
+
+        Output:
+        -----------------------------
+        moments: Fermi_Moments
+            Fermi integrals with the same shape as eta
+        """
+        if self.splines is None:
+            self.build()
+
+        eta = asarray(eta, dtype=float)
+        inside = (eta >= self.eta_min) & (eta <= self.eta_max)
+        if inside.all():
+            moments = [exp(spline(eta)) for spline in self.splines]
+        else:
+            boltzmann = eta < self.eta_boltzmann
+            outside = ~inside & ~boltzmann
+            moments = [empty(eta.shape) for spline in self.splines]
+            for values, spline in zip(moments, self.splines):
+                values[inside] = exp(spline(eta[inside]))
+            if boltzmann.any():
+                for values, limit in zip(moments, self.boltzmann_moments(eta[boltzmann])):
+                    values[boltzmann] = limit
+            if outside.any():
+                for values, direct in zip(moments, self.compute(eta[outside])):
+                    values[outside] = direct
+
+        if eta.ndim == 0:
+            return Fermi_Moments(*[values[()] for values in moments])
+
+        return Fermi_Moments(*moments)
+
+
+class Screening_Table:
+    """
+    Interpolation table of the Fermi integrals for ionized impurity scattering (Brooks-Herring approach)
+
+    The integrands depend on m_s, epsilon, T and n only through the screening prefactor b, so the logarithms of
+    the integrals are tabulated on a grid of eta and ln(b) and interpolated by bicubic splines.  The table is built
+    lazily on the first lookup (one to two seconds, reported to progress), values outside of it are computed directly.
+
+    Input:
+    -----------------------------
+    eta_min: float
+        lower end of the table in eta
+    eta_max: float
+        upper end of the table in eta
+    eta_step: float
+        spacing of the grid in eta
+    prefactor_min: float
+        lower end of the table in the screening prefactor
+    prefactor_max: float
+        upper end of the table in the screening prefactor
+    steps: lst
+        spacing of the grid in ln(prefactor) as pairs of upper limit and step
+    progress: function
+        called as progress(completed, total) with the number of computed prefactors while the table is built, an
+        exception raised by it (e.g. to cancel) stops the build
+    """
+    def __init__(self, eta_min=TABLE_ETA_MIN, eta_max=TABLE_ETA_MAX, eta_step=IMP_TABLE_ETA_STEP,
+                 prefactor_min=IMP_TABLE_PREFACTOR_MIN, prefactor_max=IMP_TABLE_PREFACTOR_MAX, steps=IMP_TABLE_STEPS,
+                 progress=None):
+        self.eta_min = eta_min
+        self.eta_max = eta_max
+        self.eta_step = eta_step
+        self.log_min = log(prefactor_min)
+        self.log_max = log(prefactor_max)
+        self.steps = steps
+        self.progress = progress
+        self.splines = None
+        self.derivative_splines = {}
+        self.eta_nodes = None
+
+    def build(self):
+        """
+        Compute the integrals on the grid and set up the interpolation, the nodes and the energy factors of the
+        quadrature are shared by all prefactors, the screening function is computed once for all eta <= 0 (their
+        Fermi windows start at the band edge and share the reduced energies)
+        """
+        eta = linspace(self.eta_min, self.eta_max, int(round((self.eta_max - self.eta_min) / self.eta_step)) + 1)
+        log_prefactor = []
+        start = self.log_min
+        for end, step in self.steps:
+            end = min(end, self.log_max)
+            if end > start:
+                log_prefactor.append(linspace(start, end, int(round((end - start) / step)) + 1)[:-1])
+                start = end
+        log_prefactor = concatenate(log_prefactor + [[self.log_max]])
+
+        x, weights = window_grid(eta)
+        edge = eta <= 0
+        energy_factors = {name: (x[edge]**p * weights[edge], x[~edge]**p * weights[~edge]) for name, (p, q) in BROOKS_HERRING_POWERS.items()}
+        shared = min(1, edge.sum())
+        x = concatenate([x[edge][:shared], x[~edge]])
+
+        values = empty((len(Fermi_Moments._fields), len(eta), len(log_prefactor)))
+        for j, u in enumerate(log_prefactor):
+            inverse = [None, 1 / brooks_herring(exp(u) * x)]
+            inverse.append(inverse[1]**2)
+            moments = {name: concatenate([einsum('ij,kj->i', energy_factors[name][0], inverse[q][:shared]), einsum('ij,ij->i', energy_factors[name][1], inverse[q][shared:])])
+                       for name, (p, q) in BROOKS_HERRING_POWERS.items()}
+            values[:, :, j] = log([moments['tau_E'] - eta * moments['tau'], moments['tau'], moments['tau_E2'], moments['tau_E'], moments['tau2']])
+            if self.progress is not None:
+                self.progress(j + 1, len(log_prefactor))
+
+        self.splines = Fermi_Moments(*[RectBivariateSpline(eta, log_prefactor, value) for value in values])
+        self.derivative_splines = {}
+        self.eta_nodes = eta
+
+    def max_error(self, n_test=20000):
+        """
+        Maximum relative error of the interpolated integrals at random points of the table (fixed seed)
+
+        Input:
+        -----------------------------
+        n_test: int
+            number of test points
+
+        Output:
+        -----------------------------
+        error: float
+            maximum relative error of all integrals
+        """
+        if self.splines is None:
+            self.build()
+        rng = default_rng(0)
+        eta = rng.uniform(self.eta_min, self.eta_max, n_test)
+        log_prefactor = rng.uniform(self.log_min, self.log_max, n_test)
+        return max(abs(exp(spline.ev(eta, log_prefactor)) / values - 1).max() for spline, values in zip(self.splines, brooks_herring_moments(eta, exp(log_prefactor))))
+
+    def __call__(self, eta, prefactor):
+        """
+        Look up the integrals
+
+        Input:
+        -----------------------------
+        eta: float or ndarray (N), dtype: float
+            reduced chemical potential
+        prefactor: float or ndarray (N), dtype: float
+            screening prefactor of the Brooks-Herring approach
+
+        Output:
+        -----------------------------
+        moments: Fermi_Moments
+            Fermi integrals with the same shape as eta and prefactor
+        """
+        if self.splines is None:
+            self.build()
+
+        eta, prefactor = broadcast_arrays(asarray(eta, dtype=float), asarray(prefactor, dtype=float))
+        log_prefactor = log(prefactor)
+        inside = (eta >= self.eta_min) & (eta <= self.eta_max) & (log_prefactor >= self.log_min) & (log_prefactor <= self.log_max)
+
+        moments = [empty(eta.shape) for spline in self.splines]
+        for values, spline in zip(moments, self.splines):
+            values[inside] = exp(spline.ev(eta[inside], log_prefactor[inside]))
+        if not inside.all():
+            for values, direct in zip(moments, brooks_herring_moments(eta[~inside], prefactor[~inside])):
+                values[~inside] = direct
+
+        if eta.ndim == 0:
+            return Fermi_Moments(*[values[()] for values in moments])
+
+        return Fermi_Moments(*moments)
+
+    def spline_derivatives(self, eta, prefactor, dx, dy, direct):
+        """
+        Derivatives of the integrals from the derivatives of the splines of their logarithms, direct integration
+        outside the table
+
+        Input:
+        -----------------------------
+        eta: float or ndarray (N), dtype: float
+            reduced chemical potential
+        prefactor: float or ndarray (N), dtype: float
+            screening prefactor of the Brooks-Herring approach
+        dx: int
+            order of the derivative with respect to eta
+        dy: int
+            order of the derivative with respect to ln(prefactor)
+        direct: function
+            computes the derivatives for arrays of eta and prefactor outside the table
+
+        Output:
+        -----------------------------
+        derivatives: Fermi_Moments
+            derivatives with the same shape as eta and prefactor
+        """
+        if self.splines is None:
+            self.build()
+
+        eta, prefactor = broadcast_arrays(asarray(eta, dtype=float), asarray(prefactor, dtype=float))
+        log_prefactor = log(prefactor)
+        inside = (eta >= self.eta_min) & (eta <= self.eta_max) & (log_prefactor >= self.log_min) & (log_prefactor <= self.log_max)
+
+        # the derivative splines are set up once, evaluating spline.ev with dx or dy is much slower
+        if (dx, dy) not in self.derivative_splines:
+            self.derivative_splines[(dx, dy)] = [spline.partial_derivative(dx, dy) for spline in self.splines]
+
+        derivatives = [empty(eta.shape) for spline in self.splines]
+        for values, spline, derivative in zip(derivatives, self.splines, self.derivative_splines[(dx, dy)]):
+            values[inside] = exp(spline.ev(eta[inside], log_prefactor[inside])) * derivative(eta[inside], log_prefactor[inside], grid=False)
+        if not inside.all():
+            for values, direct_values in zip(derivatives, direct(eta[~inside], prefactor[~inside])):
+                values[~inside] = direct_values
+
+        if eta.ndim == 0:
+            return Fermi_Moments(*[values[()] for values in derivatives])
+
+        return Fermi_Moments(*derivatives)
+
+    def derivatives(self, eta, prefactor):
+        """
+        Derivatives of the integrals with respect to eta
+        """
+        return self.spline_derivatives(eta, prefactor, 1, 0, brooks_herring_derivatives)
+
+    def prefactor_derivatives(self, eta, prefactor):
+        """
+        Derivatives of the integrals with respect to the logarithm of the screening prefactor
+        """
+        return self.spline_derivatives(eta, prefactor, 0, 1, brooks_herring_prefactor_derivatives)
+
+    def inverse(self, ratio, value, prefactor, newton=2):
+        """
+        Reduced chemical potentials for an array of values of reduced_seebeck or reduced_density with one screening
+        prefactor per row (e.g. the carrier concentration sweeps of a temperature map), see Screening_Rows.inverse
+
+        Input:
+        -----------------------------
+        ratio: function
+            reduced_seebeck or reduced_density
+        value: ndarray (M, N), dtype: float
+            values of the ratio
+        prefactor: ndarray (M), dtype: float
+            screening prefactors of the rows
+        newton: int
+            number of Newton steps polishing the interpolated eta
+
+        Output:
+        -----------------------------
+        eta: ndarray (M, N), dtype: float
+            reduced chemical potentials, NaN outside of the table
+        """
+        return Screening_Rows(self, prefactor).inverse(ratio, value, newton)
+
+
+class Screening_Rows:
+    """
+    Sections of a Screening_Table at one screening prefactor per row of a grid (e.g. the temperatures of a
+    temperature map)
+
+    Between the eta nodes of the table the bicubic splines are cubic polynomials in eta, so at a fixed prefactor they
+    are reproduced by cubic Hermite interpolation from their values and eta derivatives on the nodes.  These are
+    evaluated once on the grid of the nodes and the prefactors of the rows (evaluation on a grid is fast) and the
+    lookups of all points of the rows are array operations instead of scattered evaluations of the splines.  Points
+    outside of the table are computed directly.
+
+    Input:
+    -----------------------------
+    table: Screening_Table
+        interpolation table
+    prefactor: ndarray (M), dtype: float
+        screening prefactors of the rows
+    """
+    def __init__(self, table, prefactor):
+        if table.splines is None:
+            table.build()
+        if (1, 0) not in table.derivative_splines:
+            table.derivative_splines[(1, 0)] = [spline.partial_derivative(1, 0) for spline in table.splines]
+
+        self.table = table
+        self.prefactor = asarray(prefactor, dtype=float)
+        log_prefactor, self.columns = unique(log(self.prefactor), return_inverse=True)
+        self.inside_rows = ((log_prefactor >= table.log_min) & (log_prefactor <= table.log_max))[self.columns]
+        log_nodes = clip(log_prefactor, table.log_min, table.log_max)
+
+        self.step = (table.eta_max - table.eta_min) / (len(table.eta_nodes) - 1)
+        self.values = [spline(table.eta_nodes, log_nodes) for spline in table.splines]
+        self.slopes = [derivative(table.eta_nodes, log_nodes) for derivative in table.derivative_splines[(1, 0)]]
+
+    def rows(self, shape):
+        """
+        Reshape an array of the rows (M) to broadcast with the points of the rows (M, ...)
+        """
+        return lambda values: broadcast_to(values.reshape((-1,) + (1,) * (len(shape) - 1)), shape)
+
+    def locate(self, eta):
+        """
+        Points inside the table, their intervals of the eta nodes, positions in the intervals and columns of the node
+        values
+        """
+        eta = asarray(eta, dtype=float)
+        rows = self.rows(eta.shape)
+        inside = (eta >= self.table.eta_min) & (eta <= self.table.eta_max) & rows(self.inside_rows)
+        position = (where(inside, eta, self.table.eta_min) - self.table.eta_min) / self.step
+        i = clip(position.astype(int), 0, len(self.table.eta_nodes) - 2)
+
+        return inside, i, position - i, rows(self.columns)
+
+    def hermite(self, name, i, t, columns):
+        """
+        Logarithm of an integral and its derivative with respect to eta from the values on the nodes
+        """
+        index = Fermi_Moments._fields.index(name)
+        y_0 = self.values[index][i, columns]; y_1 = self.values[index][i + 1, columns]
+        m_0 = self.slopes[index][i, columns] * self.step; m_1 = self.slopes[index][i + 1, columns] * self.step
+        value = y_0 + t * (m_0 + t * (3 * (y_1 - y_0) - 2 * m_0 - m_1 + t * (2 * (y_0 - y_1) + m_0 + m_1)))
+        slope = m_0 + t * (6 * (y_1 - y_0) - 4 * m_0 - 2 * m_1 + t * (6 * (y_0 - y_1) + 3 * m_0 + 3 * m_1))
+
+        return value, slope / self.step
+
+    def lookup(self, eta, derivative, direct):
+        """
+        Integrals (or their derivatives with respect to eta) of the points of the rows, direct computation outside
+        """
+        eta = asarray(eta, dtype=float)
+        inside, i, t, columns = self.locate(eta)
+        i = i[inside]; t = t[inside]; columns = columns[inside]
+
+        moments = [empty(eta.shape) for name in Fermi_Moments._fields]
+        for values, name in zip(moments, Fermi_Moments._fields):
+            value, slope = self.hermite(name, i, t, columns)
+            values[inside] = exp(value) * slope if derivative else exp(value)
+        if not inside.all():
+            for values, direct_values in zip(moments, direct(eta[~inside], self.rows(eta.shape)(self.prefactor)[~inside])):
+                values[~inside] = direct_values
+
+        return Fermi_Moments(*moments)
+
+    def __call__(self, eta):
+        """
+        Look up the integrals
+
+        Input:
+        -----------------------------
+        eta: ndarray (M, ...), dtype: float
+            reduced chemical potentials of the rows
+
+        Output:
+        -----------------------------
+        moments: Fermi_Moments
+            Fermi integrals with the same shape as eta
+        """
+        return self.lookup(eta, False, self.table)
+
+    def derivatives(self, eta):
+        """
+        Derivatives of the integrals with respect to eta
+        """
+        return self.lookup(eta, True, self.table.derivatives)
+
+    def inverse(self, ratio, value, newton=2):
+        """
+        Reduced chemical potentials for an array of values of reduced_seebeck or reduced_density
+
+        The logarithm of the ratio and its derivative are known on the eta nodes of every row, the interval of every
+        value is found by bisection on the nodes of its row, eta is interpolated by a cubic Hermite polynomial in the
+        logarithm of the ratio and polished by Newton steps on the sections of the ratio.
+
+        Input:
+        -----------------------------
+        ratio: function
+            reduced_seebeck or reduced_density
+        value: ndarray (M, ...), dtype: float
+            values of the ratio
+        newton: int
+            number of Newton steps polishing the interpolated eta
+
+        Output:
+        -----------------------------
+        eta: ndarray (M, ...), dtype: float
+            reduced chemical potentials, NaN outside of the table
+        """
+        if ratio is reduced_seebeck:
+            terms = [(1, 'tau_S'), (-1, 'tau')]
+        elif ratio is reduced_density:
+            terms = [(2, 'tau'), (-1, 'tau2')]
+        else:
+            raise ValueError('No inverse of the ratio {}!'.format(ratio))
+
+        log_value = log(asarray(value, dtype=float))
+        columns = self.rows(log_value.shape)(self.columns)
+
+        # ratio on the nodes of the rows, in increasing order
+        log_ratio = sum(c * self.values[Fermi_Moments._fields.index(name)] for c, name in terms)
+        slope = sum(c * self.slopes[Fermi_Moments._fields.index(name)] for c, name in terms)
+        eta_nodes = self.table.eta_nodes
+        if log_ratio[0, 0] > log_ratio[-1, 0]:
+            eta_nodes = eta_nodes[::-1]; log_ratio = log_ratio[::-1]; slope = slope[::-1]
+
+        found = self.rows(log_value.shape)(self.inside_rows) & (log_value >= log_ratio[0, columns]) & (log_value <= log_ratio[-1, columns])
+        lower = zeros(log_value.shape, dtype=int); upper = full(log_value.shape, len(eta_nodes) - 1)
+        while (upper - lower > 1).any():
+            middle = (lower + upper) // 2
+            below = log_ratio[middle, columns] <= log_value
+            lower = where(below, middle, lower); upper = where(below, upper, middle)
+
+        # cubic Hermite interpolation of eta as function of the logarithm of the ratio
+        r_0 = log_ratio[lower, columns]; width = log_ratio[upper, columns] - r_0
+        t = where(width > 0, (log_value - r_0) / where(width > 0, width, 1), 0)
+        e_0 = eta_nodes[lower]; e_1 = eta_nodes[upper]
+        m_0 = width / slope[lower, columns]; m_1 = width / slope[upper, columns]
+        eta = e_0 + t * (m_0 + t * (3 * (e_1 - e_0) - 2 * m_0 - m_1 + t * (2 * (e_0 - e_1) + m_0 + m_1)))
+        eta = where(found, eta, nan)
+
+        valid = isfinite(eta)
+        eta_valid = eta[valid]; log_target = log_value[valid]; columns = columns[valid]
+        for j in range(newton):
+            i = clip(((eta_valid - self.table.eta_min) / self.step).astype(int), 0, len(self.table.eta_nodes) - 2)
+            t = (eta_valid - self.table.eta_min) / self.step - i
+            sections = [(c, self.hermite(name, i, t, columns)) for c, name in terms]
+            f = sum(c * value for c, (value, slope) in sections) - log_target
+            eta_valid = eta_valid - f / sum(c * slope for c, (value, slope) in sections)
+        eta[valid] = where((eta_valid >= self.table.eta_min) & (eta_valid <= self.table.eta_max), eta_valid, nan)
+
+        return eta
+
+
+def reduced_seebeck(moments):
+    """
+    Reduced Seebeck coefficient S e / k, decreasing with eta (NaN where the integrals underflow)
+    """
+    with errstate(divide='ignore', invalid='ignore'):
+        return moments.tau_S / moments.tau
+
+
+def reduced_density(moments):
+    """
+    Reduced carrier concentration n / (8 pi (2 m_s k T)^1.5 / (3 h^3)), increasing with eta (NaN where the
+    integrals underflow)
+    """
+    with errstate(divide='ignore', invalid='ignore', under='ignore'):
+        return moments.tau**2 / moments.tau2
+
+
+def log_ratio_derivative(ratio, moments, derivatives):
+    """
+    Derivative of the logarithm of reduced_seebeck or reduced_density from the derivatives of the integrals (with
+    respect to eta or the logarithm of the screening prefactor)
+
+    Input:
+    -----------------------------
+    ratio: function
+        reduced_seebeck or reduced_density
+    moments: Fermi_Moments
+        Fermi integrals
+    derivatives: Fermi_Moments
+        derivatives of the Fermi integrals
+
+    Output:
+    -----------------------------
+    derivative: float or ndarray (N), dtype: float
+        derivative of the logarithm of the ratio
+    """
+    with errstate(divide='ignore', invalid='ignore'):
+        if ratio is reduced_seebeck:
+            return derivatives.tau_S / moments.tau_S - derivatives.tau / moments.tau
+        elif ratio is reduced_density:
+            return 2 * derivatives.tau / moments.tau - derivatives.tau2 / moments.tau2
+
+    raise ValueError('No derivative of the ratio {}!'.format(ratio))
+
+
+def asymptotic_eta(ratio, value, lam):
+    """
+    Starting estimate of the reduced chemical potential from the non-degenerate (F_j = gamma(j + 1) exp(eta)) and
+    degenerate (Sommerfeld) limits of a power law, the non-degenerate limit is taken where it gives eta < 0
+
+    Input:
+    -----------------------------
+    ratio: function
+        reduced_seebeck or reduced_density
+    value: float or ndarray (N), dtype: float
+        values of the ratio
+    lam: float
+        scattering exponent: acoustic deformation potential (0), polar optical phonon (1), ionized impurity (2)
+
+    Output:
+    -----------------------------
+    eta: float or ndarray (N), dtype: float
+        estimated reduced chemical potentials
+    """
+    value = asarray(value, dtype=float)
+    if ratio is reduced_seebeck:
+        eta_nondegenerate = 2 + lam - value
+        eta_degenerate = (1 + lam) * pi**2 / (3 * value)
+    elif ratio is reduced_density:
+        eta_nondegenerate = log(value * (0.5 + 2 * lam) * gamma(2 * lam + 0.5) / ((1 + lam) * gamma(lam + 1))**2)
+        eta_degenerate = value**(2 / 3)
+    else:
+        raise ValueError('No asymptotic limits for the ratio {}!'.format(ratio))
+
+    eta = where(eta_nondegenerate < 0, eta_nondegenerate, eta_degenerate)
+    if eta.ndim == 0:
+        return eta[()]
+
+    return eta
+
+
+class Moment_Inverse:
+    """
+    Inverse of a positive and monotonic ratio of the Fermi integrals (reduced_seebeck or reduced_density) of a
+    mechanism depending only on eta
+
+    eta is interpolated as function of the logarithm of the ratio by PCHIP on a grid built on the first call.  Every
+    result can be polished by Newton steps on the logarithm of the ratio using the exact integrals, a single step
+    reduces the relative error of the ratio from about 1E-7 to the accuracy of the integrals.  Values of the ratio
+    outside of the grid are not extrapolated, their eta is NaN.
+
+    Input:
+    -----------------------------
+    moments: function
+        computes the Fermi_Moments for an array of eta
+    ratio: function
+        ratio of the Fermi integrals
+    eta_min: float
+        lower end of the grid
+    eta_max: float
+        upper end of the grid
+    step: float
+        spacing of the grid
+    """
+    def __init__(self, moments, ratio, eta_min=INVERSE_ETA_MIN, eta_max=INVERSE_ETA_MAX, step=INVERSE_STEP):
+        self.moments = moments
+        self.ratio = ratio
+        self.eta_min = eta_min
+        self.eta_max = eta_max
+        self.step = step
+        self.spline = None
+
+    def log_ratio(self, eta):
+        """
+        Logarithm of the ratio of the Fermi integrals
+        """
+        return log(self.ratio(self.moments(eta)))
+
+    def build(self):
+        """
+        Compute the ratio on the grid and set up the interpolation
+        """
+        eta = linspace(self.eta_min, self.eta_max, int(round((self.eta_max - self.eta_min) / self.step)) + 1)
+        log_ratio = self.log_ratio(eta)
+        if log_ratio[0] > log_ratio[-1]:
+            eta = eta[::-1]; log_ratio = log_ratio[::-1]
+
+        self.spline = PchipInterpolator(log_ratio, eta, extrapolate=False)
+        self.slope = self.spline.derivative()
+        self.bounds = (log_ratio[0], log_ratio[-1])
+
+    def __call__(self, value, newton=1):
+        """
+        Reduced chemical potentials for an array of values of the ratio
+
+        Input:
+        -----------------------------
+        value: float or ndarray (N), dtype: float
+            values of the ratio
+        newton: int
+            number of Newton steps polishing the interpolated eta
+
+        Output:
+        -----------------------------
+        eta: float or ndarray (N), dtype: float
+            reduced chemical potentials, NaN outside of the grid
+        """
+        if self.spline is None:
+            self.build()
+
+        with errstate(divide='ignore', invalid='ignore'):
+            log_target = log(asarray(value, dtype=float))
+        eta = self.spline(log_target)
+        for i in range(newton):
+            # the polished ratio of a value at an end of the grid may lie just outside of it
+            log_value = self.log_ratio(eta)
+            eta = eta + (log_target - log_value) * self.slope(clip(log_value, *self.bounds))
+
+        if eta.ndim == 0:
+            return eta[()]
+
+        return eta
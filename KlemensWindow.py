@@ -0,0 +1,330 @@
+from tkinter import Button, Label, Entry, Frame, Toplevel
+from tkinter import DISABLED
+from tkinter import messagebox
+from tkinter import StringVar
+
+from numpy import arange
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg, NavigationToolbar2Tk)
+from matplotlib.figure import Figure
+
+from SPBCore import sites_klemens, klemens_gamma, klemens_thermal, klemens_fraction
+from Widgets import EntryItem
+from ResultStore import Result_Table
+
+
+class Klemens_Window:
+    """
+    Window to compute the lattice thermal conductivity as function of dopant using the Klemens model
+    (Thermal menu)
+
+    Input:
+    -----------------------------
+    app: MainApplication
+        main application (fonts, colours, entry checks and settings of the thermal plots)
+    """
+    def __init__(self, app):
+        """
+        Compute lattice thermal conductivity as function of dopant using the Klemens model
+        """
+        self.app = app
+        self.klemens_window = Toplevel()
+        self.klemens_window.configure(bg=self.app._from_rgb((241, 165, 193)))
+        self.klemens_window.geometry("1300x540")
+        self.klemens_window.iconbitmap('icon_spb.ico')
+
+        #Create Frames
+        input_para = Frame(self.klemens_window, height=238, width=895, bg=self.app._from_rgb((191, 112, 141)))
+        input_para.grid(row=0, column=0, columnspan=4, rowspan=6, pady=(10, 5))
+        label_input = Label(self.klemens_window, text='Input parameters')
+        label_input.grid(row=0, column=0, pady=(10, 5))
+        label_input['font'] = self.app.font_window
+
+        output_para = Frame(self.klemens_window, height=498, width=345, bg=self.app._from_rgb((175, 188, 205)))
+        output_para.grid(row=0, column=5, columnspan=2, rowspan=13, pady=(10, 5), padx=(20, 5))
+        label_output = Label(self.klemens_window, text='Output parameters')
+        label_output.grid(row=0, column=5, pady=(10, 5), padx=(50, 10))
+        label_output['font'] = self.app.font_window
+
+        doped_para = Frame(self.klemens_window, height=238, width=895, bg=self.app._from_rgb((191, 112, 141)))
+        doped_para.grid(row=6, column=0, columnspan=4, rowspan=6, pady=(10, 5))
+        label_doped = Label(self.klemens_window, text='Site(s)')
+        label_doped.grid(row=6, column=0, pady=(10, 5), ipadx=30)
+        label_doped['font'] = self.app.font_window
+        label_doped2 = Label(self.klemens_window, text='Molar Mass')
+        label_doped2.grid(row=6, column=1, pady=(10, 5), ipadx=10)
+        label_doped2['font'] = self.app.font_window
+        label_doped3 = Label(self.klemens_window, text='Radius')
+        label_doped3.grid(row=6, column=2, pady=(10, 5), ipadx=30)
+        label_doped3['font'] = self.app.font_window
+        label_doped4 = Label(self.klemens_window, text='Fraction')
+        label_doped4.grid(row=6, column=3, pady=(10, 5), ipadx=20)
+        label_doped4['font'] = self.app.font_window
+        
+
+        # Create Entry widgets
+
+        self.unitcell_klemens = EntryItem(self.klemens_window, name='Unit cell volume / A3 (req.)', row=1)
+        self.unitcell_klemens.create_EntryItem(ipadx_label=56)
+        self.unitcell_klemens2 = EntryItem(self.klemens_window, name='Unit cell volume / A3 (doped)', row=1, column=3)
+        self.unitcell_klemens2.create_EntryItem(ipadx_label=53)
+        self.numberatoms_klemens = EntryItem(self.klemens_window, name='Number of atoms per unit cell (req.)', row=2)
+        self.numberatoms_klemens.create_EntryItem(ipadx_label=32)
+        self.numberatoms_klemens2 = EntryItem(self.klemens_window, name='Number of atoms per unit cell (doped)', row=2, column=3)
+        self.numberatoms_klemens2.create_EntryItem(ipadx_label=29)
+        self.longitudinal_klemens = EntryItem(self.klemens_window, name='Longitudinal speed of sound / m s-1 (req.)', row=3)
+        self.longitudinal_klemens.create_EntryItem(ipadx_label=16)
+        self.longitudinal_klemens2 = EntryItem(self.klemens_window, name='Longitudinal speed of sound / m s-1 (doped)', row=3, column=3)
+        self.longitudinal_klemens2.create_EntryItem(ipadx_label=13)
+        self.transverse_klemens = EntryItem(self.klemens_window, name='Transverse speed of sound / m s-1 (req.)', row=4)
+        self.transverse_klemens.create_EntryItem(ipadx_label=22)
+        self.transverse_klemens2 = EntryItem(self.klemens_window, name='Transverse speed of sound / m s-1 (doped)', row=4, column=3)
+        self.transverse_klemens2.create_EntryItem(ipadx_label=19)
+        self.thermal_klemens = EntryItem(self.klemens_window, name='Lattice thermal conducitivity / W m-1 K-1 (req.)', row=5)
+        self.thermal_klemens.create_EntryItem(ipadx_label=3)
+        self.thermal2_klemens = EntryItem(self.klemens_window, name='Lattice thermal conducitivity / W m-1 K-1 (doped)', row=5, column=3)
+        self.thermal2_klemens.create_EntryItem(ipadx_label=0)
+
+        self.var_site1 = StringVar(); self.var_site2 = StringVar(); self.var_site3 = StringVar(); self.var_site4 = StringVar(); self.var_site5 = StringVar()
+        self.var_molar1 = StringVar(); self.var_molar2 = StringVar(); self.var_molar3 = StringVar(); self.var_molar4 = StringVar(); self.var_molar5 = StringVar()
+        self.var_radius1 = StringVar(); self.var_radius2 = StringVar(); self.var_radius3 = StringVar(); self.var_radius4 = StringVar(); self.var_radius5 = StringVar() 
+        self.var_fraction1 = StringVar(); self.var_fraction2 = StringVar(); self.var_fraction3 = StringVar(); self.var_fraction4 = StringVar(); self.var_fraction5 = StringVar()
+ 
+        self.site1 = Entry(self.klemens_window, textvariable=self.var_site1); self.site1.grid(row=7, column=0, padx=10, pady=10, ipadx=10)
+        self.Molar1 = Entry(self.klemens_window, textvariable=self.var_molar1); self.Molar1.grid(row=7, column=1, padx=10, pady=10, ipadx=10)
+        self.radius1 = Entry(self.klemens_window, textvariable=self.var_radius1); self.radius1.grid(row=7, column=2, padx=10, pady=10, ipadx=10)
+        self.fraction1 = Entry(self.klemens_window, textvariable=self.var_fraction1); self.fraction1.grid(row=7, column=3, padx=10, pady=10, ipadx=10) 
+        self.site2 = Entry(self.klemens_window, textvariable=self.var_site2); self.site2.grid(row=8, column=0, padx=10, pady=10, ipadx=10)
+        self.Molar2 = Entry(self.klemens_window, textvariable=self.var_molar2); self.Molar2.grid(row=8, column=1, padx=10, pady=10, ipadx=10)
+        self.radius2 = Entry(self.klemens_window, textvariable=self.var_radius2); self.radius2.grid(row=8, column=2, padx=10, pady=10, ipadx=10)
+        self.fraction2 = Entry(self.klemens_window, textvariable=self.var_fraction2); self.fraction2.grid(row=8, column=3, padx=10, pady=10, ipadx=10)
+        self.site3 = Entry(self.klemens_window, textvariable=self.var_site3); self.site3.grid(row=9, column=0, padx=10, pady=10, ipadx=10)
+        self.Molar3 = Entry(self.klemens_window, textvariable=self.var_molar3); self.Molar3.grid(row=9, column=1, padx=10, pady=10, ipadx=10)
+        self.radius3 = Entry(self.klemens_window, textvariable=self.var_radius3); self.radius3.grid(row=9, column=2, padx=10, pady=10, ipadx=10)
+        self.fraction3 = Entry(self.klemens_window, textvariable=self.var_fraction3); self.fraction3.grid(row=9, column=3, padx=10, pady=10, ipadx=10)
+        self.site4 = Entry(self.klemens_window, textvariable=self.var_site4); self.site4.grid(row=10, column=0, padx=10, pady=10, ipadx=10)
+        self.Molar4 = Entry(self.klemens_window, textvariable=self.var_molar4); self.Molar4.grid(row=10, column=1, padx=10, pady=10, ipadx=10)
+        self.radius4 = Entry(self.klemens_window, textvariable=self.var_radius4); self.radius4.grid(row=10, column=2, padx=10, pady=10, ipadx=10)
+        self.fraction4 = Entry(self.klemens_window, textvariable=self.var_fraction4); self.fraction4.grid(row=10, column=3, padx=10, pady=10, ipadx=10)
+        self.site5 = Entry(self.klemens_window, textvariable=self.var_site5); self.site5.grid(row=11, column=0, padx=10, pady=10, ipadx=10)
+        self.Molar5 = Entry(self.klemens_window, textvariable=self.var_molar5); self.Molar5.grid(row=11, column=1, padx=10, pady=10, ipadx=10)
+        self.radius5 = Entry(self.klemens_window, textvariable=self.var_radius5); self.radius5.grid(row=11, column=2, padx=10, pady=10, ipadx=10)
+        self.fraction5 = Entry(self.klemens_window, textvariable=self.var_fraction5); self.fraction5.grid(row=11, column=3, padx=10, pady=10, ipadx=10)
+
+        self.var_label_def_thermal = StringVar()
+        self.label_def_thermal = Label(self.klemens_window, text='Lattice thermal conductivity / W m-1 K-1')
+        self.label_def_thermal.grid(row=1, column=5, columnspan=2, padx=10, pady=10)
+        self.label_def_thermal['font'] = self.app.font_window
+        self.entry_def_thermal = Entry(self.klemens_window, textvariable=self.var_label_def_thermal, state=DISABLED).grid(row=2, column=6, columnspan=2, padx=10, pady=10)
+
+        self.label_plot_def = Label(self.klemens_window, text='Plot as function of fraction')
+        self.label_plot_def.grid(row=4, column=5, columnspan=2, padx=10, pady=10)
+        self.label_plot_def['font'] = self.app.font_window
+
+
+        # Create buttons
+        calculate_btn = Button(self.klemens_window, text='Calculate', command=self.klemens_calculate)
+        calculate_btn.grid(row=2, column=5, padx=10, pady=10, ipadx=30)
+        calculate_btn['font'] = self.app.font_window
+
+        plot_btn = Button(self.klemens_window, text='Plot', command=self.klemens_plot, bg=self.app._from_rgb((122, 138, 161)))
+        plot_btn.grid(row=5, column=5, columnspan=2, padx=10, pady=10, ipadx=60)
+        plot_btn['font'] = self.app.font_window
+
+        save_btn = Button(self.klemens_window, text='Save', command=self.klemens_save, bg=self.app._from_rgb((122, 138, 161)))
+        save_btn.grid(row=6, column=6, padx=10, pady=10, ipadx=40)
+        save_btn['font'] = self.app.font_window
+
+        btn_close = Button(self.klemens_window, text='Close Window', command=self.klemens_window.destroy)
+        btn_close.grid(row=11, column=5, padx=10, pady=10, ipadx=18)
+        btn_close['font'] = self.app.font_window
+
+        # Create menus
+        self.save_menu_klemens = EntryItem(self.klemens_window, 'Save', row=6, column=5, pady=10, ipadx=30, options=self.app.save_options)
+        self.save_menu_klemens.create_MenuOption()
+        self.save_menu_klemens.font(self.app.font_window)
+
+
+    def compute_Gamma(self):
+        """
+        Compute Gamma parameter for Klemens model
+
+        Output:
+        -----------------
+        Gamma: float
+            Gamma parameter for Klemens model
+        """
+        site1 = self.app.check_number(self.var_site1.get(), 'Site 1', -1, 100, False)
+        site2 = self.app.check_number(self.var_site2.get(), 'Site 2', -1, 100, False)
+        site3 = self.app.check_number(self.var_site3.get(), 'Site 3', -1, 100, False)
+        site4 = self.app.check_number(self.var_site4.get(), 'Site 4', -1, 100, False)
+        site5 = self.app.check_number(self.var_site5.get(), 'Site 5', -1, 100, False)
+
+        Molar1 = self.app.check_number(self.var_molar1.get(), 'Molar 1', -1e-30, 1000, False)
+        Molar2 = self.app.check_number(self.var_molar2.get(), 'Molar 2', -1e-30, 1000, False)
+        Molar3 = self.app.check_number(self.var_molar3.get(), 'Molar 3', -1e-30, 1000, False)
+        Molar4 = self.app.check_number(self.var_molar4.get(), 'Molar 4', -1e-30, 1000, False)
+        Molar5 = self.app.check_number(self.var_molar5.get(), 'Molar 5', -1e-30, 1000, False)
+
+        radius1 = self.app.check_number(self.var_radius1.get(), 'radius 1', -0.1, 10000, False)
+        radius2 = self.app.check_number(self.var_radius2.get(), 'radius 2', -0.1, 10000, False)
+        radius3 = self.app.check_number(self.var_radius3.get(), 'radius 3', -0.1, 10000, False)
+        radius4 = self.app.check_number(self.var_radius4.get(), 'radius 4', -0.1, 10000, False)
+        radius5 = self.app.check_number(self.var_radius5.get(), 'radius 5', -0.1, 10000, False)
+
+        fraction1 = self.app.check_number(self.var_fraction1.get(), 'Fraction 1', -1e-10, 1.00000000000001, False)
+        fraction2 = self.app.check_number(self.var_fraction2.get(), 'Fraction 2', -1e-10, 1.00000000000001, False)
+        fraction3 = self.app.check_number(self.var_fraction3.get(), 'Fraction 3', -1e-10, 1.00000000000001, False)
+        fraction4 = self.app.check_number(self.var_fraction4.get(), 'Fraction 4', -1e-10, 1.00000000000001, False)
+        fraction5 = self.app.check_number(self.var_fraction5.get(), 'Fraction 5', -1e-10, 1.00000000000001, False)
+
+        sites = {}
+        sites = sites_klemens(sites, site1, Molar1, radius1, fraction1)
+        sites = sites_klemens(sites, site2, Molar2, radius2, fraction2)
+        sites = sites_klemens(sites, site3, Molar3, radius3, fraction3)
+        sites = sites_klemens(sites, site4, Molar4, radius4, fraction4)
+        sites = sites_klemens(sites, site5, Molar5, radius5, fraction5)
+
+        if len(sites.keys()) == 0:
+            messagebox.showerror(
+                message='Please include at least one site with two data points (Molar Mass, radius, and fraction)'
+            )
+            return []
+
+        Gamma = klemens_gamma(sites, report=lambda message: messagebox.showerror(message=message))
+
+        return Gamma, sites
+
+
+    def klemens_calculate(self):
+        """
+        Calculate the defect thermal conductivity and use the Matthiesen's rule to compute the total thermal conductivity
+        """
+        UC = self.app.check_number(self.unitcell_klemens.var.get(), 'Unit cell', 10, 150000, True) * 1e-30
+        NA = self.app.check_number(self.numberatoms_klemens.var.get(), 'Number atoms', 0, 250, True)
+        UC2 = self.app.check_number(self.unitcell_klemens2.var.get(), 'Unit cell (doped)', 10, 150000, False) * 1e-30
+        NA2 = self.app.check_number(self.numberatoms_klemens2.var.get(), 'Number atoms (doped)', 0, 250, False)
+        longV = self.app.check_number(self.longitudinal_klemens.var.get(), 'Longitudinal speed of sound', 10, 100000, True)
+        transV = self.app.check_number(self.transverse_klemens.var.get(), 'Transverse speed of sound', 10, 100000, True)
+        longV2 = self.app.check_number(self.longitudinal_klemens2.var.get(), 'Longitudinal speed of sound (doped)', 10, 100000, False)
+        transV2 = self.app.check_number(self.transverse_klemens2.var.get(), 'Transverse speed of sound (doped)', 10, 100000, False)
+        thermal = self.app.check_number(self.thermal_klemens.var.get(), 'Undoped thermal conductivity', 0, 1e4, True)
+        thermal2 = self.app.check_number(self.thermal2_klemens.var.get(), 'Doped thermal conductivity', 0, 1e4, False)
+
+        if UC2 == []:
+            UC2 = UC
+
+        if NA2 == []:
+            NA2 = NA
+
+        if longV2 == []:
+            longV2 = longV
+
+        if transV2 == []:
+            transV2 = transV
+
+        if thermal2 == []:
+            thermal2 = thermal
+
+        Gamma, sites = self.compute_Gamma()
+
+
+        k_def = klemens_thermal(Gamma, thermal, UC, NA, longV, transV)
+
+        self.var_label_def_thermal.set(str(k_def))
+
+
+    def klemens_plot(self):
+        """
+        Plot total thermal conductivity as function of fraction of the doping element
+        """
+        UC = self.app.check_number(self.unitcell_klemens.var.get(), 'Unit cell', 10, 150000, True) * 1e-30
+        NA = self.app.check_number(self.numberatoms_klemens.var.get(), 'Number atoms', 0, 250, True)
+        UC2 = self.app.check_number(self.unitcell_klemens2.var.get(), 'Unit cell (doped)', 10, 150000, False) * 1e-30
+        NA2 = self.app.check_number(self.numberatoms_klemens2.var.get(), 'Number atoms (doped)', 0, 250, False)
+        longV = self.app.check_number(self.longitudinal_klemens.var.get(), 'Longitudinal speed of sound', 10, 100000, True)
+        transV = self.app.check_number(self.transverse_klemens.var.get(), 'Transverse speed of sound', 10, 100000, True)
+        longV2 = self.app.check_number(self.longitudinal_klemens2.var.get(), 'Longitudinal speed of sound (doped)', 10, 100000, False)
+        transV2 = self.app.check_number(self.transverse_klemens2.var.get(), 'Transverse speed of sound (doped)', 10, 100000, False)
+        thermal = self.app.check_number(self.thermal_klemens.var.get(), 'Undoped thermal conductivity', 0, 1e4, True)
+        thermal2 = self.app.check_number(self.thermal2_klemens.var.get(), 'Doped thermal conductivity', 0, 1e4, False)
+
+
+        Gamma, sites = self.compute_Gamma()
+        
+        if UC2 == []:
+            UC2 = UC
+
+        if NA2 == []:
+            NA2 = NA
+
+        if longV2 == []:
+            longV2 = longV
+
+        if transV2 == []:
+            transV2 = transV
+
+        if thermal2 == []:
+            thermal2 = thermal
+
+        
+
+        frac_space = arange(0., 1., 0.001)
+        k_def = klemens_fraction(sites, frac_space, thermal, thermal2, UC, UC2, NA, NA2, longV, longV2, transV, transV2)
+
+        self.store_klemens(frac_space, k_def)
+
+        self.klemens_plot_window = Toplevel()
+        self.klemens_plot_window.configure(bg=self.app._from_rgb((241, 165, 193)))
+        self.klemens_plot_window.geometry("900x600")
+        self.klemens_plot_window.iconbitmap('icon_spb.ico')
+
+        plt.rcParams["font.family"] = self.app.initial_font_thermal.get()
+        plt.rcParams.update({'font.size': self.app.font_size_thermal.get() / 2.5})
+        
+        fig_klemens = Figure(figsize=(2.6, 1.6), dpi=300)
+        ax1 = fig_klemens.add_axes([0.2, 0.2, 0.75, 0.75])
+        ax1.plot(frac_space, k_def, c='k', label='Klemens')
+        ax1.set_xlabel('fraction of site 1')
+        ax1.set_ylabel('Thermal Conductivity / W m$^{-1}$ K$^{-1}$')    
+        ax1.set_ylim(0, max(k_def) * 1.1) 
+        ax1.set_xlim(0, 1)  
+        ax1.legend()
+
+        canvas_klemens = FigureCanvasTkAgg(fig_klemens, master=self.klemens_plot_window)
+        canvas_klemens.draw()
+        plot_widget_klemens = canvas_klemens.get_tk_widget()
+        plot_widget_klemens.grid(row=3, column=3, columnspan=15, rowspan=6)
+
+        toolbar_frame = Frame(self.klemens_plot_window) 
+        toolbar_frame.grid(row=10, column=2, columnspan=4) 
+        toolbar = NavigationToolbar2Tk(canvas_klemens, toolbar_frame)
+        toolbar.update()
+
+
+    def klemens_save(self):
+        """
+        Save total thermal conductivity as function of fraction of the doping element
+        """
+        self.app.save_result('klemens')
+
+
+    def store_klemens(self, fraction, k_def):
+        """
+        Keep the doped thermal conductivity as function of fraction based on the modified Klemens model in the results
+        of the application
+
+        Input:
+        --------------------
+        fraction: ndarray (N), dtype: float
+            Array of N fraction in range of 0 to 1
+        k_def: ndarray (N), dtype: float
+            Array of N doped thermal conductivities in watts per meter and Kelvin
+        """
+        self.app.results.put('klemens', Result_Table(
+            {
+                'fraction' : fraction,
+                'doped thermal conductivity' : k_def,
+            },
+            'fraction, Thermal Conductivity with doping / W m-1 K-1'))
@@ -0,0 +1,264 @@
+"""
+Experimental thermoelectric data of .csv files with the layout of Example_SPB.csv as typed columns
+
+The file has a header line and one measurement per line with compound, temperature in Kelvin, Seebeck coefficient in
+microvolt per Kelvin, Hall carrier concentration in per centimeter cube, Hall mobility in centimeter square per volt
+and second, total thermal conductivity in watts per meter and Kelvin and dielectric constant.  Fields may be quoted,
+missing trailing columns are empty.  The file is parsed in one pass; numbers are converted and checked column by
+column and all problems are reported per line (Measurement_Table.check) instead of one message per problem.
+"""
+import csv
+
+from numpy import asarray, array, zeros, nan, isfinite, ones, char, concatenate, flatnonzero
+
+
+PROPERTIES = ['Temperature', 'Seebeck Coefficient', 'Hall Carrier Concentration', 'Hall Mobility', 'Thermal Conductivity', 'Dielectric Constant']
+
+# allowed ranges of the properties (min_value < value < max_value, see Widgets.check_number)
+LIMITS = {
+    'Temperature' : (1, 10000),
+    'Seebeck Coefficient' : (0.1, 1500),
+    'Hall Carrier Concentration' : (1e8, 1e24),
+    'Hall Mobility' : (0.01, 100000),
+    'Thermal Conductivity' : (0, 10000),
+    'Dielectric Constant' : (1, 100000000),
+}
+
+# properties required for every measurement and additionally for ionized impurity scattering
+MANDATORY = ['Temperature', 'Seebeck Coefficient']
+MANDATORY_IMP = ['Hall Carrier Concentration', 'Dielectric Constant']
+
+
+class Measurement_Table:
+    """
+    Measurements as NumPy columns, one row per line of the .csv files
+
+    Input:
+    -----------------------------
+    compounds: ndarray (N), dtype: str
+        compound names
+    labels: ndarray (N), dtype: str
+        temperatures as written in the file (names of the temperature menu)
+    columns: dic
+        values of the PROPERTIES, {name: ndarray (N), dtype: float}, NaN if missing or not a number
+    lines: ndarray (N), dtype: int
+        line numbers in the file
+    file_index: ndarray (N), dtype: int
+        index of the file of every row in file_names
+    file_names: lst
+        names of the files
+    """
+    def __init__(self, compounds, labels, columns, lines, file_index, file_names):
+        self.compounds = compounds
+        self.labels = labels
+        self.columns = columns
+        self.lines = lines
+        self.file_index = file_index
+        self.file_names = file_names
+
+        # a later line with the same compound and temperature replaces the earlier one
+        self.index = dict(zip(zip(self.compounds.tolist(), self.labels.tolist()), range(len(self.compounds))))
+
+    def __len__(self):
+        return len(self.compounds)
+
+    def compound_names(self):
+        """
+        Compounds in the order of the files
+        """
+        return list(dict.fromkeys(self.compounds.tolist()))
+
+    def temperature_labels(self, compound):
+        """
+        Temperatures of a compound as written in the file
+        """
+        return list(dict.fromkeys(label for (cmpd, label) in self.index if cmpd == compound))
+
+    def row(self, compound, label):
+        """
+        Row of a compound and temperature (the last line if it occurs several times)
+        """
+        return self.index[(compound, label)]
+
+    def value(self, row, name):
+        """
+        Value of a property, an empty list if it is missing (see Widgets.check_number)
+        """
+        value = self.columns[name][row]
+        return float(value) if isfinite(value) else []
+
+    def text(self, row, name):
+        """
+        Value of a property for an entry widget, empty if it is missing
+        """
+        value = self.columns[name][row]
+        return '{}'.format(float(value)) if isfinite(value) else ''
+
+    def location(self, row):
+        """
+        File and line of a row for messages
+        """
+        return '{}, line {}'.format(self.file_names[self.file_index[row]], self.lines[row])
+
+    def check(self, scatter_value):
+        """
+        Check all measurements with vectorized range checks
+
+        Missing or invalid mandatory properties (MANDATORY, MANDATORY_IMP for IMP) and values outside of LIMITS
+        are problems; invalid optional entries are treated as missing.  Lines replaced by a later line with the
+        same compound and temperature are reported as well.
+
+        Input:
+        -----------------------------
+        scatter_value: str
+            scattering option: acoustic deformation potential (ADP), polar optical phonon (POP, POP2 [simpler approach]), ionized impurity (IMP, IMP2 [simpler approac])
+
+        Output:
+        -----------------------------
+        valid: ndarray (N), dtype: bool
+            true for the measurements that can be computed
+        problems: dic
+            messages of the invalid measurements, {row: [message]}
+        """
+        mandatory = MANDATORY + (MANDATORY_IMP if scatter_value == 'IMP' else [])
+        checks = []
+        for name in PROPERTIES:
+            values = self.columns[name]
+            min_value, max_value = LIMITS[name]
+            present = isfinite(values)
+            checks.append((present & ~((min_value < values) & (values < max_value)),
+                           '{} is below {} or above {}!'.format(name, min_value, max_value)))
+            if name in mandatory:
+                checks.append((~present, '{} is not a number or empty!'.format(name)))
+
+        replaced = ones(len(self), dtype=bool)
+        replaced[list(self.index.values())] = False
+        checks.append((replaced, 'replaced by a later line of the same compound and temperature'))
+
+        valid = ones(len(self), dtype=bool)
+        problems = {}
+        for failed, message in checks:
+            valid &= ~failed
+            for row in flatnonzero(failed).tolist():
+                problems.setdefault(row, []).append(message)
+
+        return valid, problems
+
+    def messages(self, problems):
+        """
+        Lines of a problem report, one per problem in the order of the files
+
+        Input:
+        -----------------------------
+        problems: dic
+            messages of the invalid measurements (check)
+
+        Output:
+        -----------------------------
+        lines: lst
+            messages with compound, temperature, file and line
+        """
+        return ['{} at {} K ({}): {}'.format(self.compounds[row], self.labels[row], self.location(row), problem)
+                for row in sorted(problems) for problem in problems[row]]
+
+    def merge(self, other):
+        """
+        Table with the rows of both tables (e.g. a second uploaded file)
+        """
+        return Measurement_Table(
+            concatenate([self.compounds, other.compounds]),
+            concatenate([self.labels, other.labels]),
+            {name: concatenate([self.columns[name], other.columns[name]]) for name in PROPERTIES},
+            concatenate([self.lines, other.lines]),
+            concatenate([self.file_index, other.file_index + len(self.file_names)]),
+            self.file_names + other.file_names)
+
+
+def parse_column(entries):
+    """
+    Convert a column of entries to floats, entry by entry only if the column contains entries that are not numbers
+
+    Input:
+    -----------------------------
+    entries: tuple
+        entries of the column (str)
+
+    Output:
+    -----------------------------
+    values: ndarray (N), dtype: float
+        values, NaN if missing or not a number
+    """
+    try:
+        values = array(entries, dtype=float)
+    except ValueError:
+        try:
+            values = array([entry or 'nan' for entry in entries], dtype=float)
+        except ValueError:
+            values = array([to_float(entry) for entry in entries], dtype=float)
+
+    values[~isfinite(values)] = nan
+
+    return values
+
+
+def to_float(entry):
+    """
+    Value of an entry, NaN if it is missing or not a number
+    """
+    try:
+        return float(entry)
+    except ValueError:
+        return nan
+
+
+def read_columns(fil, width):
+    """
+    Fields of the rows of a .csv file after the header line appended column by column (width columns, missing
+    trailing fields empty), empty rows are skipped, and the line number of every row
+    """
+    reader = csv.reader(fil)
+    next(reader, None)
+    columns = [[] for i in range(width)]
+    appends = [column.append for column in columns]
+    lines = []
+    start = reader.line_num + 1
+    for row in reader:
+        if any(row):
+            if len(row) != width:
+                row = row[:width] + [''] * (width - len(row))
+            for append, field in zip(appends, row):
+                append(field)
+            lines.append(start)
+        # a quoted field spans several lines
+        start = reader.line_num + 1
+
+    return columns, asarray(lines, dtype=int)
+
+
+def read_measurements(file_name):
+    """
+    Read the experimental thermoelectric data of a .csv file, empty lines are skipped
+
+    Input:
+    -----------------------------
+    file_name: str
+        name of the .csv file
+
+    Output:
+    -----------------------------
+    measurements: Measurement_Table
+        typed columns of the measurements
+
+    Raises OSError if the file cannot be opened and ValueError if it is not a readable .csv file.
+    """
+    width = 1 + len(PROPERTIES)
+    try:
+        with open(file_name, newline='') as fil:
+            fields, lines = read_columns(fil, width)
+    except csv.Error as error:
+        raise ValueError('{}: {}'.format(file_name, error))
+
+    columns = {name: parse_column(entries) for name, entries in zip(PROPERTIES, fields[1:])}
+
+    return Measurement_Table(char.strip(asarray(fields[0], dtype=str)), char.strip(asarray(fields[1], dtype=str)),
+                             columns, lines, zeros(len(lines), dtype=int), [file_name])
@@ -0,0 +1,285 @@
+from tkinter import OptionMenu, Button, Label, Frame, Toplevel
+from tkinter import DISABLED
+from tkinter import messagebox
+from tkinter import StringVar
+
+from numpy import arange
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg, NavigationToolbar2Tk)
+from matplotlib.figure import Figure
+
+from SPBCore import sound_velocities, elastic_moduli, debye_temperature
+from SPBCore import minimum_thermal_conductivity, minimum_thermal_conductivity_temperature
+from Widgets import EntryItem
+from ResultStore import Result_Table
+
+
+class Minimum_Thermal_Window:
+    """
+    Window to compute the minimum thermal conductivity using diverse models (Thermal menu)
+
+    Input:
+    -----------------------------
+    app: MainApplication
+        main application (fonts, colours, entry checks and settings of the thermal plots)
+    """
+    def __init__(self, app):
+        """
+        Compute minimum thermal conductivity using diverse models
+
+        Cahill-Pohl: D. G. Cahill and R. O. Pohl, “Lattice Vibrations and Heat Transport in Crystals
+        and Glasses,” Annual Review of Physical Chemistry, 39, 93–121, 1988.
+        
+        Pohls: J.-H. Pohls, M. B. Johnson, and M. A. White, “Origins of ultralow thermal
+        conductivity in bulk [6,6]-phenyl-C61-butyric acid methyl ester (PCBM),”
+        Physical Chemistry Chemical Physics, 18, 1185–1190, 2016.
+
+        Dynamic: J.-H. Pohls et al., "Metal phosphides as potential thermoelectric materials," 
+        Journal of Materials Chemistry C 5, 12441-12456, 2017.
+
+        Diffusive: M. T. Agne, R. Hanus and  G. Jeffrey Snyder, "Minimum thermal conductivity in the 
+        context of diffuson-mediated thermal transport," Energy Environ. Sci. 11, 609-616, 2018.
+
+        Clarke: D. R. Clarke, "Materials selection guidelines for low thermal conductivity thermal barrier 
+        coatings," Surf. Coat. Technol. 163 , 67—74, 2003.
+        """
+        self.app = app
+        self.minimum_window = Toplevel()
+        self.minimum_window.configure(bg=self.app._from_rgb((241, 165, 193)))
+        self.minimum_window.geometry("1000x480")
+        self.minimum_window.iconbitmap('icon_spb.ico')
+
+        #Create Frames
+        input_para = Frame(self.minimum_window, height=158, width=795, bg=self.app._from_rgb((191, 112, 141)))
+        input_para.grid(row=0, column=0, columnspan=4, rowspan=5, pady=(10, 5))
+        label_input = Label(self.minimum_window, text='Input parameters')
+        label_input.grid(row=0, column=0, pady=(10, 5))
+        label_input['font'] = self.app.font_window
+
+        temperature_para = Frame(self.minimum_window, height=108, width=795, bg=self.app._from_rgb((191, 112, 141)))
+        temperature_para.grid(row=5, column=0, columnspan=4, rowspan=3, pady=(10, 5))
+        temperature_range_label = Label(self.minimum_window, text='Temperature range / K')
+        temperature_range_label.grid(row=5, column=0, padx=10, pady=10, ipadx=35)
+        temperature_range_label['font'] = self.app.font_window
+
+        output = Frame(self.minimum_window, height=122, width=450, bg=self.app._from_rgb((175, 188, 205)))
+        output.grid(row=8, column=0, columnspan=2, rowspan=4, pady=(0, 5))
+        label_output = Label(self.minimum_window, text='Output parameters')
+        label_output.grid(row=8, column=0, pady=(0, 5))
+        label_output['font'] = self.app.font_window
+
+        output_temp = Frame(self.minimum_window, height=122, width=510, bg=self.app._from_rgb((175, 188, 205)))
+        output_temp.grid(row=8, column=2, columnspan=4, rowspan=4, pady=(0, 5))
+        label_output_temp = Label(self.minimum_window, text='Output Temperature')
+        label_output_temp.grid(row=8, column=3, pady=(0, 5))
+        label_output_temp['font'] = self.app.font_window
+
+        #Create Entry widgets
+        self.unitcell = EntryItem(self.minimum_window, name='Unit cell volume / A3 (req.)', row=1)
+        self.unitcell.create_EntryItem(ipadx_label=56)
+        self.numberatoms = EntryItem(self.minimum_window, name='Number of atoms per unit cell (req.)', row=2)
+        self.numberatoms.create_EntryItem(ipadx_label=32)
+        self.density = EntryItem(self.minimum_window, name='Mass density / g cm-3 (req.)', row=2, column=3)
+        self.density.create_EntryItem(ipadx_label=2)
+        self.longitudinal = EntryItem(self.minimum_window, name='Longitudinal speed of sound / m s-1', row=3)
+        self.longitudinal.create_EntryItem(ipadx_label=32)
+        self.bulkmodulus = EntryItem(self.minimum_window, name='Bulk modulus / Pa', row=3, column=3)
+        self.bulkmodulus.create_EntryItem(ipadx_label=26)
+        self.transverse = EntryItem(self.minimum_window, name='Transverse speed of sound / m s-1', row=4)
+        self.transverse.create_EntryItem(ipadx_label=38)
+        self.shearmodulus = EntryItem(self.minimum_window, name='Shear modulus / Pa', row=4, column=3)
+        self.shearmodulus.create_EntryItem(ipadx_label=24)
+
+        self.debyetemp = EntryItem(self.minimum_window, name='Debye temperature / K', row=6)
+        self.debyetemp.create_EntryItem(ipadx_label=69)
+        self.temperature_range_step = EntryItem(self.minimum_window, 'Temperature step / K', row=6, column=3, padx=0, pady=9)
+        self.temperature_range_step.create_EntryItem(pady_label=9, ipadx_label=20)
+        self.temperature_range_min = EntryItem(self.minimum_window, 'Minimum temperature / K', row=7, padx=0, pady=9)
+        self.temperature_range_min.create_EntryItem(pady_label=9, ipadx_label=58)
+        self.temperature_range_max = EntryItem(self.minimum_window, 'Maximum temperature / K', row=7, column=3, padx=0, pady=9)
+        self.temperature_range_max.create_EntryItem(pady_label=9, ipadx_label=5)
+
+        self.minimumthermal = EntryItem(self.minimum_window, name='Minimum thermal conductivity / W m-1 K-1', row=10, state=DISABLED)
+        self.minimumthermal.create_EntryItem(ipadx_label=9)
+
+        #Create buttons
+        btn_calculate = Button(self.minimum_window, text='Calculate', command=self.calculate_minimum_thermal, bg=self.app._from_rgb((122, 138, 161)))
+        btn_calculate.grid(row=9, column=1, padx=10, pady=10, ipadx=25)
+        btn_calculate['font'] = self.app.font_window
+
+        btn_plot = Button(self.minimum_window, text='Plot', command=self.plot_minimum_thermal, bg=self.app._from_rgb((122, 138, 161)))
+        btn_plot.grid(row=9, column=3, padx=10, pady=10, ipadx=45)
+        btn_plot['font'] = self.app.font_window
+
+        btn_save = Button(self.minimum_window, text='Save', command=self.save_minimum_thermal, bg=self.app._from_rgb((122, 138, 161)))
+        btn_save.grid(row=10, column=3, padx=10, pady=10, ipadx=42)
+        btn_save['font'] = self.app.font_window
+
+        btn_close = Button(self.minimum_window, text='Close Window', command=self.minimum_window.destroy)
+        btn_close.grid(row=12, column=5, padx=10, pady=10, ipadx=35)
+        btn_close['font'] = self.app.font_window
+
+        #Create menus
+        self.minimum_models_options = [
+            'Cahill-Pohl',
+            'Pohls',
+            'Dynamic',
+            'Diffusive',
+            'Clarke'
+        ]
+        self.initial_minimum_model = StringVar(); self.initial_minimum_model.set(self.minimum_models_options[0])
+        self.minimum_model = OptionMenu(self.minimum_window, self.initial_minimum_model, *self.minimum_models_options)
+        self.minimum_model.grid(row=9, column=0, padx=10, pady=10, ipadx=70)
+        self.minimum_model['font'] = self.app.font_window
+
+        self.minimum_models_options_temp = [
+            'Cahill-Pohl',
+            'Pohls',
+            'Dynamic',
+        ]
+    
+        self.initial_minimum_model_temp = StringVar(); self.initial_minimum_model_temp.set(self.minimum_models_options_temp[0])
+        self.minimum_model_temp = OptionMenu(self.minimum_window, self.initial_minimum_model_temp, *self.minimum_models_options_temp)
+        self.minimum_model_temp.grid(row=9, column=2, padx=10, pady=10, ipadx=10)
+        self.minimum_model_temp['font'] = self.app.font_window
+
+        self.save_menu_min = EntryItem(self.minimum_window, 'Save', row=10, column=2, pady=5, ipadx=33, options=self.app.save_options)
+        self.save_menu_min.create_MenuOption()
+        self.save_menu_min.font(self.app.font_window)
+
+
+    def plot_minimum_thermal(self):
+        """
+        Plot the minimum thermal conductivity using input parameters and model
+        """
+        UC = self.app.check_number(self.unitcell.var.get(), 'Unit cell', 10, 150000, True) * 1e-30
+        NA = self.app.check_number(self.numberatoms.var.get(), 'Number atoms', 0, 250, True)
+        dens = self.app.check_number(self.density.var.get(), 'Mass density', 2, 250, True) * 1000
+        longV = self.app.check_number(self.longitudinal.var.get(), 'Longitudinal speed of sound', 10, 100000, False)
+        transV = self.app.check_number(self.transverse.var.get(), 'Transverse speed of sound', 10, 100000, False)
+        bulk = self.app.check_number(self.bulkmodulus.var.get(), 'Bulk modulus', 1, 1e16, False)
+        shear = self.app.check_number(self.shearmodulus.var.get(), 'Shear modulus', 1, 1e16, False)
+        debyetemperature = self.app.check_number(self.debyetemp.var.get(), 'Debye Temperature', 3, 1E5, False)
+        temp_max = self.app.check_number(self.temperature_range_max.var.get(), 'Maximum temperature', 1, 10000, True)
+        temp_min = self.app.check_number(self.temperature_range_min.var.get(), 'Minimum temperature', 0, 10000, True)
+        temp_step = self.app.check_number(self.temperature_range_step.var.get(), 'Temperature step', 0.1, 10000, True)
+
+        temp = arange(temp_min, temp_max, temp_step, dtype=float)
+
+        Debye = False
+        if debyetemperature != []:
+            Debye = True
+            DebyeT = debyetemperature
+
+        elif bulk != [] and shear != []:
+            longV, transV = sound_velocities(dens, bulk, shear)
+            self.longitudinal.set_name(str(longV))
+            self.transverse.set_name(str(transV))
+            
+        elif transV != [] and longV != []:
+            bulk, shear = elastic_moduli(dens, longV, transV)
+            self.bulkmodulus.set_name(str(bulk))
+            self.shearmodulus.set_name(str(shear))
+
+        else:
+            messagebox.showerror(
+                message='Please include the Debyte temperature or bulk and shear modulus or longitudinal and transverse speed of sound'
+            )
+            return []
+
+        if Debye == False:
+            DebyeT = debye_temperature(longV, transV, UC, NA)
+            self.debyetemp.set_name(str(DebyeT))
+
+        k_min = minimum_thermal_conductivity_temperature(self.initial_minimum_model_temp.get(), temp, UC, NA, DebyeT)
+
+        self.store_minimum(temp, k_min)
+
+        self.minimum_plot_window = Toplevel()
+        self.minimum_plot_window.configure(bg=self.app._from_rgb((241, 165, 193)))
+        self.minimum_plot_window.geometry("900x600")
+        self.minimum_plot_window.iconbitmap('icon_spb.ico')
+
+        plt.rcParams["font.family"] = self.app.initial_font_thermal.get()
+        plt.rcParams.update({'font.size': self.app.font_size_thermal.get() / 2.5})
+        
+        fig_minimum = Figure(figsize=(2.6, 1.6), dpi=300)
+        ax1 = fig_minimum.add_axes([0.2, 0.2, 0.75, 0.75])
+        ax1.plot(temp, k_min, c='k', marker='o', markersize=2, label='Minimum')
+        ax1.set_xlabel('Temperature / K')
+        ax1.set_ylabel('Thermal Conductivity / W m$^{-1}$ K$^{-1}$')    
+        ax1.set_ylim(0, max(k_min) * 1.1)   
+        ax1.legend()
+
+        canvas_minimum = FigureCanvasTkAgg(fig_minimum, master=self.minimum_plot_window)
+        canvas_minimum.draw()
+        plot_widget_minimum = canvas_minimum.get_tk_widget()
+        plot_widget_minimum.grid(row=3, column=3, columnspan=15, rowspan=6)
+
+        toolbar_frame = Frame(self.minimum_plot_window) 
+        toolbar_frame.grid(row=10, column=2, columnspan=4) 
+        toolbar = NavigationToolbar2Tk(canvas_minimum, toolbar_frame)
+        toolbar.update()
+
+
+    def store_minimum(self, temperature, kmin):
+        """
+        Keep the minimum thermal conductivity as function of temperature in the results of the application
+
+        Input:
+        --------------------
+        temperature: ndarray (N), dtype: float
+            Array of N temperatures in Kelvin
+        kmin: ndarray (N), dtype: float
+            Array of N minimum thermal conductivities in watts per meter and Kelvin
+        """
+        self.app.results.put('minimum', Result_Table(
+            {
+                'temperature' : temperature,
+                'minimum thermal conductivity' : kmin,
+            },
+            'Temperature / K, Minimum Thermal Conductivity / W m-1 K-1'))
+
+
+    def save_minimum_thermal(self):
+        """
+        Save the data for the minimum thermal conductivity plot
+        """
+        self.app.save_result('minimum')
+
+
+    def calculate_minimum_thermal(self):
+        """
+        Calculate the minimum thermal conductivity using input parameters and model
+        """
+        UC = self.app.check_number(self.unitcell.var.get(), 'Unit cell', 10, 150000, True) * 1e-30
+        NA = self.app.check_number(self.numberatoms.var.get(), 'Number atoms', 0, 250, True)
+        dens = self.app.check_number(self.density.var.get(), 'Mass density', 2, 250, True) * 1000
+        longV = self.app.check_number(self.longitudinal.var.get(), 'Longitudinal speed of sound', 10, 100000, False)
+        transV = self.app.check_number(self.transverse.var.get(), 'Transverse speed of sound', 10, 100000, False)
+        bulk = self.app.check_number(self.bulkmodulus.var.get(), 'Bulk modulus', 1, 1e16, False)
+        shear = self.app.check_number(self.shearmodulus.var.get(), 'Shear modulus', 1, 1e16, False)
+        debyetemperature = self.app.check_number(self.debyetemp.var.get(), 'Debye Temperature', 3, 1E5, False)
+
+        if bulk != [] and shear != []:
+            longV, transV = sound_velocities(dens, bulk, shear)
+            self.longitudinal.set_name(str(longV))
+            self.transverse.set_name(str(transV))
+            
+        elif transV != [] and longV != []:
+            bulk, shear = elastic_moduli(dens, longV, transV)
+            self.bulkmodulus.set_name(str(bulk))
+            self.shearmodulus.set_name(str(shear))
+
+        else:
+            messagebox.showerror(
+                message='Please include the bulk and shear modulus or longitudinal and transverse speed of sound'
+            )
+            return []
+
+        self.debyetemp.set_name(str(debye_temperature(longV, transV, UC, NA)))
+
+        k_min = minimum_thermal_conductivity(self.initial_minimum_model.get(), UC, NA, longV, transV)
+
+        self.minimumthermal.set_name(str(k_min))
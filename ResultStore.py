@@ -0,0 +1,465 @@
+import io
+import csv
+import json
+
+from numpy import asarray, array, meshgrid, load, savez_compressed
+
+
+GRID_FORMAT = 'SPB temperature grid'
+GRID_VERSION = 1
+
+# arrays of a temperature grid and their units ('' for dimensionless properties)
+GRID_UNITS = {
+    'temperature' : 'K',
+    'carrier' : 'cm-3',
+    'zT' : '',
+    'carrier_experimental' : 'cm-3',
+    'zT_experimental' : '',
+    'carrier_optimized' : 'cm-3',
+    'zT_optimized' : '',
+    'chemical_potential' : '',
+    'seebeck' : 'mu V K-1',
+    'lorenz' : 'W Omega K-2',
+    'hall_mobility' : 'cm2 V-1 s-1',
+}
+
+# arrays every temperature grid has (the grids of GRID_NAMES are optional)
+GRID_REQUIRED = ['temperature', 'carrier', 'zT', 'carrier_experimental', 'zT_experimental', 'carrier_optimized', 'zT_optimized']
+
+# names of the grids of SPB_Model.temperature_surface in the .npz file
+GRID_NAMES = {
+    'Chemical Potential' : 'chemical_potential',
+    'Seebeck Coefficient' : 'seebeck',
+    'Lorenz Number' : 'lorenz',
+    'Hall Mobility' : 'hall_mobility',
+}
+
+
+class Result_Table:
+    """
+    Result given as columns of NumPy arrays (e.g. a property as function of temperature), it is converted to a
+    dictionary or list only when it is saved
+
+    Input:
+    -----------------------------
+    columns: dic
+        arrays of the result, {name: ndarray}, the names are the keys of the .json file
+    csv_header: str
+        first line of the .csv file
+    csv_columns: lst
+        names of the (one-dimensional) columns of the .csv file (default: all columns)
+    """
+    def __init__(self, columns, csv_header, csv_columns=None):
+        self.columns = {name: asarray(value) for name, value in columns.items()}
+        self.csv_header = csv_header
+        self.csv_columns = list(columns) if csv_columns is None else csv_columns
+
+    def get_dictionary(self):
+        """
+        Create dictionary
+
+        Output:
+        -------------------------
+        dic_data: dic
+            dictionary of the columns as lists
+        """
+        return {name: value.tolist() for name, value in self.columns.items()}
+
+    def csv_file(self):
+        """
+        Write a list with one line per row of the columns
+
+        Output:
+        ------------------------
+        file_csv: lst
+            lines of the .csv file
+        """
+        file_csv = [self.csv_header]
+        for row in zip(*(self.columns[name].tolist() for name in self.csv_columns)):
+            file_csv.append(csv_line(row))
+
+        return file_csv
+
+
+class Temperature_Grid:
+    """
+    Figure of merit as function of temperature (M) and carrier concentration (N) with the optimum and experimental
+    curves (SPB_Model.temperature_surface), saved as .json, .csv (curves) or compressed .npz file (load_grid)
+
+    Input:
+    -----------------------------
+    arrays: dic
+        arrays with the names of GRID_UNITS, {name: ndarray}: temperature (M), carrier (N), zT (M, N), the curves
+        (M) and the grids (M, N) of GRID_NAMES; for a loaded .npz file (NpzFile) the arrays are only read when used
+        and the file stays open until close (or load) is called
+    metadata: dic
+        description of the grid (scattering mechanism, units, input polynomials, ...)
+    """
+    def __init__(self, arrays, metadata):
+        self.arrays = arrays
+        self.metadata = metadata
+        self.cache = {}
+
+    def array(self, name):
+        """
+        Array of the grid, read once from a loaded file
+
+        Input:
+        -----------------------------
+        name: str
+            name of the array (GRID_UNITS)
+        """
+        if name not in self.cache:
+            self.cache[name] = self.arrays[name]
+
+        return self.cache[name]
+
+    def names(self):
+        """
+        Names of the arrays of the grid
+        """
+        return [name for name in GRID_UNITS if name in self.arrays]
+
+    def load(self):
+        """
+        Read all arrays of a loaded file into memory and close the file
+        """
+        if isinstance(self.arrays, dict):
+            return
+
+        arrays = {name: self.array(name) for name in self.names()}
+        self.close()
+        self.arrays = arrays
+
+    def close(self):
+        """
+        Close the file of a loaded grid, only arrays read before remain available
+        """
+        if not isinstance(self.arrays, dict):
+            self.arrays.close()
+            self.arrays = dict(self.cache)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def mesh(self):
+        """
+        Carrier concentrations and temperatures of the grid (X, Y of SPB_Model.temperature_surface)
+        """
+        return meshgrid(self.array('carrier'), self.array('temperature'))
+
+    def get_dictionary(self):
+        """
+        Create dictionary with the grid and curves as lists
+
+        Output:
+        -------------------------
+        dic_data: dic
+            dictionary of the grid and curves
+        """
+        X, Y = self.mesh()
+        dic_data = {
+            'Temperature Range' : self.array('temperature').tolist(),
+            'Hall Carrier Concentration Experimental' : self.array('carrier_experimental').tolist(),
+            'Hall Carrier Concentration Optimized' : self.array('carrier_optimized').tolist(),
+            'Hall Carrier Concentration 3D' : X.tolist(),
+            'Temperature 3D' : Y.tolist(),
+            'Thermoelectric Figure of Merit 3D' : self.array('zT').tolist(),
+            'Thermoelectric Figure of Merit Experimental' : self.array('zT_experimental').tolist(),
+            'Thermoelectric Figure of Merit Optimized' : self.array('zT_optimized').tolist(),
+        }
+
+        return dic_data
+
+    def csv_file(self):
+        """
+        Write a list of the experimental and optimum curves
+
+        Output:
+        ------------------------
+        file_csv: lst
+            lines of the .csv file
+        """
+        return Result_Table(
+            {name: self.array(name) for name in ['temperature', 'carrier_experimental', 'zT_experimental', 'carrier_optimized', 'zT_optimized']},
+            'Temperature / K, Hall Carrier Concentration Exp. / cm-3, Thermoelectric Figure of Merit Exp., Hall Carrier Concentration Opt. / cm-3, Thermoelectric Figure of Merit Opt.'
+        ).csv_file()
+
+    def npz_file(self, file_name):
+        """
+        Write all arrays and the metadata (as JSON) in a compressed .npz file, a loaded file is read completely and
+        closed first (it may be the file that is written)
+
+        Input:
+        -----------------------------
+        file_name: str
+            name of the file with extension
+        """
+        self.load()
+        savez_compressed(file_name, metadata=array(json.dumps(self.metadata)), **{name: self.array(name) for name in self.names()})
+
+
+def temperature_grid(T_range, surface, metadata):
+    """
+    Temperature grid of the output of SPB_Model.temperature_surface
+
+    Input:
+    -----------------------------
+    T_range: ndarray (M), dtype: float
+        temperatures in Kelvin
+    surface: tuple
+        X, Y, Z, zT_range_exp, n_range_exp, zT_range_opt, n_range_opt and grids (SPB_Model.temperature_surface)
+    metadata: dic
+        description of the calculation, e.g. scattering mechanism and input polynomials
+
+    Output:
+    -----------------------------
+    grid: Temperature_Grid
+        grid with the format, version and units added to the metadata
+    """
+    X, Y, Z, zT_range_exp, n_range_exp, zT_range_opt, n_range_opt, grids = surface
+    arrays = {
+        'temperature' : asarray(T_range, dtype=float),
+        'carrier' : X[0],
+        'zT' : Z,
+        'carrier_experimental' : asarray(n_range_exp),
+        'zT_experimental' : asarray(zT_range_exp),
+        'carrier_optimized' : asarray(n_range_opt),
+        'zT_optimized' : asarray(zT_range_opt),
+    }
+    for name, value in grids.items():
+        arrays[GRID_NAMES[name]] = value
+
+    metadata = dict(metadata, format=GRID_FORMAT, version=GRID_VERSION, units={name: GRID_UNITS[name] for name in arrays})
+
+    return Temperature_Grid(arrays, metadata)
+
+
+def load_grid(file_name):
+    """
+    Open a temperature grid saved as .npz file (Temperature_Grid.npz_file), the arrays are read when they are used
+    and the file stays open until Temperature_Grid.close is called (Result_Store closes replaced grids)
+
+    Input:
+    -----------------------------
+    file_name: str
+        name of the .npz file
+
+    Output:
+    -----------------------------
+    grid: Temperature_Grid
+        temperature grid of the file
+    """
+    data = load(file_name, allow_pickle=False)
+    try:
+        if 'metadata' not in data.files or any(name not in data.files for name in GRID_REQUIRED):
+            raise ValueError('{} does not contain a temperature grid'.format(file_name))
+
+        metadata = json.loads(str(data['metadata']))
+        if metadata.get('format') != GRID_FORMAT or metadata.get('version', 0) > GRID_VERSION:
+            raise ValueError('{} is not a temperature grid of version {} or older'.format(file_name, GRID_VERSION))
+
+    except Exception:
+        data.close()
+        raise
+
+    return Temperature_Grid(data, metadata)
+
+
+class Result_Store:
+    """
+    Latest results of the application kept in memory, one per kind of result (e.g. 'parameters', 'carrier',
+    'optimization'), files are only written when a result is saved
+
+    A result is any object with get_dictionary and csv_file (Computed_Parameters, Computed_Parameters_Carrier,
+    Result_Table, Temperature_Grid).  Results with a close method (Temperature_Grid of a loaded file) are closed when
+    they are replaced or removed.
+    """
+    def __init__(self):
+        self.results = {}
+
+    def put(self, name, result):
+        """
+        Keep a result, it replaces the previous result of the same kind
+        """
+        if self.results.get(name) is not result:
+            self.discard(name)
+        self.results[name] = result
+
+    def get(self, name):
+        """
+        Latest result of a kind, None if there is none
+        """
+        return self.results.get(name)
+
+    def discard(self, name):
+        """
+        Remove the result of a kind
+        """
+        close_result(self.results.pop(name, None))
+
+    def clear(self):
+        """
+        Remove all results
+        """
+        for result in self.results.values():
+            close_result(result)
+        self.results.clear()
+
+
+def close_result(result):
+    """
+    Close a result that keeps a file open (Result_Store)
+    """
+    close = getattr(result, 'close', None)
+    if close is not None:
+        close()
+
+
+def csv_line(fields):
+    """
+    Line of a .csv file (without line break), fields with commas, quotes or line breaks are quoted
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='').writerow(fields)
+
+    return buffer.getvalue()
+
+
+class Csv_Table:
+    """
+    .csv file written in chunks of rows through csv.writer (fields with commas, quotes or line breaks are quoted),
+    the file is created when the first chunk is written
+
+    Input:
+    -----------------------------
+    file_name: str
+        name of the file with extension
+    header: lst
+        names of the columns of the first line
+    chunk: int
+        number of rows kept in memory before they are written
+    """
+    def __init__(self, file_name, header, chunk=10000):
+        self.file_name = file_name
+        self.header = header
+        self.chunk = chunk
+        self.rows = []
+        self.file = None
+
+    def write_rows(self, rows):
+        """
+        Add rows (lst of fields), a full chunk is written to the file
+        """
+        self.rows.extend(rows)
+        if len(self.rows) >= self.chunk:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered rows
+        """
+        if len(self.rows) == 0:
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        if self.file is None:
+            self.file = open(self.file_name, 'w', newline='')
+            writer.writerow(self.header)
+
+        writer.writerows(self.rows)
+        self.file.write(buffer.getvalue())
+        self.rows = []
+
+    def close(self):
+        """
+        Write the remaining rows and close the file
+        """
+        try:
+            self.flush()
+        finally:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+class Table_Writer:
+    """
+    Consolidated .csv tables of many measurements instead of one file per measurement (SPBBatch.compute_all)
+
+    {file_name}.csv has one row per measurement (Computed_Parameters.table_row), {file_name}_list.csv one row per
+    measurement and carrier concentration (Computed_Parameters_Carrier.table_rows), both are written in chunks while
+    the measurements are added.
+
+    Input:
+    -----------------------------
+    file_name: str
+        name of the files without extension
+    chunk: int
+        number of rows of each table kept in memory before they are written
+    """
+    def __init__(self, file_name, chunk=10000):
+        from SPBCore import Computed_Parameters, Computed_Parameters_Carrier
+
+        self.parameters = Csv_Table(file_name + '.csv', Computed_Parameters.table_header, chunk)
+        self.carrier = Csv_Table(file_name + '_list.csv', Computed_Parameters_Carrier.table_header, chunk)
+
+    def write(self, SPB_Parameters, SPB_List=None):
+        """
+        Add a measurement
+
+        Input:
+        -----------------------------
+        SPB_Parameters: Computed_Parameters
+            thermoelectric properties
+        SPB_List: Computed_Parameters_Carrier
+            thermoelectric properties as function of carrier concentration (None: no rows in the _list table)
+        """
+        self.parameters.write_rows([SPB_Parameters.table_row()])
+        if SPB_List is not None:
+            self.carrier.write_rows(SPB_List.table_rows())
+
+    def close(self):
+        """
+        Write the remaining rows and close both files
+        """
+        try:
+            self.parameters.close()
+        finally:
+            self.carrier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def write_file(file_name, SPB_Data, save_value):
+    """
+    Write the thermoelectric properties as .csv or .json file
+
+    Input:
+    -----------------------------
+    file_name: str
+        name of the file without extension
+    SPB_Data: Computed_Parameters, Computed_Parameters_Carrier, Result_Table or Temperature_Grid
+        thermoelectric properties
+    save_value: str
+        '.csv', '.json' or '.npz' (only Temperature_Grid)
+    """
+    if save_value == '.csv':
+        with open(file_name + '.csv', 'w') as csvfile:
+            for row in SPB_Data.csv_file():
+                csvfile.write(row + '\n')
+
+    elif save_value == '.npz':
+        SPB_Data.npz_file(file_name + '.npz')
+
+    else:
+        with open(file_name + '.json', 'w') as fil_json:
+            json.dump(SPB_Data.get_dictionary(), fil_json)
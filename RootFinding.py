@@ -0,0 +1,371 @@
+from numpy import asarray, broadcast_arrays, abs, maximum, where, sign, isfinite, full, zeros, ones, nan
+from numpy.linalg import solve, det, LinAlgError
+
+
+def newton_bisection(func, lower, upper, x0=None, fprime=None, xtol=1E-12, maxiter=200):
+    """
+    Solve many independent monotonic one-dimensional problems func(x) = 0 at once
+
+    Every element keeps its own bracket [lower, upper] with a sign change of func.  The next estimate is a Newton
+    step (fprime given) or an Illinois false position step through the bracket (the function value at an end kept
+    twice in a row is halved), a bisection is taken instead if the step
+    leaves the bracket or is not smaller than half of the step before the last one.  Elements stop iterating
+    once they are converged.
+
+    Input:
+    -----------------------------
+    func: function
+        returns func(x) for an array x of all elements
+    lower: float or ndarray (N), dtype: float
+        lower ends of the brackets
+    upper: float or ndarray (N), dtype: float
+        upper ends of the brackets
+    x0: float or ndarray (N), dtype: float
+        initial estimates inside the brackets (default: Newton or false position step from the brackets)
+    fprime: function
+        returns the derivative of func for an array x of all elements
+    xtol: float
+        relative tolerance of x (absolute for |x| < 1)
+    maxiter: int
+        maximum number of iterations
+
+    Output:
+    -----------------------------
+    x: ndarray (N), dtype: float
+        roots, NaN for elements without a sign change in their bracket
+    converged: ndarray (N), dtype: bool
+        True for the elements within the tolerance
+    iterations: int
+        number of iterations
+    """
+    lower, upper = broadcast_arrays(asarray(lower, dtype=float), asarray(upper, dtype=float))
+    lower = lower.copy(); upper = upper.copy()
+    f_lower = asarray(func(lower), dtype=float)
+    f_upper = asarray(func(upper), dtype=float)
+
+    bracketed = (sign(f_lower) != sign(f_upper)) & isfinite(f_lower) & isfinite(f_upper)
+    converged = (f_lower == 0) | (f_upper == 0)
+    x = where(f_lower == 0, lower, upper)
+    if x0 is None:
+        x = where(converged, x, (lower + upper) / 2)
+    else:
+        x = where(converged, x, asarray(x0, dtype=float))
+
+    step_old = upper - lower; step_last = step_old
+    moved_lower = zeros(x.shape, dtype=bool); moved_upper = zeros(x.shape, dtype=bool)
+    active = bracketed & ~converged
+    iterations = 0
+    while active.any() and iterations < maxiter:
+        iterations += 1
+        f = asarray(func(x), dtype=float)
+
+        move_lower = active & (sign(f) == sign(f_lower))
+        lower = where(move_lower, x, lower); f_lower = where(move_lower, f, f_lower)
+        move_upper = active & ~move_lower
+        upper = where(move_upper, x, upper); f_upper = where(move_upper, f, f_upper)
+        f_upper = where(move_lower & moved_lower, f_upper / 2, f_upper)
+        f_lower = where(move_upper & moved_upper, f_lower / 2, f_lower)
+        moved_lower = move_lower; moved_upper = move_upper
+
+        if fprime is None:
+            step = f * (upper - lower) / (f_upper - f_lower)
+        else:
+            step = f / asarray(fprime(x), dtype=float)
+        x_new = x - step
+
+        bisect = ~((x_new > lower) & (x_new < upper)) | (abs(step) > abs(step_old) / 2)
+        x_new = where(bisect, (lower + upper) / 2, x_new)
+        step_old = where(active, step_last, step_old); step_last = where(active, x - x_new, step_last)
+
+        tolerance = xtol * maximum(abs(x_new), 1)
+        done = active & ((f == 0) | (abs(x_new - x) <= tolerance) | (upper - lower <= tolerance))
+        x = where(active & (f != 0), x_new, x)
+        converged |= done
+        active &= ~done
+
+    x = where(bracketed | converged, x, full(x.shape, nan))
+    if x.ndim == 0:
+        return x[()], converged[()], iterations
+
+    return x, converged, iterations
+
+
+def bracketed(func, lower, upper):
+    """
+    Check the brackets of newton_bisection before solving, elements without a sign change of func between the ends
+    have no root in their bracket
+
+    Input:
+    -----------------------------
+    func: function
+        returns func(x) for an array x of all elements
+    lower: float or ndarray (N), dtype: float
+        lower ends of the brackets
+    upper: float or ndarray (N), dtype: float
+        upper ends of the brackets
+
+    Output:
+    -----------------------------
+    bracketed: bool or ndarray (N), dtype: bool
+        True for the elements with a finite sign change (or a root at an end) in their bracket
+    """
+    lower, upper = broadcast_arrays(asarray(lower, dtype=float), asarray(upper, dtype=float))
+    f_lower = asarray(func(lower), dtype=float)
+    f_upper = asarray(func(upper), dtype=float)
+
+    inside = ((sign(f_lower) != sign(f_upper)) & isfinite(f_lower) & isfinite(f_upper)) | (f_lower == 0) | (f_upper == 0)
+    if inside.ndim == 0:
+        return inside[()]
+
+    return inside
+
+
+def newton_system(func, jacobian, x0, ftol=1E-12, maxiter=50):
+    """
+    Solve a small nonlinear system func(x) = 0 by Newton steps with backtracking, the step is halved until the sum
+    of squares of func decreases sufficiently (Armijo condition)
+
+    Input:
+    -----------------------------
+    func: function
+        returns the residuals for an array x
+    jacobian: function
+        returns the Jacobian matrix of func for an array x
+    x0: ndarray (N), dtype: float
+        initial estimate
+    ftol: float
+        tolerance of the largest absolute residual
+    maxiter: int
+        maximum number of iterations
+
+    Output:
+    -----------------------------
+    x: ndarray (N), dtype: float
+        solution (last estimate if not converged)
+    converged: bool
+        True if the residuals are within the tolerance
+    iterations: int
+        number of iterations
+    """
+    x = asarray(x0, dtype=float).copy()
+    f = asarray(func(x), dtype=float)
+    if not isfinite(f).all():
+        return x, False, 0
+
+    iterations = 0
+    while abs(f).max() > ftol and iterations < maxiter:
+        iterations += 1
+        try:
+            step = solve(asarray(jacobian(x), dtype=float), -f)
+        except LinAlgError:
+            return x, False, iterations
+
+        norm = f @ f
+        t = 1.
+        while True:
+            x_new = x + t * step
+            f_new = asarray(func(x_new), dtype=float)
+            if isfinite(f_new).all() and f_new @ f_new <= (1 - 1E-4 * t) * norm:
+                break
+            t /= 2
+            if t < 1E-6:
+                return x, False, iterations
+
+        x = x_new; f = f_new
+
+    return x, bool(abs(f).max() <= ftol), iterations
+
+
+def newton_systems(func, jacobian, x0, ftol=1E-12, maxiter=50):
+    """
+    Solve many independent small nonlinear systems func(x) = 0 at once by Newton steps with backtracking (see
+    newton_system), every system halves its own step and stops iterating once it is converged
+
+    Input:
+    -----------------------------
+    func: function
+        returns the residuals (N, K) for an array x (N, K) of all systems
+    jacobian: function
+        returns the Jacobian matrices (N, K, K) of func for an array x (N, K) of all systems
+    x0: ndarray (N, K), dtype: float
+        initial estimates
+    ftol: float
+        tolerance of the largest absolute residual of a system
+    maxiter: int
+        maximum number of iterations
+
+    Output:
+    -----------------------------
+    x: ndarray (N, K), dtype: float
+        solutions (last estimates of the systems not converged)
+    converged: ndarray (N), dtype: bool
+        True for the systems with residuals within the tolerance
+    iterations: int
+        number of iterations
+    """
+    x = asarray(x0, dtype=float).copy()
+    f = asarray(func(x), dtype=float)
+    failed = ~isfinite(f).all(axis=1)
+    active = ~failed & (abs(f).max(axis=1) > ftol)
+
+    iterations = 0
+    while active.any() and iterations < maxiter:
+        iterations += 1
+        J = asarray(jacobian(x), dtype=float)
+        singular = active & ~(isfinite(J).all(axis=(1, 2)) & (det(where(isfinite(J), J, 0)) != 0))
+        failed |= singular; active &= ~singular
+        step = zeros(x.shape)
+        step[active] = solve(J[active], -f[active][..., None])[..., 0]
+
+        norm = (f * f).sum(axis=1)
+        t = ones(len(x)); searching = active.copy()
+        while searching.any():
+            x_new = where(searching[:, None], x + t[:, None] * step, x)
+            f_new = asarray(func(x_new), dtype=float)
+            accept = searching & isfinite(f_new).all(axis=1) & ((f_new * f_new).sum(axis=1) <= (1 - 1E-4 * t) * norm)
+            x[accept] = x_new[accept]; f[accept] = f_new[accept]
+            searching &= ~accept
+            t = where(searching, t / 2, t)
+            stalled = searching & (t < 1E-6)
+            failed |= stalled; active &= ~stalled; searching &= ~stalled
+
+        active &= abs(f).max(axis=1) > ftol
+
+    return x, ~failed & (abs(f).max(axis=1) <= ftol), iterations
+
+
+class Continuation:
+    """
+    Warm starts for sequences of related solves, e.g. the rows of a temperature sweep
+
+    Every solve is keyed by the quantity it solves for.  The solution of a key is kept and seeds the next solve with
+    the same key and shape, a starting estimate (e.g. FermiIntegrals.asymptotic_eta) seeds the first one.  The
+    iterations of every solve are counted by seed source ('previous', 'estimate' or 'bracket' without a seed), the
+    iterations saved are estimated from the mean iterations of the solves started cold ('bracket', else 'estimate').
+    For diagnostics (reference_interval given) the caller repeats the first and then every reference_interval-th
+    solve of a key and seed source from a cold start (see reference), and the mean difference of these reference
+    solves times the number of solves of the seed source gives the iterations saved.
+
+    Input:
+    -----------------------------
+    enabled: bool
+        use warm starts, otherwise every solve starts from the bracket
+    reference_interval: int
+        number of solves of a key and seed source per cold reference solve (None: no reference solves)
+    """
+    def __init__(self, enabled=True, reference_interval=None):
+        self.enabled = enabled
+        self.reference_interval = reference_interval
+        self.previous = {}
+        self.counts = {}
+        self.last = {}
+        self.references = {}
+
+    def seed(self, key, estimate=None):
+        """
+        Starting estimate of a solve
+
+        Input:
+        -----------------------------
+        key: hashable
+            quantity solved for
+        estimate: float or ndarray (N), dtype: float
+            starting estimate used without a previous solution (or for its missing elements)
+
+        Output:
+        -----------------------------
+        x0: float, ndarray (N) or None
+            starting estimate, None to start from the bracket
+        source: str
+            'previous', 'estimate' or 'bracket'
+        """
+        if not self.enabled:
+            return None, 'bracket'
+
+        previous = self.previous.get(key)
+        if previous is not None and (estimate is None or asarray(estimate).shape == previous.shape):
+            if estimate is None:
+                return previous, 'previous'
+            return where(isfinite(previous), previous, estimate), 'previous'
+
+        if estimate is not None:
+            return asarray(estimate, dtype=float), 'estimate'
+
+        return None, 'bracket'
+
+    def record(self, key, x, source, iterations):
+        """
+        Keep the solution of a solve and count its iterations
+
+        Input:
+        -----------------------------
+        key: hashable
+            quantity solved for
+        x: float or ndarray (N), dtype: float
+            solution
+        source: str
+            seed source returned by seed
+        iterations: int
+            number of iterations
+        """
+        if self.enabled:
+            self.previous[key] = asarray(x, dtype=float)
+
+        solves, total = self.counts.get((key, source), (0, 0))
+        self.counts[(key, source)] = (solves + 1, total + iterations)
+        self.last[key] = (source, iterations)
+
+    def reference(self, key, cold_solve=None):
+        """
+        Count the iterations of the last recorded solve of a key from a cold start, only with a reference_interval
+        for the first and every reference_interval-th solve of the key and its seed source (cold_solve is not called
+        otherwise)
+
+        Input:
+        -----------------------------
+        key: hashable
+            quantity solved for
+        cold_solve: function
+            repeats the last solve as without warm starts and returns its number of iterations (None: the last
+            solve already started cold)
+        """
+        if self.reference_interval is None:
+            return
+
+        source, warm = self.last[key]
+        if (self.counts[(key, source)][0] - 1) % self.reference_interval != 0:
+            return
+
+        cold = warm if cold_solve is None else cold_solve()
+        references, cold_total, warm_total = self.references.get((key, source), (0, 0, 0))
+        self.references[(key, source)] = (references + 1, cold_total + cold, warm_total + warm)
+
+    def stats(self):
+        """
+        Number of solves, iterations and mean iterations for every key and seed source with its cold reference
+        solves ('reference'), and the iterations saved by the warm starts of every key: the mean saving of the
+        reference solves of every seed source times its number of solves, without reference solves the mean
+        iterations of the cold solves ('bracket', else 'estimate') minus those of the 'previous' solves times their
+        number (None if there are no solves of both kinds)
+        """
+        stats = {}
+        for (key, source), (solves, total) in self.counts.items():
+            stats.setdefault(key, {'saved': None})[source] = {'solves': solves, 'iterations': total, 'mean': total / solves}
+
+            if (key, source) in self.references:
+                references, cold, warm = self.references[(key, source)]
+                stats[key][source]['reference'] = {'solves': references, 'cold': cold, 'warm': warm}
+                stats[key]['saved'] = (stats[key]['saved'] or 0) + (cold - warm) / references * solves
+
+        for key in stats:
+            cold = stats[key].get('bracket', stats[key].get('estimate'))
+            if stats[key]['saved'] is None and cold is not None and 'previous' in stats[key]:
+                stats[key]['saved'] = (cold['mean'] - stats[key]['previous']['mean']) * stats[key]['previous']['solves']
+
+        return stats
+
+    def clear(self):
+        """
+        Forget the previous solutions (e.g. after the input data changed), the counts are kept
+        """
+        self.previous.clear()
@@ -0,0 +1,282 @@
+"""
+Compute all measurements of a .csv file without graphical interface (Compute All of the Thermoelectric Optimizer)
+
+The .csv file has the layout of Example_SPB.csv: a header line and one measurement per line with compound,
+temperature in Kelvin, Seebeck coefficient in microvolt per Kelvin, Hall carrier concentration in per centimeter
+cube, Hall mobility in centimeter square per volt and second, total thermal conductivity in watts per meter and Kelvin
+and dielectric constant (read by MeasurementTable, problems are reported with file and line and the measurement is
+skipped).  For every measurement {compound}_{temperature}_compute_all.csv (or .json) is written
+and, with a carrier concentration range, {compound}_{temperature}_compute_all_list.csv (or .json).  With
+--consolidated all measurements are written in compute_all.csv (one row per measurement) and compute_all_list.csv
+(one row per measurement and carrier concentration) instead.
+
+    python SPBBatch.py Example_SPB.csv --scattering ADP --n-min 1e18 --n-max 1e21 --format .csv --output results
+    python SPBBatch.py Example_SPB.csv --n-min 1e18 --n-max 1e21 --consolidated --output results
+
+Exit status: 0 if all measurements were computed, 1 if at least one measurement failed and 2 for wrong arguments
+or an input file that cannot be read.
+"""
+import sys
+import argparse
+from os import path, makedirs, cpu_count
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+
+from numpy import isfinite, flatnonzero
+
+from SPBCore import SPB_Model, carrier_grid
+from ResultStore import write_file, Table_Writer
+from MeasurementTable import PROPERTIES, read_measurements
+
+
+SCATTERING_OPTIONS = ['ADP', 'POP', 'IMP', 'POP2', 'IMP2']
+FORMAT_OPTIONS = ['.csv', '.json']
+
+EXIT_SUCCESS = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+
+_model = None
+
+
+def worker_model():
+    """
+    SPB model of the process, its tables and warm starts are kept between the measurements of a worker
+
+    Output:
+    -----------------------------
+    model: SPB_Model
+        model that reports its problems to model.problems
+    """
+    global _model
+    if _model is None:
+        problems = []
+        _model = SPB_Model(report=problems.append)
+        _model.problems = problems
+
+    return _model
+
+
+def compute_measurement(cmpd, values, scatter_value, n_range=None):
+    """
+    Compute the thermoelectric properties of a single measurement, errors are returned instead of raised
+
+    Input:
+    -----------------------------
+    cmpd: str
+        compound
+    values: tuple
+        values of the PROPERTIES of the measurement, an empty list if missing (Measurement_Table.value)
+    scatter_value: str
+        scattering option: acoustic deformation potential (ADP), polar optical phonon (POP, POP2 [simpler approach]), ionized impurity (IMP, IMP2 [simpler approac])
+    n_range: lst
+        carrier concentrations in per centimeter cube of the _list file (None: no _list file)
+
+    Output:
+    -----------------------------
+    SPB_Parameters: Computed_Parameters
+        thermoelectric properties (None if the measurement failed)
+    SPB_List: Computed_Parameters_Carrier
+        thermoelectric properties as function of carrier concentration (None without n_range or if it failed)
+    problems: lst
+        messages of all problems, empty if the measurement was computed
+    """
+    model = worker_model()
+    model.problems.clear()
+    SPB_Parameters = None; SPB_List = None
+
+    try:
+        temperature, seebeck, carrier, mobility, thermal, dielectric = values
+        SPB_Parameters = model.compute_scattering(
+            cmpd, temperature, seebeck, carrier, mobility, thermal, dielectric, scatter_value)
+
+        if not isfinite(SPB_Parameters.chemical_potential):
+            model.problems.append('The reduced chemical potential could not be found!')
+
+        if n_range is not None:
+            SPB_List = model.compute_scattering_carrier(SPB_Parameters, n_range)
+
+    except Exception as error:
+        model.problems.append(str(error))
+
+    return SPB_Parameters, SPB_List, list(model.problems)
+
+
+def compute_all(measurements, scatter_value, folder, save_value='.csv', n_min=None, n_max=None, workers=None, log=print, progress=None, consolidated=False):
+    """
+    Compute all measurements and save them in individual .csv or .json files or in two consolidated .csv tables
+
+    The measurements are spread over a pool of worker processes in chunks of consecutive measurements (the warm
+    starts of a worker follow the temperatures of a compound), the files are written in the order of the
+    measurements.  A failed measurement is logged and does not stop the others; its files are written if the
+    calculation finished (e.g. with NaN).  Measurements that do not pass Measurement_Table.check are logged and
+    counted as failed without being computed.
+
+    Input:
+    -----------------------------
+    measurements: Measurement_Table
+        measurements of the .csv file (read_measurements)
+    scatter_value: str
+        scattering option: acoustic deformation potential (ADP), polar optical phonon (POP, POP2 [simpler approach]), ionized impurity (IMP, IMP2 [simpler approac])
+    folder: str
+        folder of the files
+    save_value: str
+        '.csv' or '.json'
+    n_min, n_max: float
+        carrier concentration range in per centimeter cube of the _list files (None: no _list files)
+    workers: int
+        number of worker processes (default: number of CPUs, 1: no pool)
+    log: function
+        called with a message for every problem of a failed measurement
+    progress: function
+        called as progress(completed, total) after every written measurement, an exception raised by it (e.g. to
+        cancel) stops the run and cancels the measurements not started yet
+    consolidated: boolean
+        if true, write compute_all.csv and compute_all_list.csv in the folder (Table_Writer, save_value is ignored)
+
+    Output:
+    -----------------------------
+    computed: int
+        number of computed measurements
+    failed: int
+        number of failed measurements
+    """
+    n_range = None
+    if n_min is not None and n_max is not None:
+        n_range = carrier_grid(n_min, n_max)
+
+    valid, problems = measurements.check(scatter_value)
+    for message in measurements.messages(problems):
+        log(message)
+    invalid = len(problems)
+
+    valid_rows = flatnonzero(valid).tolist()
+    if len(valid_rows) == 0:
+        return 0, invalid
+
+    compounds = measurements.compounds.tolist(); labels = measurements.labels.tolist()
+    rows = [(compounds[row], labels[row]) for row in valid_rows]
+    cmpd_list = [cmpd for cmpd, temp in rows]
+    values_list = [tuple(measurements.value(row, name) for name in PROPERTIES) for row in valid_rows]
+
+    if workers is None:
+        workers = cpu_count() or 1
+    workers = min(workers, len(rows))
+
+    table = Table_Writer(path.join(folder, 'compute_all')) if consolidated else None
+    executor = None
+    try:
+        if workers == 1:
+            results = map(compute_measurement, cmpd_list, values_list, repeat(scatter_value), repeat(n_range))
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            results = executor.map(compute_measurement, cmpd_list, values_list, repeat(scatter_value),
+                                   repeat(n_range), chunksize=max(1, len(rows) // (4 * workers)))
+
+        computed, failed = write_results(rows, results, folder, save_value, log, progress, table)
+        return computed, failed + invalid
+
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if table is not None:
+            table.close()
+
+
+def write_results(rows, results, folder, save_value, log, progress=None, table=None):
+    """
+    Write the files of the measurements (or their rows of the consolidated table) in order and count the computed
+    and failed measurements (compute_all)
+    """
+    computed = 0; failed = 0
+    for (cmpd, temp), (SPB_Parameters, SPB_List, problems) in zip(rows, results):
+        try:
+            if SPB_Parameters is not None and table is not None:
+                table.write(SPB_Parameters, SPB_List)
+
+            elif SPB_Parameters is not None:
+                file_name = path.join(folder, '{}_{}_compute_all'.format(cmpd, SPB_Parameters.temperature))
+                write_file(file_name, SPB_Parameters, save_value)
+                if SPB_List is not None:
+                    write_file(file_name + '_list', SPB_List, save_value)
+
+        except OSError as error:
+            problems.append(str(error))
+
+        if problems:
+            failed += 1
+            for problem in problems:
+                log('{} at {} K: {}'.format(cmpd, temp, problem))
+        else:
+            computed += 1
+
+        if progress is not None:
+            progress(computed + failed, len(rows))
+
+    return computed, failed
+
+
+def main(argv=None):
+    """
+    Command line entry point, returns the exit status
+    """
+    parser = argparse.ArgumentParser(
+        description='Compute the single parabolic band parameters of all measurements in a .csv file')
+    parser.add_argument('file_name', help='.csv file with the layout of Example_SPB.csv')
+    parser.add_argument('-s', '--scattering', choices=SCATTERING_OPTIONS, default='ADP',
+                        help='scattering mechanism (default: ADP)')
+    parser.add_argument('--n-min', type=float, help='minimum Hall carrier concentration / cm-3 of the _list files')
+    parser.add_argument('--n-max', type=float, help='maximum Hall carrier concentration / cm-3 of the _list files')
+    parser.add_argument('-f', '--format', choices=FORMAT_OPTIONS, default='.csv', help='output format (default: .csv)')
+    parser.add_argument('-c', '--consolidated', action='store_true',
+                        help='write compute_all.csv and compute_all_list.csv instead of one file per measurement')
+    parser.add_argument('-o', '--output', default='.', help='output folder (default: current folder)')
+    parser.add_argument('-j', '--workers', type=int, help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='only report failed measurements')
+
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as error:
+        return error.code
+
+    if (args.n_min is None) != (args.n_max is None):
+        parser.print_usage(sys.stderr)
+        print('Please give both --n-min and --n-max', file=sys.stderr)
+        return EXIT_USAGE
+    if args.consolidated and args.format != '.csv':
+        parser.print_usage(sys.stderr)
+        print('The consolidated tables are only written as .csv', file=sys.stderr)
+        return EXIT_USAGE
+    if args.workers is not None and args.workers < 1:
+        parser.print_usage(sys.stderr)
+        print('The number of worker processes has to be at least 1', file=sys.stderr)
+        return EXIT_USAGE
+    if args.n_min is not None and not 1e8 < args.n_min < args.n_max < 1e24:
+        parser.print_usage(sys.stderr)
+        print('The carrier concentrations have to be 1e8 < n-min < n-max < 1e24', file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        measurements = read_measurements(args.file_name)
+        makedirs(args.output, exist_ok=True)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return EXIT_USAGE
+
+    if len(measurements) == 0:
+        print('{} does not contain any measurement'.format(args.file_name), file=sys.stderr)
+        return EXIT_USAGE
+
+    computed, failed = compute_all(measurements, args.scattering, args.output, args.format, args.n_min, args.n_max,
+                                   args.workers, log=lambda message: print(message, file=sys.stderr),
+                                   consolidated=args.consolidated)
+
+    if not args.quiet:
+        print('{} measurements computed, {} failed'.format(computed, failed))
+
+    return EXIT_FAILED if failed else EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
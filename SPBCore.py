@@ -0,0 +1,1371 @@
+from warnings import warn
+
+from numpy import exp, log10, log, pi, arcsinh, sqrt, arctan
+from numpy import nan, inf, asarray, meshgrid, zeros_like, full, clip, where, arange, isfinite, broadcast_to, stack, flatnonzero, errstate, unique, isnan
+
+from scipy import integrate
+from scipy import constants
+
+from FermiIntegrals import power_law_moments, power_law_derivatives, window_bundle, window_bundle_derivatives, brooks_herring_integrands, Fermi_Cache, Moment_Table, Screening_Table, Screening_Rows, Moment_Inverse, reduced_seebeck, reduced_density, log_ratio_derivative, asymptotic_eta
+from FermiIntegrals import fermi_window, fermi_function, window_limits, bose_window, BOSE_CUTOFF
+from RootFinding import bracketed, newton_bisection, newton_system, newton_systems, Continuation
+
+
+###Physical constants
+k = constants.k
+e = constants.e
+h = constants.h
+hbar = constants.hbar
+m_e = constants.m_e
+e0=constants.epsilon_0
+
+
+class Computed_Parameters:
+    """
+    Thermoelectric properties of a measurement, produce a dictionary and list
+
+    Input:
+    -----------------------------------
+    compound: str
+        compound name
+    temperature: float
+        temperature in Kelvin
+    seebeck: float
+        Seebeck coefficient in microvolts per Kelvin
+    carrier: float
+        carrier concentration in per centimeters cube
+    mobility: float
+        mobility in centimeters squared per volt and second
+    thermal: float
+        total thermal conductivity in watts per meter and Kelvin
+    dielectric: float
+        dielectric constant
+    scatter: int
+        scatter mechanism
+    chemical_potential: float
+        chemical potential in meV
+    effective_mass: float
+        density of states effective mass in electron mass
+    intrinsic_mobility: float
+        intrinsic mobility in centimeters squared per volt and second
+    lorenz: float
+        effective Lorenz number in watts Omega per Kelvin squared
+    electrical_thermal: float
+        electronic contribution to the thermal conductivity in watts per Kelvin and meter
+    lattice_thermal: float
+        phononic contribution to the thermal conductivity in watts per Kelvin and meter
+    beta: float
+        quality factor
+    zT: float
+        dimensionless thermoelectric figure of merit
+    """
+    table_header = ['Compound', 'Temperature / K', 'Seebeck Coefficient / mu V K-1', 'Hall Carrier Concentration / cm-3',
+                    'Hall Mobility / cm2 V-1 s-1', 'Thermal Conductivity / W m-1 K-1', 'Dielectric Constant',
+                    'Scattering Mechanism', 'Chemical Potential / meV', 'Effective Mass / m_e',
+                    'Intrinsic Mobility / cm2 V-1 s-1', 'Lorenz Number / W Omega K-2',
+                    'Electronic Thermal Conductivity / W m-1 K-1', 'Lattice Thermal Conductivity / W m-1 K-1',
+                    'Thermoelectric Figure of Merit']
+
+    def __init__(self, compound, temperature, seebeck, carrier, mobility, thermal, dielectric, scatter, chemical_potential, effective_mass, intrinsic_mobility, lorenz, electrical_thermal, lattice_thermal, beta, zT):
+        self.compound = compound
+        self.temperature = temperature
+        self.seebeck = seebeck
+        self.carrier = carrier
+        self.mobility = mobility
+        self.thermal = thermal
+        self.dielectric = dielectric
+        self.scatter = scatter
+        self.chemical_potential = chemical_potential
+        self.effective_mass = effective_mass
+        self.intrinsic_mobility = intrinsic_mobility
+        self.lorenz = lorenz
+        self.electrical_thermal = electrical_thermal
+        self.lattice_thermal = lattice_thermal
+        self.beta = beta
+        self.zT = zT
+
+
+    def get_dictionary(self):
+        """
+        Create dictionary
+
+        Output:
+        -------------------------
+        dic_data: dic
+            dictionary of thermoelectric properties
+        """
+        dic_data = {
+                'Compound' : self.compound,
+                'Temperature' : [self.temperature, 'K'],
+                'Seebeck Coefficient' : [self.seebeck, 'mu V K-1'],
+                'Hall Carrier Concentration' : [self.carrier, 'cm-3'],
+                'Hall Mobility' : [self.mobility, 'cm2 V-1 s-1'],
+                'Thermal Conductivity' : [self.thermal, 'W m-1 K-1'],
+                'Dielectric Constant' : self.dielectric,
+                'Scattering Mechanism' : self.scatter,
+                'Chemical Potential' : [self.chemical_potential, 'meV'],
+                'Effective Mass' : [self.effective_mass, 'm_e'],
+                'Intrinsic Mobility' : [self.intrinsic_mobility, 'cm2 V-1 s-1'],
+                'Lorenz Number' : [self.lorenz, 'W Omega K-2'],
+                'Electronic Thermal Conductivity' : [self.electrical_thermal, 'W m-1 K-1'],
+                'Lattice Thermal Conductivity' : [self.lattice_thermal, 'W m-1 K-1'],
+                'Thermoelectric Figure of Merit' : self.zT,
+            }
+
+        return dic_data
+
+
+    def csv_file(self):
+        """
+        Write a list
+
+        Output:
+        ------------------------
+        file_csv: lst
+            list of thermoelectric properties
+        """
+        file_csv = ['Compound :, {}'.format(self.compound)]
+        file_csv.append('Temperature :, {}, K'.format(self.temperature))
+        file_csv.append('Seebeck Coefficient :, {}, mu V K-1'.format(self.seebeck))
+        file_csv.append('Hall Carrier Concentration :, {}, cm-3'.format(self.carrier))
+        file_csv.append('Hall Mobility :, {}, cm2 V-1 s-1'.format(self.mobility))
+        file_csv.append('Thermal Conductivity :, {}, W m-1 K-1'.format(self.thermal))
+        file_csv.append('Dielectric Constant :, {}'.format(self.dielectric))
+        file_csv.append('')
+        file_csv.append('Scattering Mechanism :, {}'.format(self.scatter))
+        file_csv.append('Chemical Potential :, {}, meV'.format(self.chemical_potential))
+        file_csv.append('Effective Mass :, {}, m_e'.format(self.effective_mass))
+        file_csv.append('Intrinsic Mobility :, {}, cm2 V-1 K-1'.format(self.intrinsic_mobility))
+        file_csv.append('Lorenz Number :, {}, W Omega K-2'.format(self.lorenz))
+        file_csv.append('Electronic Thermal Conductivity :, {}, W m-1 K-1'.format(self.electrical_thermal))
+        file_csv.append('Lattice Thermal Conductivity :, {}, W m-1 K-1'.format(self.lattice_thermal))
+        file_csv.append('Thermoelectric Figure of Merit :, {}'.format(self.zT))
+
+        return file_csv
+
+
+    def table_row(self):
+        """
+        Fields of a line of the consolidated table of all measurements (table_header), written by
+        ResultStore.Csv_Table
+
+        Output:
+        ------------------------
+        row: lst
+            thermoelectric properties
+        """
+        return [self.compound, self.temperature, self.seebeck, self.carrier, self.mobility, self.thermal, self.dielectric,
+                self.scatter, self.chemical_potential, self.effective_mass, self.intrinsic_mobility, self.lorenz,
+                self.electrical_thermal, self.lattice_thermal, self.zT]
+
+
+class Computed_Parameters_Carrier:
+    """
+    Carrier-dependent paramters, produce a dictionary and list
+
+    Input:
+    ----------------------
+    compound: str
+        compound name
+    temperature: float
+        temperature in Kelvin
+    effective_mass: float
+        Density of states effective mass in meV
+    intrinsic_mobility: float
+        intrinsic mobility in centimeters squared per volt and second
+    scattering_mechanism: str
+        scattering mechanism
+    carrier_range: ndarray(N), dtype: float
+        array of N carrier concentration in per centimeters cube
+    mobility_cc: ndarray(N), dtype: float
+        array of N mobilities in centimeter squared per volt and second
+    seebeck_cc: ndarray(N), dtype: float
+        array of N Seebeck coefficients in microvolts per Kelvin
+    lorenz_cc: ndarray(N), dtype: float
+        array of N effective Lorenz numbers in watts Omega per Kelvin squared
+    zT_cc: ndarray(N), dtype: float
+        array of N dimensionless thermoelectric figure of merits
+    """
+    table_header = ['Compound', 'Temperature / K', 'Hall Carrier Concentration / cm-3', 'Seebeck Coefficient / mu V K-1',
+                    'Hall Mobility / cm2 V-1 s-1', 'Lorenz Number / W Omega K-2', 'Thermoelectric Figure of Merit']
+
+    def __init__(self, compound, temperature, effective_mass, intrinsic_mobility, scattering_mechanism, carrier_range, mobility_cc, seebeck_cc, lorenz_cc, zT_cc):
+        self.compound = compound
+        self.temperature = temperature
+        self.effective_mass = effective_mass
+        self.intrinsic_mobility = intrinsic_mobility
+        self.scattering_mechanism = scattering_mechanism
+        self.carrier_range = carrier_range
+        self.mobility_cc = mobility_cc
+        self.seebeck_cc = seebeck_cc
+        self.lorenz_cc = lorenz_cc
+        self.zT_cc = zT_cc
+
+
+    def get_dictionary(self):
+        """
+        Prepare a dictionary
+
+        Output:
+        --------------------
+        dic_data: dic
+            dictionary of thermoelectric data
+        """
+        dic_data = {
+            'Compound' : self.compound,
+            'Temperature' : [self.temperature, 'K'],
+            'Effective Mass' : [self.effective_mass, 'meV'],
+            'Intrinsic Mobility' : [self.intrinsic_mobility, 'cm2 V-1 K-1'],
+            'Scattering Mechanism' : self.scattering_mechanism,
+            'Hall Carrier Concentration List' : [self.carrier_range, 'cm-3'],
+            'Hall Mobility List' : [self.mobility_cc, 'cm2 V-1 K-1'],
+            'Seebeck Coefficient List' : [self.seebeck_cc, 'mu V K-1'],
+            'Lorenz Number List' : [self.lorenz_cc, 'W Omega K-2'],
+            'Thermoelectric Figure of Merit List' : self.zT_cc
+        }
+
+        return dic_data
+
+    def csv_file(self):
+        """
+        Write list of thermoelectric properties for a csv file
+
+        Output:
+        -----------------
+        file_csv: lst
+            list of thermoelectric properties
+        """
+        file_csv = ['Compound :, {}'.format(self.compound)]
+        file_csv.append('Temperature :, {}, K'.format(self.temperature))
+        file_csv.append('Scattering Mechanism :, {}'.format(self.scattering_mechanism))
+        file_csv.append('Effective Mass :, {}, m_e'.format(self.effective_mass))
+        if self.intrinsic_mobility != 0:
+            file_csv.append('Intrinsic Mobility :, {}, cm2 V-1 K-1'.format(self.intrinsic_mobility))
+            file_csv.append('')
+
+            if len(self.zT_cc) != 0:
+                file_csv.append('Hall Carrier Concentration / cm-3,  Seebeck Coefficient / mu V K-1,  Hall Mobility / cm2 V-1 s-1,  Lorenz Number / W Omega K-2,  Thermoelectric Figure of Merit')
+                for n_r in range(len(self.carrier_range)):
+                    file_csv.append('{}, {}, {}, {}, {}'.format(self.carrier_range[n_r], self.seebeck_cc[n_r], self.mobility_cc[n_r], self.lorenz_cc[n_r], self.zT_cc[n_r]))
+
+            else:
+                file_csv.append('Hall Carrier Concentration / cm-3,  Seebeck Coefficient / mu V K-1,  Hall Mobility / cm2 V-1 s-1,  Lorenz Number / W Omega K-2')
+                for n_r in range(len(self.carrier_range)):
+                    file_csv.append('{}, {}, {}, {}'.format(self.carrier_range[n_r], self.seebeck_cc[n_r], self.mobility_cc[n_r], self.lorenz_cc[n_r]))
+
+        else:
+            file_csv.append('Intrinsic Mobility :, NaN, cm2 V-1 K-1')
+            file_csv.append('')
+            file_csv.append('Hall Carrier Concentration / cm-3,  Seebeck Coefficient / mu V K-1,   Lorenz Number / W Omega K-2')
+            for n_r in range(len(self.carrier_range)):
+                file_csv.append('{}, {}, {}'.format(self.carrier_range[n_r], self.seebeck_cc[n_r],  self.lorenz_cc[n_r]))
+
+        return file_csv
+
+    def table_rows(self):
+        """
+        Fields of the lines of the consolidated long-format table of all measurements (table_header), one line per
+        carrier concentration; mobility and figure of merit are empty if they were not computed (see csv_file)
+
+        Output:
+        -----------------
+        rows: lst
+            thermoelectric properties of every line (lst)
+        """
+        prefix = [self.compound, self.temperature]
+        n = len(self.carrier_range)
+        empty = [''] * n
+        columns = [
+            asarray(self.carrier_range, dtype=float).tolist(),
+            asarray(self.seebeck_cc, dtype=float).tolist(),
+            asarray(self.mobility_cc, dtype=float).tolist() if self.intrinsic_mobility != 0 else empty,
+            asarray(self.lorenz_cc, dtype=float).tolist(),
+            asarray(self.zT_cc, dtype=float).tolist() if self.intrinsic_mobility != 0 and len(self.zT_cc) != 0 else empty,
+        ]
+
+        return [prefix + list(row) for row in zip(*columns)]
+
+
+class Fermi_IMP:
+    """
+    Get the Fermi integrals assuming ionized screened impurity scattering using Brooks-Herring approach
+
+    Input:
+    ------------------
+    m_s: float
+        Density of states effective mass in electron mass
+    epsilon: float
+        reduced energy
+    temperature: float
+        temperature in Kelvin
+    carrier: float
+        carrier concentration in cm-3
+    """
+    def __init__(self, m_s, epsilon, temperature, carrier):
+        self.m_s = m_s
+        self.epsilon = epsilon
+        self.temperature = temperature
+        self.carrier = carrier
+
+    def bh(self, x):
+        """
+        Brooks-Herring approach
+        """
+        return self.screening_prefactor() * x
+
+    def screening_prefactor(self):
+        """
+        Prefactor of the reduced energy in the Brooks-Herring approach, the only parameter of the integrands
+        """
+        return 8 * self.m_s * self.epsilon * e0 * k * self.temperature / (hbar**2 * self.carrier * e)
+
+    def integrands(self, x):
+        """
+        Energy dependent factors of the Fermi integrals, the screening function is evaluated once per node
+        """
+        return brooks_herring_integrands(x, self.screening_prefactor())
+
+    def Fermi_integral_quad(self, eta, name):
+        """
+        Reference adaptive quadrature of a single Fermi integral (tau, tau_E, tau_E2 or tau2)
+        """
+        FI = lambda x: self.integrands(x)[name] * fermi_window(x - eta)
+        lower, upper, points = window_limits(eta)
+        return integrate.quad(FI, lower, upper, points=points)
+
+    def Fermi_moments(self, eta):
+        """
+        All Fermi integrals for the reduced chemical potential eta in a single pass
+        """
+        return window_bundle(eta, self.integrands)
+
+    def Fermi_moment_derivatives(self, eta):
+        """
+        Derivatives of all Fermi integrals with respect to the reduced chemical potential eta
+        """
+        return window_bundle_derivatives(eta, self.integrands)
+
+    def Fermi_integral_tau_S(self, eta):
+        return self.Fermi_moments(eta).tau_S
+
+    def Fermi_integral_tau(self, eta):
+        return self.Fermi_moments(eta).tau
+
+    def Fermi_integral_tau_E2(self, eta):
+        return self.Fermi_moments(eta).tau_E2
+
+    def Fermi_integral_tau_E(self, eta):
+        return self.Fermi_moments(eta).tau_E
+
+    def Fermi_integral_tau2(self, eta):
+        return self.Fermi_moments(eta).tau2
+
+
+class Fermi_POP:
+    """
+    Get the Fermi integrals assuming polar optical phonons
+    """
+    def integrands(x):
+        """
+        Energy dependent factors of the Fermi integrals
+        """
+        g = arcsinh(sqrt(x))
+        return {'tau': x**2 / g, 'tau_E': x**3 / g, 'tau_E2': x**4 / g, 'tau2': x**2.5 / g**2}
+
+    def Fermi_integral_quad(eta, name):
+        """
+        Reference adaptive quadrature of a single Fermi integral (tau, tau_E, tau_E2 or tau2)
+        """
+        FI = lambda x: Fermi_POP.integrands(x)[name] * fermi_window(x - eta)
+        lower, upper, points = window_limits(eta)
+        return integrate.quad(FI, lower, upper, points=points)
+
+    def Fermi_moments(eta):
+        """
+        All Fermi integrals for the reduced chemical potential eta in a single pass
+        """
+        return window_bundle(eta, Fermi_POP.integrands)
+
+    def Fermi_moment_derivatives(eta):
+        """
+        Derivatives of all Fermi integrals with respect to the reduced chemical potential eta
+        """
+        return window_bundle_derivatives(eta, Fermi_POP.integrands)
+
+    def Fermi_integral_tau_S(eta):
+        return Fermi_POP.Fermi_moments(eta).tau_S
+
+    def Fermi_integral_tau(eta):
+        return Fermi_POP.Fermi_moments(eta).tau
+
+    def Fermi_integral_tau_E2(eta):
+        return Fermi_POP.Fermi_moments(eta).tau_E2
+
+    def Fermi_integral_tau_E(eta):
+        return Fermi_POP.Fermi_moments(eta).tau_E
+
+    def Fermi_integral_tau2(eta):
+        return Fermi_POP.Fermi_moments(eta).tau2
+
+
+def Fermi_integral(eta, lam):
+    """
+    Fermi integral for acoustic deformation potential scattering (reference quadrature, the calculations
+    use the vectorized FermiIntegrals.fermi_integrals)
+    """
+    FI = lambda x: x**lam * fermi_function(x - eta)
+    return integrate.quad(FI, 0, window_limits(eta)[1])
+
+
+class SPB_Model:
+    """
+    Single parabolic band model without graphical interface: inversion of the Seebeck coefficient and carrier
+    concentration, carrier concentration sweeps and temperature maps for all scattering mechanisms
+
+    The interpolation tables, inverse maps and warm starts are kept between calls.
+
+    Input:
+    -----------------------------
+    report: function
+        called with the message of every problem that does not stop the calculation (default: warnings.warn)
+    progress: function
+        called as progress(completed, total, stage) while the interpolation table of ionized impurity scattering is
+        built (one to two seconds on first use), an exception raised by it (e.g. to cancel) stops the calculation
+    """
+    def __init__(self, report=None, progress=None):
+        self.report = warn if report is None else report
+        self.progress = progress
+        self.fermi_cache = Fermi_Cache()
+        self.fermi_tables = {}
+        self.moment_inverses = {}
+        self.continuation = Continuation()
+        self.imp_tolerance = 1E-12
+
+    def table_progress(self, completed, total):
+        """
+        Report the progress of the build of the ionized impurity table (Screening_Table)
+        """
+        if self.progress is not None:
+            self.progress(completed, total, 'ionized impurity table')
+
+    def get_moments(self, scatter_value, fermi_IMP=None):
+        """
+        Get the function evaluating the Fermi integrals of a scattering mechanism through the cache, the integrals
+        are interpolated from tables built on first use (Moment_Table for the mechanisms depending only on eta,
+        Screening_Table for IMP)
+
+        Input:
+        --------------------------
+        scatter_value: str
+            scattering option: acoustic deformation potential (ADP), polar optical phonon (POP, POP2 [simpler approach]), ionized impurity (IMP, IMP2 [simpler approac])
+        fermi_IMP: Fermi_IMP
+            integrals for ionized impurity scattering (only IMP), parameters changed later are taken into account
+
+        Output:
+        --------------------------
+        moments: function
+            returns the Fermi_Moments for a reduced chemical potential
+        """
+        if scatter_value in ['ADP', 'POP2', 'IMP2', 'POP']:
+            if scatter_value not in self.fermi_tables:
+                if scatter_value == 'POP':
+                    self.fermi_tables[scatter_value] = Moment_Table(Fermi_POP.Fermi_moments)
+                else:
+                    lam = {'ADP': 0, 'POP2': 1, 'IMP2': 2}[scatter_value]
+                    self.fermi_tables[scatter_value] = Moment_Table(lambda eta: power_law_moments(eta, lam))
+
+            return lambda eta: self.fermi_cache.get(scatter_value, eta, self.fermi_tables[scatter_value])
+
+        elif scatter_value == 'IMP':
+            if scatter_value not in self.fermi_tables:
+                self.fermi_tables[scatter_value] = Screening_Table(progress=self.table_progress)
+
+            def moments(eta):
+                prefactor = fermi_IMP.screening_prefactor()
+                return self.fermi_cache.get(('IMP', prefactor), eta, lambda eta: self.fermi_tables['IMP'](eta, prefactor))
+
+            return moments
+
+
+    def get_moment_derivatives(self, scatter_value, fermi_IMP=None, prefactor=False):
+        """
+        Get the function evaluating the derivatives of the Fermi integrals with respect to the reduced chemical
+        potential (analytic Jacobians of the eta solves), the power laws use dF_j/deta = j F_(j-1)
+
+        Input:
+        --------------------------
+        scatter_value: str
+            scattering option: acoustic deformation potential (ADP), polar optical phonon (POP, POP2 [simpler approach]), ionized impurity (IMP, IMP2 [simpler approac])
+        fermi_IMP: Fermi_IMP
+            integrals for ionized impurity scattering (only IMP), parameters changed later are taken into account
+        prefactor: bool
+            derivatives with respect to the logarithm of the screening prefactor instead of eta (only IMP)
+
+        Output:
+        --------------------------
+        derivatives: function
+            returns the Fermi_Moments of the derivatives for a reduced chemical potential
+        """
+        if scatter_value in ['ADP', 'POP2', 'IMP2']:
+            lam = {'ADP': 0, 'POP2': 1, 'IMP2': 2}[scatter_value]
+            return lambda eta: power_law_derivatives(eta, lam)
+
+        elif scatter_value == 'POP':
+            return Fermi_POP.Fermi_moment_derivatives
+
+        elif scatter_value == 'IMP':
+            if scatter_value not in self.fermi_tables:
+                self.fermi_tables[scatter_value] = Screening_Table(progress=self.table_progress)
+
+            if prefactor:
+                return lambda eta: self.fermi_tables['IMP'].prefactor_derivatives(eta, fermi_IMP.screening_prefactor())
+
+            return lambda eta: self.fermi_tables['IMP'].derivatives(eta, fermi_IMP.screening_prefactor())
+
+
+    def get_eta(self, scatter_value, seebeck=None, density=None):
+        """
+        Reduced chemical potentials for an array of Seebeck coefficients or reduced carrier concentrations
+        (mechanisms depending only on eta), the inverse maps are built on first use
+
+        Input:
+        --------------------------
+        scatter_value: str
+            scattering option: acoustic deformation potential (ADP), polar optical phonon (POP, POP2 [simpler approach]), ionized impurity (IMP2 [simpler approac])
+        seebeck: float or ndarray (N), dtype: float
+            Seebeck coefficients in volt per Kelvin
+        density: float or ndarray (N), dtype: float
+            carrier concentrations divided by 8 pi (2 m_s k T)^1.5 / (3 h^3)
+
+        Output:
+        --------------------------
+        eta: float or ndarray (N), dtype: float
+            reduced chemical potentials
+        """
+        if seebeck is not None:
+            key = (scatter_value, 'seebeck'); ratio = reduced_seebeck; value = seebeck / (k / e)
+        else:
+            key = (scatter_value, 'density'); ratio = reduced_density; value = density
+
+        if key not in self.moment_inverses:
+            self.moment_inverses[key] = Moment_Inverse(self.get_moments(scatter_value), ratio)
+
+        return self.moment_inverses[key](value)
+
+
+    def calculation_scattering_parameters_list(self, temperature, carrier, eta, m_s, mu_0, beta, n_range, scatter_value, epsilon=None):
+        """
+        Calculation of the thermoelectric properties as function of the carrier concentration
+
+        Input:
+        --------------------------
+        temperature: float
+            temperature in Kelvin
+        carrier: float
+            carrier concentration in per centimeters cube
+        eta: float
+            reduced chemical potential
+        m_s: float
+            density of states effective mass in electron mass
+        beta: float
+            thermoelectric quality factor
+        n_range: ndarray (N), dtype: float
+            array of N carrier concentrations in per centimeter cube
+        scatter_value: str
+            scattering option: acoustic deformation potential (ADP), polar optical phonon (POP, POP2 [simpler approach]), ionized impurity (IMP, IMP2 [simpler approac])
+        epsilon: float
+            dielectric constant (only IMP)
+
+        Output:
+        --------------------------
+        mu_list, S_list, L_list, zT_list: lst
+            mobilities in centimeter cube per volt and second, Seebeck coefficients in microvolt per Kelvin, Lorenz
+            numbers in watts ohm per Kelvin squared and figures of merit (empty if not computable)
+        """
+        fermi_IMP = None
+        if scatter_value == 'IMP':
+            fermi_IMP = Fermi_IMP(m_s, epsilon, temperature, carrier)
+
+        moments = self.get_moments(scatter_value, fermi_IMP)
+        derivatives = self.get_moment_derivatives(scatter_value, fermi_IMP)
+
+        mu_list = []; zT_list = []; S_list = []; L_list = []
+        if carrier != 0:
+            prefactor = 8 * pi * (2 * m_s * m_e * k * temperature)**1.5 / (3 * h**3)
+
+            if scatter_value == 'IMP':
+                density = asarray(n_range) * 1e6
+
+                fprime = lambda eta: log_ratio_derivative(reduced_density, moments(eta), derivatives(eta))
+
+                # warm start from the previous sweep (e.g. the last temperature) or the power law limits
+                func = lambda eta: log_residual(prefactor * reduced_density(moments(eta)) / density)
+                inside = bracketed(func, -50., 1000.)
+                if not inside.all():
+                    self.report('The Hall carrier concentrations {} cm-3 are outside of the range of the reduced chemical potential from -50 to 1000!'.format(density[~inside] * 1e-6))
+
+                eta_0, source = self.continuation.seed(('IMP', 'density'), asymptotic_eta(reduced_density, density / prefactor, 2))
+                eta, converged, iterations = newton_bisection(func, full(len(n_range), -50.), full(len(n_range), 1000.), x0=None if eta_0 is None else clip(eta_0, -50., 1000.), fprime=fprime)
+                self.continuation.record(('IMP', 'density'), eta, source, iterations)
+                self.continuation.reference(('IMP', 'density'), None if source == 'bracket' else
+                                            lambda: newton_bisection(func, full(len(n_range), -50.), full(len(n_range), 1000.), fprime=fprime)[2])
+                if not converged[inside].all():
+                    self.report('The reduced chemical potential did not converge for the Hall carrier concentrations {} cm-3!'.format(density[inside & ~converged] * 1e-6))
+
+            else:
+                eta = self.get_eta(scatter_value, density=asarray(n_range) * 1e6 / prefactor)
+                if isnan(eta).any():
+                    self.report('The Hall carrier concentrations {} cm-3 are outside of the range of the reduced chemical potential from -50 to 1000!'.format(asarray(n_range)[isnan(eta)]))
+
+            M = moments(eta)
+            # the integrals underflow far in the non-degenerate limit, those points end up as NaN
+            with errstate(divide='ignore', invalid='ignore', over='ignore'):
+                if mu_0 != 0:
+                    mu_list = (mu_0 / M.tau * M.tau2 * 1E4).tolist()
+
+                S = k / e * (M.tau_S / M.tau) * 1E6
+                S_list = S.tolist()
+
+                omega = 8 * pi * e / 3 * (2 * m_e * k / h**2)**1.5 * M.tau
+
+                L = (k / e)**2 * (M.tau * M.tau_E2 - M.tau_E**2) / M.tau**2
+                L_list = L.tolist()
+
+                if beta != 0:
+                    zT_list = (S**2 / (L + (beta * omega)**-1) * 1E-12).tolist()
+
+        return mu_list, S_list, L_list, zT_list
+
+
+    def calculation_scattering_parameters(self, temperature, seebeck, carrier, mobility, thermal, scatter_value, epsilon=None):
+        """
+        Calculation of the thermoelectric properties for a single value
+
+        Input:
+        --------------------------
+        temperature: float
+            temperature in Kelvin
+        seebeck: float
+            Seebeck coefficient in microvolt per Kelvin
+        carrier: float
+            Hall carrier concentration in per centimeters cube
+        mobility: float
+            Hall mobility in centimeter cube per volt and second
+        thermal: float
+            total thermal conductivity in watts per meter and Kelvin
+        scatter_value: str
+            scattering option: acoustic deformation potential (ADP), polar optical phonon (POP, POP2 [simpler approach]), ionized impurity (IMP, IMP2 [simpler approac])
+        epsilon: float
+            dielectric constant (only IMP)
+
+        Output:
+        --------------------------
+        eta, m_star, mu_0, L, k_el, k_L, beta, zT: float
+            reduced chemical potential, density of states effective mass in electron mass, intrinsic mobility, Lorenz
+            number, electronic and lattice thermal conductivity, quality factor and figure of merit
+        """
+        m_star = 0; mu_0 = 0; k_el = 0; k_L = 0; beta = 0; zT = 0
+        if scatter_value in ['ADP', 'POP', 'POP2', 'IMP2']:
+
+            moments = self.get_moments(scatter_value)
+            eta = self.get_eta(scatter_value, seebeck=seebeck)
+            if isnan(eta):
+                self.report('The measurement at {} K (Seebeck coefficient {:g} microV/K) is outside of the range of the reduced chemical potential from -50 to 1000!'.format(
+                    temperature, seebeck * 1E6))
+
+            if carrier != 0:
+                # carrier = 8 pi (2 m_s k T)^1.5 / (3 h^3) tau^2 / tau2 solved for m_s
+                m_s = (3 * h**3 * carrier / (8 * pi * reduced_density(moments(eta))))**(2 / 3) / (2 * k * temperature)
+                m_star = m_s / m_e
+
+        elif scatter_value == 'IMP':
+            fermi_IMP = Fermi_IMP(m_e, epsilon, temperature, carrier)
+            moments = self.get_moments('IMP', fermi_IMP)
+            derivatives = self.get_moment_derivatives('IMP', fermi_IMP)
+            prefactor_derivatives = self.get_moment_derivatives('IMP', fermi_IMP, prefactor=True)
+
+            # residuals of the Seebeck coefficient and the carrier concentration as function of eta and
+            # u = ln(m_s / m_e), the screening prefactor is proportional to m_s
+            def residuals(x):
+                fermi_IMP.m_s = m_e * exp(x[1])
+                M = moments(x[0])
+                return [log_residual(reduced_seebeck(M) * k / e / seebeck),
+                        log_residual(8 * pi * (2 * fermi_IMP.m_s * k * temperature)**1.5 / (3 * h**3) * reduced_density(M) / carrier)]
+
+            def jacobian(x):
+                fermi_IMP.m_s = m_e * exp(x[1])
+                M = moments(x[0]); D = derivatives(x[0]); D_b = prefactor_derivatives(x[0])
+                return [[log_ratio_derivative(reduced_seebeck, M, D), log_ratio_derivative(reduced_seebeck, M, D_b)],
+                        [log_ratio_derivative(reduced_density, M, D), 1.5 + log_ratio_derivative(reduced_density, M, D_b)]]
+
+            # warm start from the previous solve or the limits of the power law lam = 2
+            eta_0 = asymptotic_eta(reduced_seebeck, seebeck / (k / e), 2)
+            m_s_0 = (3 * h**3 * carrier / (8 * pi * reduced_density(power_law_moments(eta_0, 2))))**(2 / 3) / (2 * k * temperature)
+            x_estimate = asarray([eta_0, log(m_s_0 / m_e)])
+            x_0, source = self.continuation.seed(('IMP', 'eta, m_s'), x_estimate)
+            if x_0 is None:
+                x_0 = x_estimate
+
+            (eta, u), converged, iterations = newton_system(residuals, jacobian, x_0, ftol=self.imp_tolerance)
+            if not converged and source == 'previous':
+                # the previous solution can be too far off, the result must not depend on the order of the solves
+                (eta, u), converged, cold_iterations = newton_system(residuals, jacobian, x_estimate, ftol=self.imp_tolerance)
+                iterations += cold_iterations
+
+            if not converged:
+                # bracketing fallback: eta is solved from the Seebeck coefficient for every mass and the mass from
+                # the carrier concentration with the total derivative of its residual
+                def eta_seebeck(u):
+                    fermi_IMP.m_s = m_e * exp(u)
+                    fprime = lambda eta: log_ratio_derivative(reduced_seebeck, moments(eta), derivatives(eta))
+                    return newton_bisection(lambda eta: log_residual(reduced_seebeck(moments(eta)) * k / e / seebeck), -50., 1000., fprime=fprime)[0]
+
+                def func_m_s(u):
+                    return residuals([eta_seebeck(u), u])[1]
+
+                def func_m_s_prime(u):
+                    (dF1_eta, dF1_u), (dF2_eta, dF2_u) = jacobian([eta_seebeck(u), u])
+                    return dF2_u - dF2_eta * dF1_u / dF1_eta
+
+                # eta_seebeck is NaN if the Seebeck coefficient is outside of the bracket of eta
+                inside = bracketed(func_m_s, log(1E-3), log(1E4))
+                if inside:
+                    u, converged, fallback_iterations = newton_bisection(func_m_s, log(1E-3), log(1E4), fprime=func_m_s_prime, xtol=self.imp_tolerance)
+                    iterations += fallback_iterations
+                    eta = eta_seebeck(u) if converged else nan
+
+            if converged:
+                self.continuation.record(('IMP', 'eta, m_s'), [eta, u], source, iterations)
+                # the cold start is the estimate, the residuals change fermi_IMP.m_s but the moments of the solution
+                # are computed with a new Fermi_IMP below
+                self.continuation.reference(('IMP', 'eta, m_s'), None if source != 'previous' else
+                                            lambda: newton_system(residuals, jacobian, x_estimate, ftol=self.imp_tolerance)[2])
+            elif not inside:
+                self.report('The measurement at {} K (Seebeck coefficient {:g} microV/K, Hall carrier concentration {:g} cm-3) is outside of the range of the reduced chemical potential from -50 to 1000 and the effective mass from 1E-3 to 1E4 m_e!'.format(
+                    temperature, seebeck * 1E6, carrier * 1E-6))
+                eta = nan; u = nan
+            else:
+                self.report('The effective mass for ionized impurity scattering could not be found!')
+                eta = nan; u = nan
+            m_s = m_e * exp(u)
+
+            m_star = m_s /m_e
+            moments = self.get_moments('IMP', Fermi_IMP(m_s, epsilon, temperature, carrier))
+
+        M = moments(eta)
+        if mobility != 0:
+            mu_0 = mobility * M.tau / M.tau2
+
+        L = (k / e)**2 * (M.tau * M.tau_E2 - M.tau_E**2) / M.tau**2
+
+        if carrier != 0 and mobility != 0:
+            k_el = temperature * L * e * carrier * mobility
+
+        if carrier != 0 and mobility != 0 and thermal != 0:
+            k_L = float(thermal) - k_el
+
+            zT = temperature * seebeck**2 * carrier * e * mobility / float(thermal)
+
+            beta = mu_0 * (m_s / m_e)**1.5 * temperature**2.5 / k_L
+
+        return eta, m_star, mu_0, L, k_el, k_L, beta, zT
+
+
+    def compute_scattering(self, compound, temperature, seebeck, carrier, mobility, thermal, epsilon, scatter_value):
+        """
+        Calculation of the thermoelectric properties of a single measurement
+
+        Input:
+        --------------------------
+        compound: str
+            name of the compound
+        temperature: float
+            temperature in Kelvin
+        seebeck: float
+            Seebeck coefficient in microvolt per Kelvin
+        carrier: float
+            Hall carrier concentration in per centimeters cube (0 or [] if not measured)
+        mobility: float
+            Hall mobility in centimeter cube per volt and second (0 or [] if not measured)
+        thermal: float
+            total thermal conductivity in watts per meter and Kelvin (0 or [] if not measured)
+        epsilon: float
+            dielectric constant (0 or [] if not measured, required for IMP)
+        scatter_value: str
+            scattering option: acoustic deformation potential (ADP), polar optical phonon (POP, POP2 [simpler approach]), ionized impurity (IMP, IMP2 [simpler approac])
+
+        Output:
+        ---------------------------
+        SPB_Data: Computed_Parameters
+            thermoelectric properties of the measurement
+        """
+        if carrier == []:
+            carrier = 0
+        if mobility == []:
+            mobility = 0
+        if thermal == []:
+            thermal = 0
+        if epsilon == []:
+            epsilon = 0
+
+        eta, m_star, mu_0, L, k_el, k_L, beta, zT = self.calculation_scattering_parameters(
+            temperature, seebeck * 1E-6, carrier * 1E6, mobility * 1E-4, thermal, scatter_value, epsilon)
+
+        return Computed_Parameters(compound, temperature, seebeck, carrier, mobility, thermal, epsilon, scatter_value,
+                                   eta, m_star, mu_0 * 1E4, L, k_el, k_L, beta, zT)
+
+
+    def compute_scattering_carrier(self, SPB_Data, n_range):
+        """
+        Calculation of the thermoelectric properties of a measurement as function of the carrier concentration
+
+        Input:
+        --------------------------
+        SPB_Data: Computed_Parameters
+            thermoelectric properties of the measurement (compute_scattering)
+        n_range: lst
+            N carrier concentrations in per centimeter cube (carrier_grid)
+
+        Output:
+        ---------------------------
+        SPB_List: Computed_Parameters_Carrier
+            thermoelectric properties as function of carrier concentration
+        """
+        mu_list, S_list, L_list, zT_list = self.calculation_scattering_parameters_list(
+            SPB_Data.temperature,
+            SPB_Data.carrier,
+            SPB_Data.chemical_potential,
+            SPB_Data.effective_mass,
+            SPB_Data.intrinsic_mobility * 1E-4,
+            SPB_Data.beta,
+            n_range,
+            SPB_Data.scatter,
+            SPB_Data.dielectric)
+
+        return Computed_Parameters_Carrier(SPB_Data.compound, SPB_Data.temperature, SPB_Data.effective_mass,
+                                           SPB_Data.intrinsic_mobility, SPB_Data.scatter, n_range, mu_list, S_list,
+                                           L_list, zT_list)
+
+
+    def imp_parameters(self, temperature, seebeck, carrier, epsilon):
+        """
+        Reduced chemical potentials and effective masses of many measurements for ionized impurity scattering, the
+        coupled solves of calculation_scattering_parameters for all measurements at once (measurements not converged
+        are solved one by one with the bracketing fallback)
+
+        Input:
+        --------------------------
+        temperature: ndarray (M), dtype: float
+            temperatures in Kelvin
+        seebeck: ndarray (M), dtype: float
+            Seebeck coefficients in volt per Kelvin
+        carrier: ndarray (M), dtype: float
+            Hall carrier concentrations in per meter cube
+        epsilon: float
+            dielectric constant
+
+        Output:
+        --------------------------
+        eta: ndarray (M), dtype: float
+            reduced chemical potentials
+        m_s: ndarray (M), dtype: float
+            density of states effective masses in kilogram
+        """
+        if 'IMP' not in self.fermi_tables:
+            self.fermi_tables['IMP'] = Screening_Table(progress=self.table_progress)
+        table = self.fermi_tables['IMP']
+        fermi_IMP = Fermi_IMP(m_e, epsilon, temperature, carrier)
+
+        # residuals and Jacobians of calculation_scattering_parameters for x = (eta, ln(m_s / m_e)) of every measurement
+        def screening(x):
+            fermi_IMP.m_s = m_e * exp(x[:, 1])
+            return fermi_IMP.screening_prefactor()
+
+        def residuals(x):
+            M = table(x[:, 0], screening(x))
+            return stack([log_residual(reduced_seebeck(M) * k / e / seebeck),
+                          log_residual(8 * pi * (2 * fermi_IMP.m_s * k * temperature)**1.5 / (3 * h**3) * reduced_density(M) / carrier)], axis=1)
+
+        def jacobian(x):
+            b = screening(x)
+            M = table(x[:, 0], b); D = table.derivatives(x[:, 0], b); D_b = table.prefactor_derivatives(x[:, 0], b)
+            return stack([stack([log_ratio_derivative(reduced_seebeck, M, D), log_ratio_derivative(reduced_seebeck, M, D_b)], axis=1),
+                          stack([log_ratio_derivative(reduced_density, M, D), 1.5 + log_ratio_derivative(reduced_density, M, D_b)], axis=1)], axis=1)
+
+        eta_0 = asymptotic_eta(reduced_seebeck, seebeck / (k / e), 2)
+        m_s_0 = (3 * h**3 * carrier / (8 * pi * reduced_density(power_law_moments(eta_0, 2))))**(2 / 3) / (2 * k * temperature)
+        x, converged, iterations = newton_systems(residuals, jacobian, stack([eta_0, log(m_s_0 / m_e)], axis=1), ftol=self.imp_tolerance)
+        eta = x[:, 0]; m_s = m_e * exp(x[:, 1])
+
+        for temp in flatnonzero(~converged):
+            eta[temp], m_star = self.calculation_scattering_parameters(temperature[temp], seebeck[temp], carrier[temp], 0, 0, 'IMP', epsilon)[:2]
+            m_s[temp] = m_star * m_e
+
+        return eta, m_s
+
+
+    def temperature_surface(self, T_range, seebeck_range, carrier_range, mobility_range, thermal_range, n_range, scatter_value, epsilon=None, progress=None):
+        """
+        Figure of merit as function of carrier concentration and temperature, and the optimum carrier concentration
+        at every temperature, evaluated as array operations on the whole grid
+
+        The measurements are inverted for all temperatures at once (for IMP the coupled solves of eta and m_s, see
+        imp_parameters), the reduced chemical potentials of the grid are found by one inversion of the reduced
+        carrier concentrations (for IMP on the sections of the table at the screening of every row, Screening_Rows).
+        Temperatures where the total thermal conductivity is not above L sigma T (no positive lattice thermal
+        conductivity) are reported and their figures of merit are NaN.
+
+        Input:
+        --------------------------
+        T_range: ndarray (M), dtype: float
+            temperatures in Kelvin
+        seebeck_range: ndarray (M), dtype: float
+            Seebeck coefficients in microvolt per Kelvin
+        carrier_range: ndarray (M), dtype: float
+            Hall carrier concentrations in per centimeter cube
+        mobility_range: ndarray (M), dtype: float
+            Hall mobilities in centimeter square per volt and second
+        thermal_range: ndarray (M), dtype: float
+            total thermal conductivities in watts per meter and Kelvin
+        n_range: lst
+            N carrier concentrations of the map in per centimeter cube
+        scatter_value: str
+            scattering option: acoustic deformation potential (ADP), polar optical phonon (POP, POP2 [simpler approach]), ionized impurity (IMP, IMP2 [simpler approac])
+        epsilon: float
+            dielectric constant (only IMP)
+        progress: function
+            called as progress(completed, total) with the number of inverted measurements plus points of the map,
+            an exception raised by it (e.g. to cancel) stops the calculation
+
+        Output:
+        --------------------------
+        X, Y, Z: ndarray (M, N), dtype: float
+            carrier concentrations, temperatures and figures of merit of the map
+        zT_range_exp, n_range_exp: ndarray (M), dtype: float
+            figure of merit and carrier concentration of the measurements
+        zT_range_opt, n_range_opt: ndarray (M), dtype: float
+            optimum figure of merit and carrier concentration
+        grids: dic
+            reduced chemical potential, Seebeck coefficient in microvolt per Kelvin, Lorenz number in watts ohm per
+            Kelvin squared and Hall mobility in centimeter square per volt and second of the map
+        """
+        T = asarray(T_range, dtype=float); seebeck = asarray(seebeck_range, dtype=float) * 1E-6
+        carrier = asarray(carrier_range, dtype=float) * 1E6; mobility = asarray(mobility_range, dtype=float) * 1E-4
+        thermal = asarray(thermal_range, dtype=float)
+        X, Y = meshgrid(n_range, T)
+
+        total = len(T) * (1 + len(n_range))
+        if scatter_value == 'IMP':
+            eta, m_s = self.imp_parameters(T, seebeck, carrier, epsilon)
+            M = self.fermi_tables['IMP'](eta, Fermi_IMP(m_s, epsilon, T, carrier).screening_prefactor())
+            m_star = m_s / m_e
+
+        else:
+            moments = self.get_moments(scatter_value)
+            eta = self.get_eta(scatter_value, seebeck=seebeck)
+            if isnan(eta).any():
+                self.report('The Seebeck coefficients {} microV/K at the temperatures {} K are outside of the range of the reduced chemical potential from -50 to 1000!'.format(
+                    seebeck[isnan(eta)] * 1E6, T[isnan(eta)]))
+            M = moments(eta)
+            m_star = (3 * h**3 * carrier / (8 * pi * reduced_density(M)))**(2 / 3) / (2 * k * T) / m_e
+
+        mu_0 = mobility * M.tau / M.tau2
+        k_L = thermal - T * (k / e)**2 * (M.tau * M.tau_E2 - M.tau_E**2) / M.tau**2 * e * carrier * mobility
+        zT = T * seebeck**2 * carrier * e * mobility / thermal
+        beta = mu_0 * m_star**1.5 * T**2.5 / k_L
+
+        # without a positive lattice thermal conductivity the quality factor (and the map) has no meaning
+        nonpositive = k_L <= 0
+        if nonpositive.any():
+            self.report('The total thermal conductivity is not above the electronic thermal conductivity L sigma T at the temperatures {} K, the figure of merit is not computed there!'.format(T[nonpositive]))
+            beta = where(nonpositive, nan, beta)
+
+        if progress is not None:
+            progress(len(T), total)
+
+        # reduced carrier concentrations of the grid, rows of temperatures and columns of carrier concentrations
+        prefactor = (8 * pi * (2 * m_star * m_e * k * T)**1.5 / (3 * h**3))[:, None]
+        density = X * 1E6
+
+        if scatter_value == 'IMP':
+            # screening of the rows as in calculation_scattering_parameters_list, the integrals of all rows are
+            # looked up on the sections of the table
+            screening = Fermi_IMP(m_star, epsilon, T, carrier * 1E-6).screening_prefactor()[:, None]
+            moments = Screening_Rows(self.fermi_tables['IMP'], screening[:, 0])
+            eta_grid = moments.inverse(reduced_density, density / prefactor)
+
+            # bracketed solve outside of the table
+            missing = ~isfinite(eta_grid)
+            if missing.any():
+                b = broadcast_to(screening, X.shape)[missing]; value = (density / prefactor)[missing]
+                moments_missing = lambda eta: self.fermi_tables['IMP'](eta, b)
+                fprime = lambda eta: log_ratio_derivative(reduced_density, moments_missing(eta), self.fermi_tables['IMP'].derivatives(eta, b))
+                eta_0 = clip(asymptotic_eta(reduced_density, value, 2), -50., 1000.)
+                func = lambda eta: log_residual(reduced_density(moments_missing(eta)) / value)
+                inside = bracketed(func, -50., 1000.)
+                if not inside.all():
+                    self.report('The Hall carrier concentrations {} cm-3 are outside of the range of the reduced chemical potential from -50 to 1000!'.format(unique(X[missing][~inside])))
+                eta_grid[missing], converged, iterations = newton_bisection(func, full(value.shape, -50.), full(value.shape, 1000.), x0=eta_0, fprime=fprime)
+                if not converged[inside].all():
+                    self.report('The reduced chemical potential did not converge for the Hall carrier concentrations {} cm-3!'.format(X[missing][inside & ~converged]))
+
+        else:
+            eta_grid = self.get_eta(scatter_value, density=density / prefactor)
+            if isnan(eta_grid).any():
+                self.report('The Hall carrier concentrations {} cm-3 are outside of the range of the reduced chemical potential from -50 to 1000!'.format(unique(X[isnan(eta_grid)])))
+
+        M = moments(eta_grid)
+        S = k / e * (M.tau_S / M.tau)
+        L = (k / e)**2 * (M.tau * M.tau_E2 - M.tau_E**2) / M.tau**2
+        omega = 8 * pi * e / 3 * (2 * m_e * k / h**2)**1.5 * M.tau
+        Z = S**2 / (L + (beta[:, None] * omega)**-1)
+        if progress is not None:
+            progress(total, total)
+
+        optimum = where(isfinite(Z), Z, -inf).argmax(axis=1)
+        zT_range_opt = Z[arange(len(T)), optimum]
+        n_range_opt = where(isfinite(zT_range_opt), asarray(n_range, dtype=float)[optimum], nan)
+
+        grids = {
+            'Chemical Potential' : eta_grid,
+            'Seebeck Coefficient' : S * 1E6,
+            'Lorenz Number' : L,
+            'Hall Mobility' : mu_0[:, None] / M.tau * M.tau2 * 1E4,
+        }
+
+        return X, Y, Z, zT, carrier * 1E-6, zT_range_opt, n_range_opt, grids
+
+
+def log_residual(ratio):
+    """
+    Logarithm of a computed over a measured quantity as residual of the solves, -inf or NaN without warnings where
+    the Fermi integrals underflow (the solvers treat them as outside of the solution)
+    """
+    with errstate(divide='ignore', invalid='ignore'):
+        return log(ratio)
+
+
+def carrier_grid(n_min, n_max):
+    """
+    Carrier concentrations of the sweeps, 1, 1.5, 2, ..., 9.5 times every decade from n_min and n_max
+
+    Input:
+    --------------------------
+    n_min: float
+        minimum carrier concentration in per centimeter cube
+    n_max: float
+        maximum carrier concentration in per centimeter cube
+
+    Output:
+    --------------------------
+    n_range: lst
+        carrier concentrations in per centimeter cube
+    """
+    n_range = []
+    for i in range(int(log10(n_max / n_min))):
+        for j in range(2, 20):
+            n_range.append(j / 2. * (n_min * 10**i))
+    n_range.append(n_max)
+
+    return n_range
+
+
+def sound_velocities(density, bulk, shear):
+    """
+    Longitudinal and transverse speed of sound in meter per second from the mass density in kilogram per meter cube
+    and the bulk and shear modulus in Pascal
+    """
+    return sqrt((bulk + 3/4 * shear) / density), sqrt(shear / density)
+
+
+def elastic_moduli(density, longV, transV):
+    """
+    Bulk and shear modulus in Pascal from the mass density in kilogram per meter cube and the longitudinal and
+    transverse speed of sound in meter per second
+    """
+    shear = transV**2 * density
+    return longV**2 * density - 3/4 * shear, shear
+
+
+def average_velocity(longV, transV):
+    """
+    Average speed of sound in meter per second
+    """
+    return (1/3. * (2 * transV**(-1) + longV**(-1)))**(-1)
+
+
+def debye_temperature(longV, transV, UC, NA):
+    """
+    Debye temperature in Kelvin from the speeds of sound in meter per second, the unit cell volume in meter cube and
+    the number of atoms per unit cell
+    """
+    return average_velocity(longV, transV) * hbar / k * (6 * pi**2 * NA / UC)**(1/3.)
+
+
+def integrate_Pohls(x_D):
+    Int = lambda x: x**4 * bose_window(x)
+    return integrate.quad(Int, 0, min(x_D, BOSE_CUTOFF))
+
+
+def integrate_Pohls_dyn(x_D):
+    Int = lambda x: x**3 * bose_window(x)
+    return integrate.quad(Int, 0, min(x_D, BOSE_CUTOFF))
+
+
+def integral_N_U(omega, T):
+    # integrated in the reduced phonon energy hbar omega / k T
+    scale = k * T / hbar
+    Int = lambda x: x**2 * bose_window(x)
+    integral, error = integrate.quad(Int, 0, min(omega / scale, BOSE_CUTOFF))
+    return integral * scale**3, error * scale**3
+
+
+def minimum_thermal_conductivity(model, UC, NA, longV, transV):
+    """
+    Minimum thermal conductivity at high temperature (600 K for the models of Pohls)
+
+    Input:
+    --------------------------
+    model: str
+        'Cahill-Pohl', 'Pohls', 'Dynamic', 'Diffusive' or 'Clarke'
+    UC: float
+        unit cell volume in meter cube
+    NA: float
+        number of atoms per unit cell
+    longV: float
+        longitudinal speed of sound in meter per second
+    transV: float
+        transverse speed of sound in meter per second
+
+    Output:
+    --------------------------
+    k_min: float
+        minimum thermal conductivity in watts per meter and Kelvin
+    """
+    DebyeT = debye_temperature(longV, transV, UC, NA)
+
+    if model == 'Cahill-Pohl':
+        return 0.5 * (pi / 6.)**(1/3.) * k * (NA / UC)**(2/3.) * (2 * transV + longV)
+
+    elif model == 'Pohls':
+        x_D = DebyeT / 600.
+        return 3 / (6**(2/3.) * pi**(1/3.)) * k**2 / hbar * (NA / UC)**(1/3.) * DebyeT / x_D**3 * integrate_Pohls(x_D)[0]
+
+    elif model == 'Dynamic':
+        x_D = DebyeT / 600.
+        return 3 / (6**(2/3.) * pi**(1/3.)) * k**2 / hbar * (NA / UC)**(1/3.) * DebyeT / x_D**2 * integrate_Pohls_dyn(x_D)[0]
+
+    elif model == 'Diffusive':
+        return 0.76 * (NA / UC)**(2/3.) * k * 1 / 3. * (2 * transV + longV)
+
+    elif model == 'Clarke':
+        return 0.93 * (NA / UC)**(2/3.) * k * 1 / 3. * (2 * transV + longV)
+
+    raise ValueError('Unknown model {} of the minimum thermal conductivity!'.format(model))
+
+
+def minimum_thermal_conductivity_temperature(model, temperature, UC, NA, DebyeT):
+    """
+    Minimum thermal conductivity as function of temperature
+
+    Input:
+    --------------------------
+    model: str
+        'Cahill-Pohl', 'Pohls' or 'Dynamic'
+    temperature: ndarray (N), dtype: float
+        temperatures in Kelvin
+    UC: float
+        unit cell volume in meter cube
+    NA: float
+        number of atoms per unit cell
+    DebyeT: float
+        Debye temperature in Kelvin
+
+    Output:
+    --------------------------
+    k_min: ndarray (N), dtype: float
+        minimum thermal conductivities in watts per meter and Kelvin
+    """
+    if model not in ['Cahill-Pohl', 'Pohls', 'Dynamic']:
+        raise ValueError('Unknown model {} of the minimum thermal conductivity!'.format(model))
+
+    k_min = zeros_like(asarray(temperature, dtype=float))
+    for i, T in enumerate(temperature):
+        x_D = DebyeT / T
+
+        if model == 'Cahill-Pohl':
+            v = DebyeT / (hbar / k * (6 * pi**2 * NA / UC)**(1/3.))
+            k_min[i] = (pi / 6.)**(1/3.) * k * (NA / UC)**(2/3.) * 3 * v / x_D**2 * integrate_Pohls_dyn(x_D)[0]
+
+        elif model == 'Pohls':
+            k_min[i] = 3 / (6**(2/3.) * pi**(1/3.)) * k**2 / hbar * (NA / UC)**(1/3.) * DebyeT / x_D**3 * integrate_Pohls(x_D)[0]
+
+        else:
+            k_min[i] = 3 / (6**(2/3.) * pi**(1/3.)) * k**2 / hbar * (NA / UC)**(1/3.) * DebyeT / x_D**2 * integrate_Pohls_dyn(x_D)[0]
+
+    return k_min
+
+
+def sites_klemens(sites, site, Molar, radius, fraction):
+    """
+    Add an element to the sites of the Klemens model, elements with missing data ([]) are skipped
+    """
+    if site != []:
+        if Molar !=[] and radius != [] and fraction != []:
+            if site in sites.keys():
+                sites[site]['count'] += 1
+                sites[site]['molar'].append(Molar)
+                sites[site]['radius'].append(radius)
+                sites[site]['fraction'].append(fraction)
+            else:
+                sites.update({site : {}})
+                sites[site].update({'count': 1})
+                sites[site].update({'molar': [Molar]})
+                sites[site].update({'radius': [radius]})
+                sites[site].update({'fraction': [fraction]})
+
+    return sites
+
+
+def klemens_gamma(sites, report=warn):
+    """
+    Gamma parameter of the Klemens model from the mass and radius fluctuations of all sites
+
+    Input:
+    -----------------
+    sites: dic
+        sites of sites_klemens
+    report: function
+        called with a message for every site that is ignored
+
+    Output:
+    -----------------
+    Gamma: float
+        Gamma parameter for Klemens model
+    """
+    Gamma = 0
+    for site in sites.keys():
+        if sites[site]['count'] > 1:
+            if sum(sites[site]['fraction']) > 1:
+                report(f'Fractions at site {site} are summed up above 1 and this site will be ignored for the calculation.')
+
+            else:
+                Molar = 0; Radius = 0; sum_Molar = 0; sum_radius = 0
+
+                for i in range(len(sites[site]['molar'])):
+                    sum_Molar += sites[site]['molar'][i] * sites[site]['fraction'][i]
+                    sum_radius += sites[site]['radius'][i] * sites[site]['fraction'][i]
+
+                for i in range(int(sites[site]['count'])):
+                    Molar += sites[site]['fraction'][i] * (1 - sites[site]['molar'][i] / sum_Molar)**2
+                    Radius += sites[site]['fraction'][i] * (1 - sites[site]['radius'][i] /sum_radius)**2
+
+                Gamma += Molar + Radius
+        else:
+            report(f'Please include at site {site} with two data points (Molar Mass, radius, and fraction). Site {site} will be ignored for the calculation.')
+
+    return Gamma
+
+
+def klemens_thermal(Gamma, thermal, UC, NA, longV, transV):
+    """
+    Lattice thermal conductivity with point defects (Klemens model)
+
+    Input:
+    -----------------
+    Gamma: float or ndarray (N), dtype: float
+        Gamma parameter
+    thermal: float or ndarray (N), dtype: float
+        lattice thermal conductivity without defects in watts per meter and Kelvin
+    UC: float or ndarray (N), dtype: float
+        unit cell volume in meter cube
+    NA: float or ndarray (N), dtype: float
+        number of atoms per unit cell
+    longV, transV: float or ndarray (N), dtype: float
+        longitudinal and transverse speed of sound in meter per second
+
+    Output:
+    -----------------
+    k_def: float or ndarray (N), dtype: float
+        lattice thermal conductivity with defects in watts per meter and Kelvin
+    """
+    u = asarray(((6 * pi**5 * UC**2 / NA**2)**(1/3.) / 2. / k / average_velocity(longV, transV) * Gamma * thermal)**(1/2.))
+    k_def = where(u > 0, arctan(u) / where(u > 0, u, 1) * thermal, thermal)
+    if k_def.ndim == 0:
+        return k_def[()]
+
+    return k_def
+
+
+def klemens_fraction(sites, frac_space, thermal, thermal2, UC, UC2, NA, NA2, longV, longV2, transV, transV2, site=1.0):
+    """
+    Lattice thermal conductivity as function of the fraction of the second element at a site, all properties are
+    interpolated linearly between the undoped and the doped compound
+
+    Input:
+    -----------------
+    sites: dic
+        sites of sites_klemens, the site needs two elements
+    frac_space: ndarray (N), dtype: float
+        fractions of the second element
+    thermal, thermal2: float
+        lattice thermal conductivity of the undoped and doped compound in watts per meter and Kelvin
+    UC, UC2: float
+        unit cell volumes in meter cube
+    NA, NA2: float
+        numbers of atoms per unit cell
+    longV, longV2, transV, transV2: float
+        longitudinal and transverse speeds of sound in meter per second
+    site: float
+        site of the substitution
+
+    Output:
+    -----------------
+    k_def: ndarray (N), dtype: float
+        lattice thermal conductivities in watts per meter and Kelvin
+    """
+    f = asarray(frac_space, dtype=float)
+    molar = sites[site]['molar']; radius = sites[site]['radius']
+
+    Molar_avg = molar[0] * (1 - f) + molar[1] * f
+    radius_avg = radius[0] * (1 - f) + radius[1] * f
+
+    Gamma = (1 - f) * (1 - molar[0] / Molar_avg)**2 + f * (1 - molar[1] / Molar_avg)**2
+    Gamma += (1 - f) * (1 - radius[0] / radius_avg)**2 + f * (1 - radius[1] / radius_avg)**2
+
+    return klemens_thermal(Gamma, thermal * (1 - f) + thermal2 * f, UC * (1 - f) + UC2 * f, NA * (1 - f) + NA2 * f,
+                           longV * (1 - f) + longV2 * f, transV * (1 - f) + transV2 * f)
+
+
+def callaway_thermal(temperature_range, UC, NA, longV, transV, M_avg=5E-26):
+    """
+    Lattice thermal conductivity of the Callaway model with Umklapp and normal scattering
+
+    Input:
+    -----------------
+    temperature_range: ndarray (N), dtype: float
+        temperatures in Kelvin
+    UC: float
+        unit cell volume in meter cube
+    NA: float
+        number of atoms per unit cell
+    longV, transV: float
+        longitudinal and transverse speed of sound in meter per second
+    M_avg: float
+        average atomic mass in kilogram
+
+    Output:
+    -----------------
+    k_L: ndarray (N), dtype: float
+        lattice thermal conductivities in watts per meter and Kelvin
+    """
+    v_avg = average_velocity(longV, transV)
+    omega_max = (6 * pi**2 / UC)**(1/3.) * v_avg
+
+    k_L = zeros_like(asarray(temperature_range), dtype=float)
+    for i, T in enumerate(temperature_range):
+        tau_x = k**2 * (UC / NA) * T**2 / hbar**2 / v_avg**2 + (UC / NA / 6 / pi**2)**(1/3.) * exp(hbar * (6 * pi**2 * NA / UC)**(1/3.) * v_avg / 3. / k / T)
+        C1 = hbar**2 / k**2 / T**3 / 2 / pi**2 * v_avg**2 * M_avg
+        k_L[i] = C1 / tau_x * integral_N_U(omega_max, T)[0]
+
+    return k_L
@@ -0,0 +1,280 @@
+from tkinter import OptionMenu, Button, Checkbutton, Label, Frame, Toplevel
+from tkinter import RIDGE, DISABLED
+from tkinter import messagebox, filedialog
+from tkinter import StringVar, IntVar
+
+from numpy import zeros_like, zeros, asarray
+
+from scipy import constants
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg, NavigationToolbar2Tk)
+from matplotlib.figure import Figure
+
+from Widgets import EntryItem, Entries
+from ResultStore import Result_Table
+
+###Physical constants
+k = constants.k
+e = constants.e
+
+
+class Thermal_Window:
+    """
+    Window to separate the electronic and phononic contribution to the thermal conductivity (Thermal menu)
+
+    Input:
+    -----------------------------
+    app: MainApplication
+        main application (fonts, colours, entry checks and settings of the thermal plots)
+    """
+    def __init__(self, app):
+        """
+        Compute electronic and phononic contribution to the thermal conductivity using fitted electrical resistivity/conductivity
+        and Seebeck coefficient plus total thermal conductivity
+        """
+        self.app = app
+        self.thermal_window = Toplevel()
+        self.thermal_window.configure(bg=self.app._from_rgb((241, 165, 193)))
+        self.thermal_window.geometry("1300x550")
+        self.thermal_window.iconbitmap('icon_spb.ico')
+
+        data_input = Frame(self.thermal_window, height=268, width=585, bg=self.app._from_rgb((191, 112, 141)))
+        data_input.grid(row=4, column=0, columnspan=3, rowspan=4, pady=(10, 5), padx=(10, 5))
+
+        # Create Labels
+        example = Label(self.thermal_window, text='Provide polynominial fitting coefficients of electron transport and Seebeck coefficient', relief=RIDGE, anchor='w')
+        example.grid(row=0, column=0, columnspan=3, padx=10, pady=(30, 8))
+        example['font'] = self.app.font_window
+
+        self.coefficient_options = [
+            '1', '2', '3', '4', '5', '6'
+        ]
+        self.initial_seebeck_coefficient = StringVar(); self.initial_seebeck_coefficient.set(self.coefficient_options[0])
+        self.initial_electrical_coefficient = StringVar(); self.initial_electrical_coefficient.set(self.coefficient_options[0])
+
+        self.seebeck_coeff = Entries(self.thermal_window, self.initial_seebeck_coefficient, 1)
+        self.seebeck_coeff.create_menu('Seebeck Coefficient Coefficients / mu V K-1', 39, self.coefficient_options)
+        self.initial_seebeck_coefficient.trace('w', self.seebeck_coeff.update_entries)
+
+        self.electrical_coeff = Entries(self.thermal_window, self.initial_electrical_coefficient, 2)
+        self.electrical_coeff.create_menu('Electrical resistivity (conductivity) / mOhm cm (S / cm)', 9, self.coefficient_options)
+        self.initial_electrical_coefficient.trace('w', self.electrical_coeff.update_entries)
+
+        resistivity_label = Label(self.thermal_window, text='Check box if polynominal is resistivity', relief=RIDGE, anchor='w')
+        resistivity_label.grid(row=3, column=0, padx=10, pady=(10, 8), ipadx=55)
+
+        self.var_resistivity = IntVar()
+        check_resistivity = Checkbutton(self.thermal_window, text='Resistivity', variable=self.var_resistivity)
+        check_resistivity.grid(row=3, column=1, pady=10)
+
+        load_thermal = Label(self.thermal_window, text='Upload experimental total thermal conductivity', relief=RIDGE, anchor='w')
+        load_thermal.grid(row=4, column=0, padx=10, pady=(10, 8), ipadx=5)
+        load_thermal['font'] = self.app.font_window
+
+        btn_upload_thermal = Button(self.thermal_window, text='Upload', command=self.upload_thermal_data, bg=self.app._from_rgb((122, 138, 161)))
+        btn_upload_thermal.grid(row=5, column=0, padx=10, pady=10, ipadx=85)
+        btn_upload_thermal['font'] = self.app.font_window
+
+        self.var_thermal_upload = IntVar()
+        check_thermal_upload = Checkbutton(self.thermal_window, text='Upload Completed', variable=self.var_thermal_upload, state=DISABLED)
+        check_thermal_upload.grid(row=5, column=1, pady=10, columnspan=2)
+
+        btn_plot = Button(self.thermal_window, text='Plot', command=self.plot_thermal_contribution, bg=self.app._from_rgb((118, 61, 76)), fg='white')
+        btn_plot.grid(row=6, column=0, padx=10, pady=10, ipadx=95)
+        btn_plot['font'] = self.app.font_window
+
+        btn_save = Button(self.thermal_window, text='Save', command=self.save_thermal_contribution, bg=self.app._from_rgb((122, 138, 161)))
+        btn_save.grid(row=6, column=2, padx=10, pady=10, ipadx=35)
+        btn_save['font'] = self.app.font_window
+
+        btn_close = Button(self.thermal_window, text='Close Window', command=self.close_thermal)
+        btn_close.grid(row=7, column=1, columnspan=2, padx=10, pady=10, ipadx=35)
+        btn_close['font'] = self.app.font_window
+
+        self.save_menu = EntryItem(self.thermal_window, 'Save', row=6, column=1, pady=5, ipadx=10, options=self.app.save_options)
+        self.save_menu.create_MenuOption()
+        self.save_menu.font(self.app.font_window)
+
+        self.scattering_menu_thermal = OptionMenu(self.thermal_window, self.app.scattering_menu.initial_val, *self.app.scattering_options)
+        self.scattering_menu_thermal.grid(row=7, column=0, padx=10, pady=10)
+        self.scattering_menu_thermal['font'] = self.app.font_window
+
+        self.create_empty_thermal_plot()
+
+
+    def get_thermal_contribution(self):
+        """
+        Compute the thermal contributions using the total thermal conductivity, electron transport and Seebeck 
+        coefficient as function of temperature
+
+        Output:
+        --------------------------
+        k_el: ndarray (N), dtype: float
+            array of N electronic contributions to the thermal conductivity in watts per meter and Kelvin
+        kpho: ndarray (N), dtype: float
+            array of N phononic contributions to the thermal conductivity in watts per meter and Kelvin
+        """
+        scatter_value = self.app.get_scattering()
+        if scatter_value == []:
+            return [], []
+
+        seebeck_range = self.seebeck_coeff.get_thermoelectric_parameters(self.temperature_k_tot)
+        if seebeck_range == []:
+            messagebox.showerror('The Seebeck coefficient is not correctly defined!')
+            return [], []
+
+        if max(seebeck_range) > 1500 or min(seebeck_range) < 1:
+            messagebox.showerror('Seebeck coefficient is below 1 or above 1500 mu V K-1.  Calculations are not feasible!  Change your parameters!')
+            return [], []
+
+        electrical_range = self.electrical_coeff.get_thermoelectric_parameters(self.temperature_k_tot)
+        if electrical_range == []:
+            messagebox.showerror('The electron transport is not correctly defined!')
+            return [], []
+
+        print(seebeck_range, electrical_range)
+        if scatter_value == 'IMP':
+            L_range = zeros(len(self.temperature_k_tot), dtype=float)
+            for i in range(len(self.temperature_k_tot)):
+                _, _, _, L_range[i], _, _, _, _ = self.app.calculation_scattering_parameters(self.temperature_k_tot[i], seebeck_range[i] * 1e-6, 0, 0, 0, scatter_value)
+
+        else:
+            M = self.app.spb.get_moments(scatter_value)(self.app.spb.get_eta(scatter_value, seebeck=asarray(seebeck_range) * 1e-6))
+            L_range = (k / e)**2 * (M.tau * M.tau_E2 - M.tau_E**2) / M.tau**2
+
+        if self.var_resistivity.get() == 1:
+            k_el = self.temperature_k_tot * L_range * 1e5 / asarray(electrical_range)
+
+        else:
+            k_el = self.temperature_k_tot * L_range * 100 * asarray(electrical_range)
+
+        return k_el, self.thermal_total - k_el
+
+
+    def store_thermal(self, temperature, total, electronic, phononic):
+        """
+        Keep the thermal conductivity contributions in the results of the application
+
+        Input:
+        ------------------------
+        temperature: ndarray (N), dtype: float
+            array of N temperatures in Kelvin
+        total: ndarray (N), dtype: float
+            array of N total thermal conductivities in watts per meter and Kelvin
+        electronic: ndarray (N), dtype: float
+            array of N electronic contributions in watts per meter and Kelvin
+        phononic: ndarray (N), dtype: float
+            array of N phononic contributions in watts per meter and Kelvin
+        """
+        self.app.results.put('thermal', Result_Table(
+            {
+                'temperature' : temperature,
+                'total thermal conductivity' : total,
+                'electronic thermal conductivity' : electronic,
+                'phononic thermal conductivity' : phononic
+            },
+            'Temperature / K, Total Thermal Conductivity / W m-1 K-1, Electronic Thermal Conductivity / W m-1 K-1, Phononic Thermal Conductivity / W m-1 K-1'))
+
+
+    def plot_thermal_contribution(self):
+        """
+        Plot the total thermal conductivity, electronic and phononic contribution as function of temperature in one graph
+        """
+        if self.var_thermal_upload.get()  == 0:
+            return
+
+        else:
+            kel, kpho = self.get_thermal_contribution()
+
+            if len(kel) == 0:
+                return
+
+            self.store_thermal(self.temperature_k_tot, self.thermal_total, kel, kpho)
+            plt.rcParams["font.family"] = self.app.initial_font_thermal.get()
+            plt.rcParams.update({'font.size': self.app.font_size_thermal.get()})
+            
+            self.fig_thermal = Figure(figsize=(self.app.size_x_thermal.get(), self.app.size_y_thermal.get()), dpi=self.app.dpi_thermal.get())
+            ax1 = self.fig_thermal.add_axes([self.app.size_x_space_thermal.get(), self.app.size_y_space_thermal.get(), self.app.size_x_length_thermal.get(), self.app.size_y_length_thermal.get()])
+            ax1.plot(self.temperature_k_tot, self.thermal_total, c='k', marker='o', label='Total')
+            ax1.plot(self.temperature_k_tot, kel, c='r', marker='^', label=r'$\kappa_{el}$')
+            ax1.plot(self.temperature_k_tot, kpho, c='b', marker='*', label=r'$\kappa_{pho}$')
+            ax1.set_xlabel('Temperature / K')
+            ax1.set_ylabel('Thermal Conductivity / W m$^{-1}$ K$^{-1}$', fontsize=12)    
+            ax1.set_ylim(0, max(self.thermal_total) * 1.1)   
+            ax1.legend()
+
+
+            self.canvas_thermal = FigureCanvasTkAgg(self.fig_thermal, master=self.thermal_window)
+            self.canvas_thermal.draw()
+            self.plot_widget_thermal = self.canvas_thermal.get_tk_widget()
+            self.plot_widget_thermal.grid(row=3, column=3, columnspan=15, rowspan=6)
+
+            toolbar_frame = Frame(self.thermal_window) 
+            toolbar_frame.grid(row=10,column=2,columnspan=4) 
+            toolbar = NavigationToolbar2Tk(self.canvas_thermal, toolbar_frame)
+            toolbar.update()
+
+
+    def create_empty_thermal_plot(self):
+        """
+        Create an emplty plot at the start for the thermal conductivity
+        """
+
+        plt.rcParams["font.family"] = self.app.initial_font_thermal.get()
+        plt.rcParams.update({'font.size': self.app.font_size_thermal.get()})
+
+        self.fig_thermal = Figure(figsize=(self.app.size_x_thermal.get(), self.app.size_y_thermal.get()), dpi=self.app.dpi_thermal.get())
+        self.canvas_thermal = FigureCanvasTkAgg(self.fig_thermal, master=self.thermal_window)
+        self.canvas_thermal.draw()
+        self.plot_widget_thermal = self.canvas_thermal.get_tk_widget()
+        self.plot_widget_thermal.grid(row=3, column=3, columnspan=15, rowspan=6)
+
+        ax1 = self.fig_thermal.add_axes([self.app.size_x_space_thermal.get(), self.app.size_y_space_thermal.get(), self.app.size_x_length_thermal.get(), self.app.size_y_length_thermal.get()])
+        ax1.set_xlabel('Temperature / K')
+        ax1.set_xlim(300, 800)
+        ax1.set_ylabel('Thermal Conductivity / W m$^{-1}$ K$^{-1}$', fontsize=12)
+        ax1.set_ylim(0, 10)
+
+        toolbar_frame = Frame(self.thermal_window) 
+        toolbar_frame.grid(row=10,column=2,columnspan=4) 
+        toolbar = NavigationToolbar2Tk(self.canvas_thermal, toolbar_frame)
+        toolbar.update()
+
+
+    def save_thermal_contribution(self):
+        """
+        Save the total thermal conductivity, electronic and phononic contribution, and temperature
+        """
+        self.app.save_result('thermal', save_value=self.save_menu.initial_val.get())
+
+
+    def upload_thermal_data(self):
+        """
+        Upload experimental total thermal conductivity as function of temperature in a .csv file
+        First column: temperature in Kelvin
+        Second column: total thermal conductivity in watts per meter and Kelvin
+        """
+        file_name = filedialog.askopenfilename(title='Open File', filetypes=[('CSV (comma delimited)', '*.csv')])
+
+        if file_name == '':
+            return
+
+        with open(file_name) as fil:
+            data = fil.readlines()
+
+        self.temperature_k_tot = zeros(len(data) - 1, dtype=float); self.thermal_total = zeros_like(self.temperature_k_tot)
+        
+        for i in range(1, len(data)):
+            self.temperature_k_tot[i - 1] = data[i].split(',')[0]
+            self.thermal_total[i - 1] = data[i].split(',')[1]
+
+        self.var_thermal_upload.set(1)
+
+
+    def close_thermal(self):
+        """
+        Close the thermal window and remove its results
+        """
+        self.app.results.discard('thermal')
+        self.thermal_window.destroy()
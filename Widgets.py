@@ -0,0 +1,306 @@
+from tkinter import OptionMenu, Label, Entry
+from tkinter import END, RIDGE, NORMAL
+from tkinter import messagebox
+from tkinter import StringVar
+
+
+def check_number(param, name, min_value, max_value, mandatory):
+    """
+    Check if the number in the entry widget is in the approriate range
+
+    Input:
+    -----------------------------
+    param: int
+        value in the entry
+    name: str
+        name of the thermoelectric property
+    min_value: float
+        minimum allowed value
+    max_value: float
+        maximum allowed value
+    mandatory: boolean 
+        if true, the entry widget is mandatory for the thermoelectric calculations, else an empty list will be returned
+    
+    Output:
+    -----------------------------------
+    param: float
+        value in the entry if it is a number and in the required range, else an empty list will be returned
+    """
+    if param.replace('.', '', 1).replace('e', '', 1).replace('+', '', 2).replace('-', '', 2).replace('E', '', 1).isdigit():
+        if min_value < float(param) and max_value > float(param):
+            return float(param)
+        else:
+            messagebox.showerror(
+                message='{} is below {} or above {}!  Calculations will not work, please check if values are correct!'.format(name, min_value, max_value))
+            return []
+    else:
+        if mandatory:
+            messagebox.showerror(message='{} is not a number or empty!'.format(name))
+            return []
+        else:
+            return []
+
+
+class EntryItem:
+    """
+    Create an entry widget in Tkinter including a label
+
+    Input:
+    --------------------------
+    parent: parent
+        window
+    name: str
+        name of the entry
+    row: int
+        row in the window
+    column: int
+        column in the window
+    padx: int
+        pixels to pad widget horizontally
+    pady: int
+        pixels to pad widget vertically
+    width: int
+        width of the widget
+    columnspan: int
+        number of columns widget takes up
+    state: str
+        Normal or disabled
+    ipadx: int
+        pixels to pad widget horizontally inside the widget's borders
+    options: list
+        list of different options
+    """
+    def __init__(self, parent, name, row=0, column=1, padx=10, pady=6, width=20, columnspan=1, state=NORMAL, ipadx=0, options=['0']):
+        self.parent = parent
+        self.name = name
+        self.row = row
+        self.column = column
+        self.padx = padx
+        self.pady = pady
+        self.width = width
+        self.columnspan = columnspan
+        self.state = state
+        self.ipadx = ipadx
+        self.options = options
+        self.initial_val = StringVar()
+        self.var = StringVar()
+        self.entry = Entry(self.parent, textvariable=self.var, state=self.state, width=self.width)
+        self.label = Label(self.parent, text=name, relief=RIDGE, anchor='w')
+        self.menu = OptionMenu(self.parent, self.initial_val, *self.options)
+
+
+    def create_EntryItem(self, padx_label=10, pady_label=6, ipadx_label=0):
+        """
+        Create entry widget
+
+        Input:
+        --------------------------
+        padx_label: int
+            pixels to pad widget horizontally of the label
+        pady_label: int
+            pixels to pad widget vertically of the label
+        ipadx_label: int
+            pixels to pad widget horizontally inside the widget's borders
+        """
+        self.entry.grid(row=self.row, column=self.column, columnspan=self.columnspan, padx=self.padx, pady=self.pady, ipadx=self.ipadx)
+        self.label.grid(row=self.row, column=self.column-1, columnspan=self.columnspan, padx=padx_label, pady=pady_label, ipadx=ipadx_label)
+
+
+    def set_name(self, new_name='NaN'):
+        """
+        Change the variable name
+
+        Input:
+        ------------------------
+        new_name: str
+            Name of the variable
+        """
+        self.var.set(new_name)
+
+
+    def delete(self):
+        """
+        Delete the entry
+        """
+        self.entry.delete(0, END)
+
+
+    def entry_forget(self):
+        """
+        Remove entry from grid
+        """
+        self.entry.grid_forget()
+
+
+    def set_menu(self, name):
+        """
+        Change the initial value of a menu widget
+
+        Input:
+        ------------------------
+        name: str
+            name of the initial value for the menu widget
+        """
+        self.initial_val.set(name)
+
+
+    def set_entry(self):
+        """
+        Place entry widget on the window
+        """
+        self.entry.grid(row=self.row, column=self.column, columnspan=self.columnspan, padx=self.padx, pady=self.pady, ipadx=self.ipadx)
+
+
+    def set_label(self, padx_label=10, pady_label=6, ipadx_label=0):
+        """
+        Place the label widget on the window
+
+        Input:
+        -------------------
+        padx_label: int
+            pixels to pad widget horizontally of the label
+        pady_label: int
+            pixels to pad widget vertically of the label
+        ipadx_label: int
+            pixels to pad widget horizontally inside the widget's borders
+        """
+        self.label.grid(row=self.row, column=self.column-1, columnspan=self.columnspan, padx=padx_label, pady=pady_label, ipadx=ipadx_label)
+
+
+    def create_MenuOption(self):
+        """
+        Create a menu widget with various options
+        """
+        self.initial_val.set(self.options[0])
+        self.menu = OptionMenu(self.parent, self.initial_val, *self.options)
+        self.menu.grid(row=self.row, column=self.column, columnspan=self.columnspan, padx=self.padx, pady=self.pady, ipadx=self.ipadx)
+
+
+    def font(self, new_font):
+        """
+        Change the font menu widget
+
+        Input:
+        ---------------------
+        new_font: str
+            new font
+        """
+        self.menu['font'] = new_font
+
+
+class Entries:
+    """
+    Create and update entry widget
+
+    Input:
+    ----------------------------
+    window: window
+        window to include widget
+    initial_var: str
+        initial variable 
+    row: int
+        row for menu
+    """
+    def __init__(self, window, initial_var, row):
+        self.window = window
+        self.initial_var = initial_var
+        self.row = row
+        self.entries = [Entry(self.window) for i in range(int(self.initial_var.get()))]
+        self.labels = [Label(self.window) for i in range(int(self.initial_var.get()))]
+
+    def create_entry(self, row, column, number):
+        """
+        Create entry widget
+
+        Input:
+        ---------------------------------
+        row: int
+            row in the window to place the widget
+        column: int
+            column in the window to place the widget
+        number: int
+            coefficient of the temperature of the polynominal fit
+
+        Output:
+        ------------------------------------
+        entry: widget
+            entry widget
+        label: widget
+            label widget
+        """
+        entry = Entry(self.window, width=10)
+        entry.grid(row=row, column=column, pady=9)
+        label = Label(self.window, text='* T^{}'.format(number))
+        label.grid(row=row, column=column+1, pady=10)
+        return entry, label
+
+    def update_entries(self, *args):
+        """
+        Update entry widget
+        """
+        [ent.grid_forget() for ent in self.entries]
+        [lab.grid_forget() for lab in self.labels]
+        self.entries = [Entry(self.window) for i in range(int(self.initial_var.get()))]
+        self.labels = [Label(self.window) for i in range(int(self.initial_var.get()))]
+        for col in range(int(self.initial_var.get())):
+            self.entries[col], self.labels[col] = self.create_entry(self.row, 2 + 2 * col, col)
+
+    def create_menu(self, name, x_add, options):
+        """
+        Create a menu widget to define the number of polynominal functions
+
+        Input:
+        -------------------------------
+        name: str
+            label of the menu widget
+        x_add: int
+             pixels to pad widget horizontally inside widget's borders
+        options: lst
+            possible options for polynominal function
+        """
+        label_start = Label(self.window, text=name, relief=RIDGE, anchor='w')
+        label_start.grid(row=self.row, column=0, padx=10, pady=10, ipadx=x_add)
+        coefficient_menu = OptionMenu(self.window, self.initial_var, *options)
+        coefficient_menu.grid(row=self.row, column=1, padx=10, pady=9)
+        self.entries[0] = Entry(self.window, width=10)
+        self.entries[0].grid(row=self.row, column=2, pady=9)
+        self.labels[0] = Label(self.window, text='* T^0')
+        self.labels[0].grid(row=self.row, column=3, pady=10)
+
+    def get_thermoelectric_parameters(self, T_range):
+        """
+        Get the polynominal parameters from the entry widgets using the coefficients
+
+        Input:
+        -------------------------
+        T_range: ndarray (N), dtype: float
+            arrays of temperatures
+
+        Output:
+        ------------------------
+        param: lst
+            list of temperature-dependent thermoelectric parameters
+        """
+        param = []
+        for temp in T_range:
+            accumulator = 0
+            for col in range(len(self.entries)):
+                coeff = check_number(self.entries[col].get(), 'Coefficient {}'.format(col), -1E40, 1E40, True)
+                if coeff == []:
+                    return []
+                else:
+                    accumulator += coeff * temp**col
+            param.append(accumulator)
+
+        return param
+
+    def get_coefficients(self):
+        """
+        Get the coefficients of the polynominal fit (checked by get_thermoelectric_parameters)
+
+        Output:
+        ------------------------
+        coeff: lst
+            coefficients of T^0, T^1, ...
+        """
+        return [float(ent.get()) for ent in self.entries]
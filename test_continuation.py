@@ -0,0 +1,51 @@
+from RootFinding import Continuation, newton_bisection
+from SPBCore import SPB_Model, carrier_grid
+
+
+def test_reference_solves_count_saved_iterations():
+    continuation = Continuation(reference_interval=2)
+    func = lambda x: x**3 - 8.
+    fprime = lambda x: 3 * x**2
+    cold_solve = lambda: newton_bisection(func, 0., 100., fprime=fprime)[2]
+
+    for i in range(5):
+        x_0, source = continuation.seed('x', 50.)
+        x, converged, iterations = newton_bisection(func, 0., 100., x0=x_0, fprime=fprime)
+        continuation.record('x', x, source, iterations)
+        continuation.reference('x', cold_solve)
+
+    stats = continuation.stats()['x']
+    assert stats['estimate']['reference']['solves'] == 1
+    assert stats['previous']['solves'] == 4
+    assert stats['previous']['reference']['solves'] == 2
+    assert stats['saved'] > 0
+
+
+def test_estimated_saved_iterations_without_reference_solves():
+    continuation = Continuation()
+    for i, iterations in enumerate([12, 3, 4]):
+        x_0, source = continuation.seed('x', 1. if i == 0 else None)
+        continuation.record('x', 2., source, iterations)
+        continuation.reference('x', lambda: 1 / 0)
+
+    stats = continuation.stats()['x']
+    assert 'reference' not in stats['previous']
+    assert stats['saved'] == (12 - 3.5) * 2
+
+
+def test_saved_iterations_of_imp_sweep():
+    model = SPB_Model()
+    model.continuation = Continuation(reference_interval=16)
+    n_range = carrier_grid(1e18, 1e21)
+    for temperature in [300., 350., 400., 450.]:
+        eta, m_star, mu_0, L, k_el, k_L, beta, zT = model.calculation_scattering_parameters(
+            temperature, 150e-6 + temperature * 1e-7, 2e25, 50e-4, 2.0, 'IMP', 200)
+        model.calculation_scattering_parameters_list(temperature, 2e19, eta, m_star, mu_0, beta, n_range, 'IMP', 200)
+
+    stats = model.continuation.stats()
+    for key in [('IMP', 'density'), ('IMP', 'eta, m_s')]:
+        assert stats[key]['saved'] is not None
+        assert stats[key]['previous']['reference']['solves'] >= 1
+    assert stats[('IMP', 'density')]['saved'] > 0
+    assert stats[('IMP', 'density')]['previous']['mean'] < stats[('IMP', 'density')]['previous']['reference']['cold']
+    assert stats[('IMP', 'eta, m_s')]['saved'] >= 0
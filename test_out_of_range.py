@@ -0,0 +1,55 @@
+import warnings
+
+from numpy import asarray, isfinite, isnan
+
+from SPBCore import SPB_Model
+
+
+def test_imp_sweep_reports_carrier_concentrations_outside_of_the_bracket():
+    reports = []
+    model = SPB_Model(report=reports.append)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        eta, m_star, mu_0, L, k_el, k_L, beta, zT = model.calculation_scattering_parameters(
+            300., 180e-6, 2e25, 50e-4, 2.0, 'IMP', 200)
+        mu, S, L, zT = model.calculation_scattering_parameters_list(300., 2e19, eta, m_star, mu_0, beta, [1e18, 1e24], 'IMP', 200)
+
+    assert isfinite(S[0]) and isnan(S[1])
+    assert reports == ['The Hall carrier concentrations [1.e+24] cm-3 are outside of the range of the reduced chemical potential from -50 to 1000!']
+
+
+def test_imp_measurement_outside_of_the_bracket_is_reported():
+    reports = []
+    model = SPB_Model(report=reports.append)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        eta, m_star = model.calculation_scattering_parameters(9000., 0.11e-6, 1.1e14, 50e-4, 2.0, 'IMP', 1.5)[:2]
+
+    assert isnan(eta) and isnan(m_star)
+    assert len(reports) == 1 and reports[0].startswith('The measurement at 9000.0 K (Seebeck coefficient 0.11 microV/K')
+
+
+def test_seebeck_coefficient_outside_of_the_inverse_is_not_extrapolated():
+    reports = []
+    model = SPB_Model(report=reports.append)
+    eta = model.get_eta('ADP', seebeck=asarray([0.1e-6, 180e-6, 5e-3]))
+    assert isnan(eta[0]) and isfinite(eta[1]) and isnan(eta[2])
+
+    eta, m_star = model.calculation_scattering_parameters(300., 0.1e-6, 2e25, 50e-4, 2.0, 'ADP')[:2]
+    assert isnan(eta) and isnan(m_star)
+    assert reports == ['The measurement at 300.0 K (Seebeck coefficient 0.1 microV/K) is outside of the range of the reduced chemical potential from -50 to 1000!']
+
+
+def test_carrier_concentrations_outside_of_the_inverse_are_not_extrapolated():
+    model = SPB_Model()
+    eta = model.get_eta('ADP', density=asarray([1e-30, 1.0, 1e6]))
+    assert isnan(eta[0]) and isfinite(eta[1]) and isnan(eta[2])
+
+    reports = []
+    model = SPB_Model(report=reports.append)
+    eta, m_star, mu_0, L, k_el, k_L, beta, zT = model.calculation_scattering_parameters(
+        300., 180e-6, 2e25, 50e-4, 2.0, 'ADP')
+    mu, S, L, zT = model.calculation_scattering_parameters_list(300., 2e19, eta, m_star, mu_0, beta, [1e-6, 1e19, 1e26], 'ADP')
+
+    assert isnan(S[0]) and isfinite(S[1]) and isnan(S[2])
+    assert reports == ['The Hall carrier concentrations [1.e-06 1.e+26] cm-3 are outside of the range of the reduced chemical potential from -50 to 1000!']
@@ -0,0 +1,32 @@
+import csv
+
+from MeasurementTable import read_measurements
+from ResultStore import Table_Writer
+from SPBCore import Computed_Parameters, Computed_Parameters_Carrier
+
+
+def test_consolidated_tables_quote_compound_names(tmp_path):
+    compound = 'Mg3Sb2, "doped"'
+    SPB_Parameters = Computed_Parameters(compound, 300.0, 180.0, 2E19, 50.0, 2.0, 200.0, 'IMP', 3.35, 0.33, 70.0,
+                                         1.6E-8, 0.1, 1.9, 0.2, 0.05)
+    SPB_List = Computed_Parameters_Carrier(compound, 300.0, 0.33, 70.0, 'IMP', [1E19, 2E19], [60.0, 50.0],
+                                           [220.0, 180.0], [1.6E-8, 1.7E-8], [0.04, 0.05])
+
+    file_name = str(tmp_path / 'compute_all')
+    with Table_Writer(file_name) as table:
+        table.write(SPB_Parameters, SPB_List)
+
+    with open(file_name + '.csv', newline='') as fil:
+        header, row = list(csv.reader(fil))
+    assert header == Computed_Parameters.table_header
+    assert row == [str(value) for value in SPB_Parameters.table_row()]
+
+    with open(file_name + '_list.csv', newline='') as fil:
+        header, *rows = list(csv.reader(fil))
+    assert header == Computed_Parameters_Carrier.table_header
+    assert [row[:3] for row in rows] == [[compound, '300.0', '1e+19'], [compound, '300.0', '2e+19']]
+
+    # the first columns have the layout of the measurement files
+    measurements = read_measurements(file_name + '.csv')
+    assert measurements.compound_names() == [compound]
+    assert measurements.value(0, 'Seebeck Coefficient') == 180.0